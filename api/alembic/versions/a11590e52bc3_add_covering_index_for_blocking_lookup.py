@@ -0,0 +1,41 @@
+"""add covering index for blocking task lookup
+
+Revision ID: a11590e52bc3
+Revises: ff17a2be5f97
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a11590e52bc3'
+down_revision = 'ff17a2be5f97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Replace idx_task_deps_depends_on with a composite (depends_on_task_id, task_id) index.
+
+    Blocking lookups (SELECT task_id FROM task_dependencies WHERE depends_on_task_id = ?)
+    run once per visited node during cycle checks. Including task_id in the index
+    lets PostgreSQL answer them with an index-only scan.
+    """
+    op.drop_index('idx_task_deps_depends_on', table_name='task_dependencies')
+    op.create_index(
+        'idx_task_deps_blocking',
+        'task_dependencies',
+        ['depends_on_task_id', 'task_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_task_deps_blocking', table_name='task_dependencies')
+    op.create_index(
+        'idx_task_deps_depends_on',
+        'task_dependencies',
+        ['depends_on_task_id']
+    )
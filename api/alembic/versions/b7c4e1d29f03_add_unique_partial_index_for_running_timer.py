@@ -0,0 +1,63 @@
+"""add unique partial index for running timer
+
+Revision ID: b7c4e1d29f03
+Revises: a11590e52bc3
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c4e1d29f03'
+down_revision = 'a11590e52bc3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add a unique partial index on (end_time IS NULL) for running timers.
+
+    get_running_timer (SELECT ... WHERE end_time IS NULL) is polled by the
+    timer status and dashboard endpoints; the partial index only contains
+    the running entries. Every row in it has the same key (true), so the
+    unique constraint also allows at most one running timer: when two
+    start_timer calls race, the second insert fails with a unique violation
+    and is retried.
+
+    Databases written by earlier versions may hold several running entries.
+    All but the most recently started one are closed first, ending where
+    the latest one starts (as start_timer would have stopped them). This
+    data step is not reverted by downgrade.
+    """
+    op.execute(
+        """
+        UPDATE time_entries AS t
+        SET end_time = GREATEST(latest.start_time, t.start_time),
+            duration_minutes = FLOOR(
+                EXTRACT(EPOCH FROM GREATEST(latest.start_time, t.start_time) - t.start_time) / 60
+            )::integer
+        FROM (
+            SELECT id, start_time
+            FROM time_entries
+            WHERE end_time IS NULL
+            ORDER BY start_time DESC, id DESC
+            LIMIT 1
+        ) AS latest
+        WHERE t.end_time IS NULL
+          AND t.id <> latest.id
+        """
+    )
+    op.create_index(
+        'idx_time_entries_running',
+        'time_entries',
+        [sa.text('(end_time IS NULL)')],
+        unique=True,
+        postgresql_where=sa.text('end_time IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_time_entries_running', table_name='time_entries')
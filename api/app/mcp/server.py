@@ -409,6 +409,7 @@ class MCPServer:
             task_id=task_id,
             depends_on_task_id=depends_on_task_id,
         )
+        await self.session.commit()
 
         # Get updated dependencies
         deps = await self.task_dependency_service.get_dependencies(
@@ -433,6 +434,7 @@ class MCPServer:
             task_id=task_id,
             depends_on_task_id=depends_on_task_id,
         )
+        await self.session.commit()
 
         # Get updated dependencies
         deps = await self.task_dependency_service.get_dependencies(
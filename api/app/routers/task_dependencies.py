@@ -58,6 +58,7 @@ async def add_task_dependency(
         task_id=id,
         depends_on_task_id=request.depends_on_task_id,
     )
+    await session.commit()
     return {"message": "Dependency added successfully"}
 
 
@@ -82,3 +83,4 @@ async def remove_task_dependency(
         task_id=id,
         depends_on_task_id=dep_id,
     )
+    await session.commit()
@@ -1,6 +1,6 @@
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlmodel import select, func, and_, or_
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -66,32 +66,53 @@ class DashboardService:
             )
         return TimerInfo(is_running=False)
 
-    async def _get_task_actual_hours(
-        self, session: AsyncSession, task_id: int
-    ) -> Decimal:
-        """Get actual hours for a task from time entries."""
-        query = select(func.sum(TimeEntry.duration_minutes)).where(
-            TimeEntry.task_id == task_id,
-            TimeEntry.duration_minutes.isnot(None),
+    async def _get_actual_hours_by_task(
+        self, session: AsyncSession, task_ids: List[int]
+    ) -> Dict[int, Decimal]:
+        """Get actual hours for several tasks from time entries (one grouped SUM).
+
+        Tasks without time entries are not included in the result.
+        """
+        if not task_ids:
+            return {}
+
+        query = (
+            select(
+                TimeEntry.task_id,
+                func.sum(TimeEntry.duration_minutes).label("minutes"),
+            )
+            .where(
+                TimeEntry.task_id.in_(task_ids),
+                TimeEntry.duration_minutes.isnot(None),
+            )
+            .group_by(TimeEntry.task_id)
         )
         result = await session.execute(query)
-        total_minutes = result.scalar_one() or 0
-        return Decimal(total_minutes) / 60
+        return {row.task_id: Decimal(row.minutes) / 60 for row in result.all()}
+
+    async def _get_blocking_task_names_by_task(
+        self, session: AsyncSession, task_ids: List[int]
+    ) -> Dict[int, List[str]]:
+        """Get names of unfinished blocking tasks for several tasks (one query).
+
+        Tasks that are not blocked are not included in the result.
+        """
+        if not task_ids:
+            return {}
 
-    async def _get_blocking_task_names(
-        self, session: AsyncSession, task_id: int
-    ) -> List[str]:
-        """Get names of tasks blocking this task."""
         query = (
-            select(Task.name)
-            .join(TaskDependency, TaskDependency.depends_on_task_id == Task.id)
+            select(TaskDependency.task_id, Task.name)
+            .join(Task, TaskDependency.depends_on_task_id == Task.id)
             .where(
-                TaskDependency.task_id == task_id,
+                TaskDependency.task_id.in_(task_ids),
                 Task.status.notin_(["done", "archive"]),
             )
         )
         result = await session.execute(query)
-        return [row[0] for row in result.all()]
+        names_by_task: Dict[int, List[str]] = {}
+        for row in result.all():
+            names_by_task.setdefault(row.task_id, []).append(row.name)
+        return names_by_task
 
     # ===== Kanban =====
 
@@ -119,14 +140,19 @@ class DashboardService:
         result = await session.execute(query)
         rows = result.all()
 
+        # Actual hours and blockers for all tasks in one query each
+        task_ids = [row[0].id for row in rows]
+        actual_hours_by_task = await self._get_actual_hours_by_task(session, task_ids)
+        blocked_by_task = await self._get_blocking_task_names_by_task(session, task_ids)
+
         # Group by status
         columns = KanbanColumns()
         counts = KanbanCounts()
 
         for row in rows:
             task = row[0]
-            actual_hours = await self._get_task_actual_hours(session, task.id)
-            blocked_by = await self._get_blocking_task_names(session, task.id)
+            actual_hours = actual_hours_by_task.get(task.id, Decimal(0))
+            blocked_by = blocked_by_task.get(task.id, [])
 
             item = KanbanTaskItem(
                 id=task.id,
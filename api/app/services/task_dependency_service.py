@@ -1,6 +1,8 @@
-from typing import List, Set
+from typing import Iterable, List, Set, Tuple
 
-from sqlmodel import select
+from sqlalchemy import exists, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import delete, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,7 +16,11 @@ from app.schemas.workflow_responses import TaskSummary
 
 
 class TaskDependencyService:
-    """タスク依存関係管理サービス"""
+    """タスク依存関係管理サービス
+
+    変更系メソッドはコミットしない。トランザクション境界は呼び出し側
+    （ルーター・ワークフローサービス）が管理し、一連の変更を1回のコミットにまとめる。
+    """
 
     async def get_dependencies(
         self, session: AsyncSession, task_id: int
@@ -37,29 +43,30 @@ class TaskDependencyService:
         # タスク存在確認
         task = await self._get_task_by_id(session, task_id)
 
-        # このタスクが依存するタスクID一覧を取得
-        depends_on_ids = await self._get_all_dependencies(session, task_id)
-
-        # このタスクがブロックするタスクID一覧を取得
-        blocking_ids = await self._get_all_blocking(session, task_id)
+        # 依存するタスクID一覧・ブロックするタスクID一覧を1クエリで取得
+        depends_on_ids, blocking_ids = await self._get_adjacent(session, task_id)
 
-        # TaskSummaryに変換
+        # TaskSummaryに変換（必要なカラムのみ取得）
         depends_on_tasks = []
         if depends_on_ids:
-            query = select(Task).where(Task.id.in_(depends_on_ids))
+            query = select(Task.id, Task.name, Task.status).where(
+                Task.id.in_(depends_on_ids)
+            )
             result = await session.execute(query)
             depends_on_tasks = [
-                TaskSummary(id=t.id, name=t.name, status=t.status)
-                for t in result.scalars().all()
+                TaskSummary(id=row.id, name=row.name, status=row.status)
+                for row in result.all()
             ]
 
         blocking_tasks = []
         if blocking_ids:
-            query = select(Task).where(Task.id.in_(blocking_ids))
+            query = select(Task.id, Task.name, Task.status).where(
+                Task.id.in_(blocking_ids)
+            )
             result = await session.execute(query)
             blocking_tasks = [
-                TaskSummary(id=t.id, name=t.name, status=t.status)
-                for t in result.scalars().all()
+                TaskSummary(id=row.id, name=row.name, status=row.status)
+                for row in result.all()
             ]
 
         return {
@@ -89,12 +96,19 @@ class TaskDependencyService:
         if task_id == depends_on_task_id:
             raise ValidationException("Task cannot depend on itself")
 
-        # 両タスクの存在確認
-        await self._get_task_by_id(session, task_id)
-        await self._get_task_by_id(session, depends_on_task_id)
-
-        # 循環依存チェック
-        await self.check_cycle(session, task_id, [depends_on_task_id])
+        # 両タスクの存在確認（1クエリ）
+        query = select(Task.id).where(Task.id.in_([task_id, depends_on_task_id]))
+        result = await session.execute(query)
+        found_ids = set(result.scalars().all())
+        for required_id in (task_id, depends_on_task_id):
+            if required_id not in found_ids:
+                raise NotFoundException(f"Task with id {required_id} not found")
+
+        # 循環依存チェック（再帰CTEで1クエリ）
+        if await self._is_reachable(session, depends_on_task_id, task_id):
+            raise DependencyCycleException(
+                f"Adding dependency would create a cycle: {task_id} -> {depends_on_task_id}"
+            )
 
         # 依存関係を追加
         dependency = TaskDependency(
@@ -102,7 +116,6 @@ class TaskDependencyService:
             depends_on_task_id=depends_on_task_id,
         )
         session.add(dependency)
-        await session.commit()
 
     async def remove_dependency(
         self,
@@ -120,57 +133,65 @@ class TaskDependencyService:
         Raises:
             NotFoundException: 依存関係が存在しない場合
         """
-        query = select(TaskDependency).where(
+        # 存在確認を兼ねて1文で削除
+        stmt = delete(TaskDependency).where(
             TaskDependency.task_id == task_id,
             TaskDependency.depends_on_task_id == depends_on_task_id,
         )
-        result = await session.execute(query)
-        dependency = result.scalar_one_or_none()
+        result = await session.execute(stmt)
 
-        if not dependency:
+        if result.rowcount == 0:
             raise NotFoundException(
                 f"Dependency from task {task_id} to {depends_on_task_id} not found"
             )
 
-        await session.delete(dependency)
-        await session.commit()
-
-    async def check_cycle(
+    async def bulk_add_dependencies(
         self,
         session: AsyncSession,
-        task_id: int,
-        new_depends_on_ids: List[int],
-    ) -> None:
-        """新しい依存関係追加時の循環チェック
+        edges: Iterable[Tuple[int, int]],
+    ) -> int:
+        """依存関係を一括追加（executemany / insertmanyvalues）
+
+        既に存在する依存関係は ON CONFLICT DO NOTHING で読み飛ばす。
+        循環チェックは呼び出し側で行うこと。
 
         Args:
             session: Database session
-            task_id: Task ID
-            new_depends_on_ids: 新たに依存させる予定のタスクID一覧
+            edges: (task_id, depends_on_task_id) の組（ジェネレータも可）
 
-        Raises:
-            DependencyCycleException: 循環が検出された場合
+        Returns:
+            実際に追加した依存関係の数
         """
-        # 各新規依存先からtask_idに到達可能かチェック
-        for depends_on_id in new_depends_on_ids:
-            visited: Set[int] = set()
-            recursion_stack: Set[int] = set()
-
-            if await self._dfs_check_cycle(
-                session, depends_on_id, task_id, visited, recursion_stack
-            ):
-                raise DependencyCycleException(
-                    f"Adding dependency would create a cycle: {task_id} -> {depends_on_id}"
-                )
-
-    async def transfer_dependencies(
+        # ジェネレータは常に真で一度しか読めないため、先にリスト化する
+        params = [
+            {"task_id": task_id, "depends_on_task_id": depends_on_task_id}
+            for task_id, depends_on_task_id in edges
+        ]
+        if not params:
+            return 0
+
+        # パラメータリストで実行し、件数によらず同じSQL（キャッシュ可能）を使う
+        stmt = (
+            pg_insert(TaskDependency)
+            .on_conflict_do_nothing(
+                index_elements=["task_id", "depends_on_task_id"]
+            )
+            .returning(TaskDependency.task_id)
+        )
+        result = await session.execute(stmt, params)
+        # RETURNINGは実際に挿入された行のみ返す
+        return len(result.all())
+
+    async def get_transfer_edges(
         self,
         session: AsyncSession,
         from_task_id: int,
         to_task_ids: List[int],
         mode: str,
-    ) -> int:
-        """依存関係を転送（breakdown時に使用）
+    ) -> Set[Tuple[int, int]]:
+        """転送する依存関係を算出（breakdown時に使用、書き込みは行わない）
+
+        呼び出し側で他の新規エッジとまとめて bulk_add_dependencies に渡す。
 
         Args:
             session: Database session
@@ -179,39 +200,32 @@ class TaskDependencyService:
             mode: "to_all" = 全タスクへ, "to_last" = 最後のタスクへ
 
         Returns:
-            転送した依存関係の数
+            追加すべき (task_id, depends_on_task_id) の集合
         """
-        count = 0
-
-        # 元タスクが依存していたタスク（A → from_task）を取得
-        incoming_deps = await self._get_all_dependencies(session, from_task_id)
-
+        # 元タスクが依存していたタスク（A → from_task）と
         # 元タスクがブロックしていたタスク（from_task → B）を取得
-        outgoing_deps = await self._get_all_blocking(session, from_task_id)
+        incoming_deps, outgoing_deps = await self._get_adjacent(
+            session, from_task_id
+        )
 
+        # (task_id, depends_on_task_id) の集合として重複を除去
         # Incoming依存を転送（全サブタスクへ）
-        for dep_id in incoming_deps:
-            for to_task_id in to_task_ids:
-                dependency = TaskDependency(
-                    task_id=to_task_id,
-                    depends_on_task_id=dep_id,
-                )
-                session.add(dependency)
-                count += 1
+        edges: Set[Tuple[int, int]] = {
+            (to_task_id, dep_id)
+            for dep_id in incoming_deps
+            for to_task_id in to_task_ids
+        }
 
         # Outgoing依存を転送（最後のサブタスクのみ or 全タスク）
-        target_tasks = [to_task_ids[-1]] if mode == "to_last" else to_task_ids
-
-        for dep_id in outgoing_deps:
-            for to_task_id in target_tasks:
-                dependency = TaskDependency(
-                    task_id=dep_id,  # ブロックされるタスク
-                    depends_on_task_id=to_task_id,  # 新しい依存先
-                )
-                session.add(dependency)
-                count += 1
+        # ブロックされるタスク → 新しい依存先
+        target_tasks = to_task_ids[-1:] if mode == "to_last" else to_task_ids
+        edges.update(
+            (dep_id, to_task_id)
+            for dep_id in outgoing_deps
+            for to_task_id in target_tasks
+        )
 
-        return count
+        return edges
 
     async def merge_dependencies(
         self,
@@ -234,11 +248,8 @@ class TaskDependencyService:
         all_blocking: Set[int] = set()
 
         for task_id in from_task_ids:
-            deps = await self._get_all_dependencies(session, task_id)
-            all_depends_on.update(deps)
-
-            blocks = await self._get_all_blocking(session, task_id)
-            all_blocking.update(blocks)
+            all_depends_on |= await self._get_all_dependencies(session, task_id)
+            all_blocking |= await self._get_all_blocking(session, task_id)
 
         # マージ元タスク自身への参照を除外
         all_depends_on.discard(to_task_id)
@@ -246,79 +257,59 @@ class TaskDependencyService:
         all_blocking.discard(to_task_id)
         all_blocking -= set(from_task_ids)
 
-        count = 0
-
-        # Incoming依存を追加（to_task が依存）
-        for dep_id in all_depends_on:
-            dependency = TaskDependency(
-                task_id=to_task_id,
-                depends_on_task_id=dep_id,
-            )
-            session.add(dependency)
-            count += 1
-
-        # Outgoing依存を追加（to_task がブロック）
-        for dep_id in all_blocking:
-            dependency = TaskDependency(
-                task_id=dep_id,
-                depends_on_task_id=to_task_id,
-            )
-            session.add(dependency)
-            count += 1
+        # Incoming依存（to_task が依存）と Outgoing依存（to_task がブロック）
+        edges: Set[Tuple[int, int]] = {
+            (to_task_id, dep_id) for dep_id in all_depends_on
+        }
+        edges.update((dep_id, to_task_id) for dep_id in all_blocking)
 
-        return count
+        # 既存の依存関係は ON CONFLICT DO NOTHING で読み飛ばす
+        return await self.bulk_add_dependencies(session, edges)
 
     # ===== Private Methods =====
 
-    async def _dfs_check_cycle(
+    async def _is_reachable(
         self,
         session: AsyncSession,
-        current: int,
+        start: int,
         target: int,
-        visited: Set[int],
-        recursion_stack: Set[int],
     ) -> bool:
-        """DFSによる循環検出（再帰版）
+        """startから依存関係をたどってtargetに到達できるかを再帰CTEで判定
+
+        DFSのようにノードごとにクエリを発行せず、探索全体をDB側で1クエリで行う。
+        UNION（重複排除）により既存グラフに循環があっても再帰は停止する。
 
         Args:
-            current: 現在のノード
-            target: 検索対象ノード（循環の起点）
-            visited: 訪問済みノード
-            recursion_stack: 再帰スタック（バックエッジ検出用）
+            session: Database session
+            start: 探索開始ノード
+            target: 検索対象ノード
 
         Returns:
-            循環が存在する場合True
+            到達可能な場合True
         """
-        if current == target:
-            return True  # 循環検出！
-
-        if current in visited:
-            return False  # 既に探索済み
-
-        visited.add(current)
-        recursion_stack.add(current)
-
-        # currentが依存する全タスクを取得
-        dependencies = await self._get_all_dependencies(session, current)
-
-        for dep_id in dependencies:
-            if dep_id in recursion_stack:
-                # バックエッジ検出（同じ経路で再訪問）
-                return True
+        if start == target:
+            return True
 
-            if await self._dfs_check_cycle(
-                session, dep_id, target, visited, recursion_stack
-            ):
-                return True
+        reach = (
+            select(TaskDependency.depends_on_task_id.label("task_id"))
+            .where(TaskDependency.task_id == start)
+            .cte("reach", recursive=True)
+        )
+        reach = reach.union(
+            select(TaskDependency.depends_on_task_id).join(
+                reach, TaskDependency.task_id == reach.c.task_id
+            )
+        )
 
-        recursion_stack.remove(current)
-        return False
+        query = select(exists().where(reach.c.task_id == target))
+        result = await session.execute(query)
+        return result.scalar_one()
 
     async def _get_all_dependencies(
         self,
         session: AsyncSession,
         task_id: int,
-    ) -> List[int]:
+    ) -> Set[int]:
         """タスクが依存する全タスクIDを取得
 
         Args:
@@ -326,19 +317,19 @@ class TaskDependencyService:
             task_id: Task ID
 
         Returns:
-            依存先タスクID一覧
+            依存先タスクIDの集合
         """
         query = select(TaskDependency.depends_on_task_id).where(
             TaskDependency.task_id == task_id
         )
         result = await session.execute(query)
-        return list(result.scalars().all())
+        return set(result.scalars().all())
 
     async def _get_all_blocking(
         self,
         session: AsyncSession,
         task_id: int,
-    ) -> List[int]:
+    ) -> Set[int]:
         """タスクがブロックする全タスクIDを取得
 
         Args:
@@ -346,13 +337,51 @@ class TaskDependencyService:
             task_id: Task ID
 
         Returns:
-            ブロック先タスクID一覧
+            ブロック先タスクIDの集合
+
+        Note:
+            idx_task_deps_blocking (depends_on_task_id, task_id) により
+            インデックスオンリースキャンで解決される
         """
         query = select(TaskDependency.task_id).where(
             TaskDependency.depends_on_task_id == task_id
         )
         result = await session.execute(query)
-        return list(result.scalars().all())
+        return set(result.scalars().all())
+
+    async def _get_adjacent(
+        self,
+        session: AsyncSession,
+        task_id: int,
+    ) -> Tuple[List[int], List[int]]:
+        """依存先・ブロック先タスクIDを1クエリで取得
+
+        Args:
+            session: Database session
+            task_id: Task ID
+
+        Returns:
+            (依存先タスクID一覧, ブロック先タスクID一覧)
+        """
+        query = select(
+            TaskDependency.task_id, TaskDependency.depends_on_task_id
+        ).where(
+            or_(
+                TaskDependency.task_id == task_id,
+                TaskDependency.depends_on_task_id == task_id,
+            )
+        )
+        result = await session.execute(query)
+
+        depends_on_ids: List[int] = []
+        blocking_ids: List[int] = []
+        for dep_task_id, depends_on_task_id in result.tuples():
+            if dep_task_id == task_id:
+                depends_on_ids.append(depends_on_task_id)
+            else:
+                blocking_ids.append(dep_task_id)
+
+        return depends_on_ids, blocking_ids
 
     async def _get_task_by_id(
         self,
@@ -1,12 +1,17 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlmodel import select, func
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
 
 from app.models import Task, TaskUpdate
 from app.services.base import BaseCRUDService
 
+# Whitelist of sortable columns (unknown sort keys are ignored)
+_SORTABLE: Dict[str, InstrumentedAttribute] = {
+    column.name: getattr(Task, column.name) for column in Task.__table__.columns
+}
+
 
 class TaskService(BaseCRUDService[Task, TaskUpdate]):
     """Extended task service with custom query methods."""
@@ -42,7 +47,8 @@ class TaskService(BaseCRUDService[Task, TaskUpdate]):
             Tuple of (items list, total count)
         """
         # Base query with relationships
-        query = select(Task).options(
+        # The total is computed in the same round-trip via a window function
+        query = select(Task, func.count().over().label("total")).options(
             selectinload(Task.project), selectinload(Task.genre)
         )
 
@@ -63,27 +69,32 @@ class TaskService(BaseCRUDService[Task, TaskUpdate]):
         if parent_task_id is not None:
             query = query.where(Task.parent_task_id == parent_task_id)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await session.execute(count_query)
-        total = total_result.scalar_one()
-
         # Apply sorting
         if sort:
             desc = sort.startswith("-")
-            field = sort.lstrip("-")
-            if hasattr(Task, field):
-                order_col = getattr(Task, field)
+            order_col = _SORTABLE.get(sort.lstrip("-"))
+            if order_col is not None:
                 query = query.order_by(order_col.desc() if desc else order_col)
         else:
             # Default sort: by status (doing > todo > waiting > done) and deadline
             query = query.order_by(Task.status, Task.deadline.asc())
 
         # Apply pagination
-        query = query.offset(skip).limit(limit)
-
-        result = await session.execute(query)
-        items = result.scalars().all()
+        paged_query = query.offset(skip).limit(limit)
+
+        result = await session.execute(paged_query)
+        rows = result.all()
+
+        if rows:
+            total = rows[0].total
+        elif skip > 0:
+            # Page past the end: the window total is not available, count separately
+            count_query = select(func.count()).select_from(query.subquery())
+            total_result = await session.execute(count_query)
+            total = total_result.scalar_one()
+        else:
+            total = 0
+        items = [row[0] for row in rows]
 
         return items, total
 
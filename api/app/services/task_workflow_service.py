@@ -1,11 +1,16 @@
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
-from sqlmodel import select, update
+from sqlalchemy import Row, cast, exists, literal, null, union_all
+from sqlmodel import func, insert, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Task, TimeEntry, Schedule
-from app.exceptions import NotFoundException, ValidationException
+from app.exceptions import (
+    DependencyCycleException,
+    NotFoundException,
+    ValidationException,
+)
 from app.schemas.workflow_requests import SubtaskInput, TaskInput
 from app.schemas.workflow_responses import (
     TaskBreakdownResponse,
@@ -16,10 +21,18 @@ from app.schemas.workflow_responses import (
 )
 from app.services.task_dependency_service import TaskDependencyService
 
+# bulk_create_tasks でCOPYに切り替えるタスク数の閾値
+# （これ未満は INSERT ... RETURNING の方が往復数の面で有利）
+COPY_THRESHOLD = 100
+
 
 class TaskWorkflowService:
     """タスクワークフロー操作サービス"""
 
+    # _fetch_parent_allocation_sources の行種別
+    _KIND_TIME_ENTRY = "time_entry"
+    _KIND_SCHEDULE = "schedule"
+
     def __init__(self):
         self.dep_service = TaskDependencyService()
 
@@ -38,7 +51,7 @@ class TaskWorkflowService:
         2. サブタスク作成（parent_task_id設定、decomposition_level+1）
         2.5. 時間配分（TimeEntry と Schedule を estimated_hours 比率で配分）
         3. 依存関係の引継ぎ
-        4. サブタスク間依存関係構築
+        4. サブタスク間依存関係構築（循環チェックは作成前にメモリ上で実施）
         5. 元タスクarchive（archive_original=trueの場合）
         6. トランザクションコミット
 
@@ -65,70 +78,56 @@ class TaskWorkflowService:
         if not subtasks:
             raise ValidationException("At least one subtask is required")
 
+        # サブタスク間依存関係の検証（書き込み前にメモリ上で実施）
+        # 新規サブタスク間で閉じているため、既存の依存関係を参照する必要はない
+        index_edges = self._collect_index_edges(subtasks)
+        self._validate_acyclic(len(subtasks), index_edges)
+
         # 2. サブタスク作成
         created = await self._create_subtasks(session, original, subtasks)
-        session.add_all(created)
-        await session.flush()  # IDを取得するためにflush
 
         created_ids = [task.id for task in created]
 
         # 2.5. 時間配分（TimeEntry と Schedule）
+        # 読み込みを先にまとめて行い（UNION ALLで1往復）、配分（書き込み）はその後に実施
+        parent_entries, parent_schedules = await self._fetch_parent_allocation_sources(
+            session, original.id
+        )
+
         proportions = self._calculate_allocation_proportions(subtasks)
         time_entries_count, time_minutes_allocated = await self._allocate_time_entries(
-            session, original.id, created, proportions
+            session, parent_entries, created, proportions
         )
         schedules_count, schedule_hours_allocated = await self._allocate_schedules(
-            session, original.id, created, proportions
+            session, parent_schedules, created, proportions
         )
 
-        # 3. 依存関係の引継ぎ
-        dependencies_transferred = 0
-        if original.id:
-            # 元タスクの依存関係を最後のサブタスクへ転送
-            dependencies_transferred = await self.dep_service.transfer_dependencies(
-                session,
-                from_task_id=original.id,
-                to_task_ids=created_ids,
-                mode="to_last",  # outgoing依存は最後のサブタスクへ
-            )
+        # 3. 依存関係の引継ぎ（元タスクの依存関係を最後のサブタスクへ転送）
+        edges = await self.dep_service.get_transfer_edges(
+            session,
+            from_task_id=original.id,
+            to_task_ids=created_ids,
+            mode="to_last",  # outgoing依存は最後のサブタスクへ
+        )
 
-        # 4. サブタスク間依存関係構築（depends_on_indicesに基づく）
-        for i, subtask_input in enumerate(subtasks):
-            if subtask_input.depends_on_indices:
-                for dep_index in subtask_input.depends_on_indices:
-                    # インデックスの範囲チェック
-                    if dep_index < 0 or dep_index >= len(created):
-                        raise ValidationException(
-                            f"Invalid depends_on_indices: {dep_index} is out of range"
-                        )
-
-                    # 循環チェック
-                    await self.dep_service.check_cycle(
-                        session,
-                        task_id=created_ids[i],
-                        new_depends_on_ids=[created_ids[dep_index]],
-                    )
+        # 4. サブタスク間依存関係構築（depends_on_indicesに基づく、検証済み）
+        edges.update((created_ids[i], created_ids[j]) for i, j in index_edges)
 
-                    # 依存関係追加
-                    await self.dep_service.add_dependency(
-                        session,
-                        task_id=created_ids[i],
-                        depends_on_task_id=created_ids[dep_index],
-                    )
-                    dependencies_transferred += 1
+        # 3と4をまとめて1回で挿入
+        dependencies_transferred = await self.dep_service.bulk_add_dependencies(
+            session, edges
+        )
 
         # 5. 元タスクアーカイブ
         if archive_original:
+            # 取得済み（管理下）のインスタンスなので属性変更のみでUPDATEされる
             original.status = "archive"
-            session.add(original)
 
         # 6. コミット
         await session.commit()
 
-        # リフレッシュ
-        for task in created:
-            await session.refresh(task)
-        await session.refresh(original)
+        # 元タスク・サブタスクとも必要な値はメモリ上で確定しており、
+        # expire_on_commit=Falseのため再取得不要
 
         return TaskBreakdownResponse(
             original_task=TaskSummary(
@@ -162,7 +161,7 @@ class TaskWorkflowService:
         1. マージ元タスク検証（2つ以上、全て存在、同一project_id）
         2. 新規タスク作成（merged_taskの仕様）
         3. TimeEntry転送
-        4. Schedule転送
+        4. Schedule転送（3と同一文）
         5. 依存関係統合
         6. マージ元タスクarchive
         7. トランザクションコミット
@@ -178,61 +177,64 @@ class TaskWorkflowService:
 
         Raises:
             NotFoundException: タスクが存在しない
-            ValidationException: タスクが2つ未満、またはproject_id不一致
+            ValidationException: タスクが2つ未満、ID重複、またはproject_id不一致
         """
         # 1. マージ元タスク検証
         if len(task_ids) < 2:
             raise ValidationException("At least 2 tasks are required for merging")
 
-        # タスク存在確認
-        tasks = []
-        for task_id in task_ids:
-            task = await self._validate_task_exists(session, task_id)
-            tasks.append(task)
+        # 重複チェック（SQL発行前）
+        if len(set(task_ids)) != len(task_ids):
+            raise ValidationException("Duplicate task_ids are not allowed")
+
+        # タスク存在確認（1クエリ）
+        tasks = await self._validate_tasks_exist(session, task_ids)
 
-        # 同一プロジェクト確認
-        await self._validate_same_project(tasks)
+        # 同一プロジェクト確認（取得済みの行から判定、出現順を維持）
+        project_ids = list(dict.fromkeys(row.project_id for row in tasks))
+        if len(project_ids) > 1:
+            raise ValidationException(
+                f"All tasks must belong to the same project. "
+                f"Found project_id {project_ids[0]} and {project_ids[1]}"
+            )
 
         # 2. 新規タスク作成
-        project_id = tasks[0].project_id  # すべて同じproject_id
-        new_task = Task(
-            name=merged_task.name,
-            project_id=project_id,
-            genre_id=merged_task.genre_id,
-            estimated_hours=merged_task.estimated_hours,
-            priority=merged_task.priority,
-            want_level=merged_task.want_level,
-            deadline=merged_task.deadline,
-            status="todo",
+        project_id = project_ids[0]  # すべて同じproject_id
+        # RETURNINGで全列を取得（コミット後のrefresh不要）
+        result = await session.execute(
+            insert(Task)
+            .values(
+                name=merged_task.name,
+                project_id=project_id,
+                genre_id=merged_task.genre_id,
+                estimated_hours=merged_task.estimated_hours,
+                priority=merged_task.priority,
+                want_level=merged_task.want_level,
+                deadline=merged_task.deadline,
+                status="todo",
+            )
+            .returning(Task)
         )
+        new_task = result.scalar_one()
 
-        session.add(new_task)
-        await session.flush()  # IDを取得
-
-        # 3. TimeEntry転送
-        time_entries_transferred = await self._transfer_time_entries(
+        # 3-4. TimeEntry・Schedule転送（1文）
+        time_entries_transferred, _ = await self._transfer_related(
             session, task_ids, new_task.id
         )
 
-        # 4. Schedule転送
-        await self._transfer_schedules(session, task_ids, new_task.id)
-
         # 5. 依存関係統合
         dependencies_count = await self.dep_service.merge_dependencies(
             session, task_ids, new_task.id
         )
 
-        # 6. マージ元タスクarchive
-        for task in tasks:
-            task.status = "archive"
-            session.add(task)
+        # 6. マージ元タスクarchive（1文で一括更新）
+        await session.execute(
+            update(Task).where(Task.id.in_(task_ids)).values(status="archive")
+        )
 
         # 7. コミット
         await session.commit()
 
-        # リフレッシュ
-        await session.refresh(new_task)
-
         return TaskMergeResponse(
             merged_task=TaskSummary(
                 id=new_task.id,
@@ -253,9 +255,9 @@ class TaskWorkflowService:
         """依存関係付き一括作成
 
         処理フロー:
-        1. タスク一括作成（project_id共通設定）
-        2. depends_on_indicesをタスクIDに変換
-        3. 各依存関係に対して循環チェック
+        1. depends_on_indices検証（範囲・自己参照）
+        2. 循環チェック（新規タスク間で閉じているためメモリ上でトポロジカルソート）
+        3. タスク一括作成（project_id共通設定）
         4. 依存関係一括挿入
         5. トランザクションコミット
 
@@ -274,68 +276,50 @@ class TaskWorkflowService:
         if not tasks:
             raise ValidationException("At least one task is required")
 
-        # 1. タスク一括作成
-        created_tasks = []
-        for task_input in tasks:
-            new_task = Task(
-                name=task_input.name,
-                project_id=project_id,
-                genre_id=task_input.genre_id,
-                estimated_hours=task_input.estimated_hours,
-                priority=task_input.priority,
-                want_level=task_input.want_level,
-                deadline=task_input.deadline,
-                status="todo",
+        # 1. depends_on_indices検証（インデックス間の依存関係を収集）
+        index_edges = self._collect_index_edges(tasks)
+
+        # 2. 循環チェック（DBアクセスなし）
+        self._validate_acyclic(len(tasks), index_edges)
+
+        # 3. タスク一括作成
+        rows = [
+            {
+                "name": task_input.name,
+                "project_id": project_id,
+                "genre_id": task_input.genre_id,
+                "estimated_hours": task_input.estimated_hours,
+                "priority": task_input.priority,
+                "want_level": task_input.want_level,
+                "deadline": task_input.deadline,
+                "status": "todo",
+            }
+            for task_input in tasks
+        ]
+        if len(rows) >= COPY_THRESHOLD:
+            # 大量の場合はCOPYで投入
+            created_ids = await self._bulk_copy_tasks(session, rows)
+        else:
+            # RETURNINGでIDを取得（入力順）
+            result = await session.execute(
+                insert(Task).returning(Task.id, sort_by_parameter_order=True),
+                rows,
             )
-            session.add(new_task)
-            created_tasks.append(new_task)
-
-        await session.flush()  # IDを取得
-
-        created_ids = [task.id for task in created_tasks]
-
-        # 2-3. depends_on_indicesをタスクIDに変換して依存関係追加
-        dependencies_created = 0
-
-        for i, task_input in enumerate(tasks):
-            if task_input.depends_on_indices:
-                for dep_index in task_input.depends_on_indices:
-                    # インデックスの範囲チェック
-                    if dep_index < 0 or dep_index >= len(created_tasks):
-                        raise ValidationException(
-                            f"Invalid depends_on_indices: {dep_index} is out of range"
-                        )
-
-                    # 自己参照チェック
-                    if dep_index == i:
-                        raise ValidationException("Task cannot depend on itself")
-
-                    # 循環チェック
-                    await self.dep_service.check_cycle(
-                        session,
-                        task_id=created_ids[i],
-                        new_depends_on_ids=[created_ids[dep_index]],
-                    )
+            created_ids = list(result.scalars().all())
 
-                    # 依存関係追加
-                    await self.dep_service.add_dependency(
-                        session,
-                        task_id=created_ids[i],
-                        depends_on_task_id=created_ids[dep_index],
-                    )
-                    dependencies_created += 1
+        # 4. 依存関係一括挿入
+        dependencies_created = await self.dep_service.bulk_add_dependencies(
+            session,
+            [(created_ids[i], created_ids[j]) for i, j in index_edges],
+        )
 
         # 5. コミット
         await session.commit()
 
-        # リフレッシュ
-        for task in created_tasks:
-            await session.refresh(task)
-
         return BulkCreateResponse(
             created_tasks=[
-                TaskSummary(id=t.id, name=t.name, status=t.status)
-                for t in created_tasks
+                TaskSummary(id=task_id, name=row["name"], status=row["status"])
+                for task_id, row in zip(created_ids, rows)
             ],
             dependencies_created=dependencies_created,
         )
@@ -368,6 +352,35 @@ class TaskWorkflowService:
 
         return task
 
+    async def _validate_tasks_exist(
+        self,
+        session: AsyncSession,
+        task_ids: List[int],
+    ) -> List[Row]:
+        """複数タスクの存在確認（IN句による1クエリ）
+
+        ORMオブジェクトは生成せず、検証に必要な列（id, project_id）のみ取得する。
+
+        Args:
+            session: Database session
+            task_ids: Task ID list
+
+        Returns:
+            (id, project_id) の行（task_idsと同じ順序）
+
+        Raises:
+            NotFoundException: いずれかのタスクが存在しない
+        """
+        query = select(Task.id, Task.project_id).where(Task.id.in_(task_ids))
+        result = await session.execute(query)
+        found = {row.id: row for row in result.all()}
+
+        missing = [task_id for task_id in task_ids if task_id not in found]
+        if missing:
+            raise NotFoundException(f"Tasks not found: {missing}")
+
+        return [found[task_id] for task_id in task_ids]
+
     async def _validate_task_not_archived(self, task: Task) -> None:
         """タスクがアーカイブされていないことを確認
 
@@ -396,39 +409,141 @@ class TaskWorkflowService:
         Raises:
             ValidationException: If task has children
         """
-        from sqlmodel import func
-
-        # Count child tasks
-        query = select(func.count(Task.id)).where(Task.parent_task_id == task.id)
+        # Check existence of child tasks (stops at the first match)
+        query = select(exists().where(Task.parent_task_id == task.id))
         result = await session.execute(query)
-        child_count = result.scalar_one()
 
-        if child_count > 0:
+        if result.scalar_one():
+            # Count only in the error path for the message
+            query = select(func.count(Task.id)).where(Task.parent_task_id == task.id)
+            result = await session.execute(query)
+            child_count = result.scalar_one()
             raise ValidationException(
                 f"Task {task.id} has {child_count} child task(s) and cannot be broken down. "
                 f"Only leaf tasks (tasks without children) can be broken down."
             )
 
-    async def _validate_same_project(self, tasks: List[Task]) -> None:
-        """全タスクが同一プロジェクトに属することを確認
+    async def _bulk_copy_tasks(
+        self,
+        session: AsyncSession,
+        rows: List[dict],
+    ) -> List[int]:
+        """Insert tasks with PostgreSQL COPY and return their ids in input order.
+
+        COPY cannot return generated keys, so ids are reserved from the
+        tasks id sequence first and written explicitly. Column defaults
+        normally applied by SQLAlchemy are filled in here because COPY
+        bypasses them.
+
+        Args:
+            session: Database session
+            rows: Column values for each task
+
+        Returns:
+            Ids of the inserted tasks, in the same order as rows
+        """
+        # Reserve ids from the sequence in one round-trip
+        result = await session.execute(
+            select(func.nextval(func.pg_get_serial_sequence(Task.__tablename__, "id")))
+            .select_from(func.generate_series(1, len(rows)))
+        )
+        ids = list(result.scalars().all())
+
+        columns = [column.name for column in Task.__table__.columns]
+        defaults = {
+            column.name: (
+                column.default.arg(None)
+                if column.default.is_callable
+                else column.default.arg
+            )
+            for column in Task.__table__.columns
+            if column.default is not None
+        }
+        records = [
+            tuple({**defaults, **row, "id": task_id}.get(name) for name in columns)
+            for task_id, row in zip(ids, rows)
+        ]
+
+        # COPY on the session's own connection (same transaction)
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Task.__tablename__, records=records, columns=columns
+        )
+
+        return ids
+
+    def _collect_index_edges(
+        self,
+        items: Sequence[Union[SubtaskInput, TaskInput]],
+    ) -> List[Tuple[int, int]]:
+        """Collect dependency edges between items from depends_on_indices.
 
         Args:
-            tasks: Task objects
+            items: Subtask or task inputs with depends_on_indices
+
+        Returns:
+            Deduplicated (item index, depends-on item index) pairs, in input order
 
         Raises:
-            ValidationException: project_idが異なる
+            ValidationException: If an index is out of range or self-referencing
         """
-        if not tasks:
-            return
+        edges: List[Tuple[int, int]] = []
+        n = len(items)
+        for i, item in enumerate(items):
+            for dep_index in item.depends_on_indices:
+                # インデックスの範囲チェック
+                if not 0 <= dep_index < n:
+                    raise ValidationException(
+                        f"Invalid depends_on_indices: {dep_index} is out of range"
+                    )
+
+                # 自己参照チェック
+                if dep_index == i:
+                    raise ValidationException("Task cannot depend on itself")
+
+                edges.append((i, dep_index))
+
+        # 重複を除去（順序は維持）
+        return list(dict.fromkeys(edges))
+
+    def _validate_acyclic(
+        self,
+        n: int,
+        edges: List[Tuple[int, int]],
+    ) -> None:
+        """Validate that edges over task indices 0..n-1 form no cycle.
+
+        Uses Kahn's algorithm: if not every node can be ordered, the
+        remaining nodes are part of a cycle.
 
-        first_project_id = tasks[0].project_id
+        Args:
+            n: Number of tasks
+            edges: (task index, depends-on task index) pairs
 
-        for task in tasks[1:]:
-            if task.project_id != first_project_id:
-                raise ValidationException(
-                    f"All tasks must belong to the same project. "
-                    f"Found project_id {first_project_id} and {task.project_id}"
-                )
+        Raises:
+            DependencyCycleException: If the edges contain a cycle
+        """
+        dependents: List[List[int]] = [[] for _ in range(n)]
+        in_degree = [0] * n
+        for task_index, dep_index in edges:
+            dependents[dep_index].append(task_index)
+            in_degree[task_index] += 1
+
+        ready = [i for i in range(n) if in_degree[i] == 0]
+        ordered = 0
+        while ready:
+            current = ready.pop()
+            ordered += 1
+            for dependent in dependents[current]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if ordered != n:
+            raise DependencyCycleException(
+                "Dependency cycle detected among the given tasks"
+            )
 
     async def _create_subtasks(
         self,
@@ -449,23 +564,32 @@ class TaskWorkflowService:
             subtasks: サブタスク情報リスト
 
         Returns:
-            作成されたサブタスクリスト
+            作成されたサブタスクリスト（flush済み、IDあり）
         """
-        created = []
-
-        for subtask_input in subtasks:
-            new_task = Task(
+        # 親から継承する項目はループ外で1回だけ組み立てる
+        # decomposition_level is auto-computed by DB trigger - no need to set manually
+        base = {
+            "project_id": parent_task.project_id,
+            "parent_task_id": parent_task.id,
+            "status": "todo",
+        }
+        parent_genre_id = parent_task.genre_id
+        parent_deadline = parent_task.deadline
+        created = [
+            Task(
+                **base,
                 name=subtask_input.name,
-                project_id=parent_task.project_id,
-                genre_id=subtask_input.genre_id or parent_task.genre_id,
+                genre_id=subtask_input.genre_id or parent_genre_id,
                 estimated_hours=subtask_input.estimated_hours,
                 priority=subtask_input.priority,
-                deadline=subtask_input.deadline or parent_task.deadline,
-                parent_task_id=parent_task.id,
-                # decomposition_level is auto-computed by DB trigger - no need to set manually
-                status="todo",
+                deadline=subtask_input.deadline or parent_deadline,
             )
-            created.append(new_task)
+            for subtask_input in subtasks
+        ]
+
+        # まとめて追加し1回のflushで挿入（insertmanyvaluesでバッチ化される）
+        session.add_all(created)
+        await session.flush()  # IDを取得するためにflush
 
         return created
 
@@ -486,46 +610,38 @@ class TaskWorkflowService:
         Raises:
             ValidationException: If negative values provided
         """
-        # Validate: no negative values
+        # Single pass: validate, classify manual/auto and collect raw values
+        raw_values: List[Decimal] = []
+        auto_indices: List[int] = []
+        manual_total = Decimal(0)
+
         for i, subtask in enumerate(subtasks):
-            if subtask.allocated_hours and subtask.allocated_hours < 0:
+            allocated = subtask.allocated_hours
+            estimated = subtask.estimated_hours
+
+            # Validate: no negative values
+            if allocated and allocated < 0:
                 raise ValidationException(f"Subtask {i} has negative allocated_hours")
-            if subtask.estimated_hours and subtask.estimated_hours < 0:
+            if estimated and estimated < 0:
                 raise ValidationException(f"Subtask {i} has negative estimated_hours")
 
-        # Collect manual vs auto allocations
-        manual_indices = []
-        auto_indices = []
-
-        for i, subtask in enumerate(subtasks):
-            if subtask.allocated_hours is not None:
-                manual_indices.append(i)
+            if allocated is not None:
+                # Manual override
+                raw_values.append(allocated)
+                manual_total += allocated
             else:
+                # Auto allocation from estimated_hours
+                raw_values.append(estimated or Decimal(0))
                 auto_indices.append(i)
 
-        # Calculate total for normalization
-        total = Decimal(0)
-        raw_values = [Decimal(0)] * len(subtasks)
-
-        # Add manual allocations
-        for i in manual_indices:
-            raw_values[i] = subtasks[i].allocated_hours
-            total += subtasks[i].allocated_hours
+        # Equal distribution for auto tasks when none of them has an estimate
+        if auto_indices and not any(raw_values[i] for i in auto_indices):
+            equal_value = Decimal(1) / len(auto_indices)
+            for i in auto_indices:
+                raw_values[i] = equal_value
 
-        # Add auto allocations from estimated_hours
-        if auto_indices:
-            auto_total = sum(subtasks[i].estimated_hours or Decimal(0) for i in auto_indices)
-
-            if auto_total > 0:
-                for i in auto_indices:
-                    raw_values[i] = subtasks[i].estimated_hours or Decimal(0)
-                    total += raw_values[i]
-            else:
-                # Equal distribution for tasks without estimates
-                equal_value = Decimal(1) / len(auto_indices)
-                for i in auto_indices:
-                    raw_values[i] = equal_value
-                    total += equal_value
+        # Calculate total for normalization (manual first, then auto)
+        total = sum((raw_values[i] for i in auto_indices), manual_total)
 
         # Normalize to proportions (sum = 1.0)
         if total == 0:
@@ -534,13 +650,16 @@ class TaskWorkflowService:
 
         return [value / total for value in raw_values]
 
-    async def _transfer_time_entries(
+    async def _transfer_related(
         self,
         session: AsyncSession,
         from_task_ids: List[int],
         to_task_id: int,
-    ) -> int:
-        """TimeEntryを転送
+    ) -> Tuple[int, int]:
+        """TimeEntryとScheduleを1文で転送
+
+        データ変更CTE（UPDATE ... RETURNING）を2つ並べ、
+        それぞれの件数を1往復で取得する。
 
         Args:
             session: Database session
@@ -548,46 +667,84 @@ class TaskWorkflowService:
             to_task_id: 転送先タスクID
 
         Returns:
-            転送したエントリ数
+            (転送したエントリ数, 転送したスケジュール数)
         """
-        # TimeEntryのtask_idを一括更新
-        stmt = (
+        moved_time_entries = (
             update(TimeEntry)
             .where(TimeEntry.task_id.in_(from_task_ids))
             .values(task_id=to_task_id)
+            .returning(TimeEntry.id)
+            .cte("moved_time_entries")
+        )
+        moved_schedules = (
+            update(Schedule)
+            .where(Schedule.task_id.in_(from_task_ids))
+            .values(task_id=to_task_id)
+            .returning(Schedule.id)
+            .cte("moved_schedules")
+        )
+
+        # rowcountはドライバ依存のため、RETURNINGした行数で数える
+        stmt = select(
+            select(func.count()).select_from(moved_time_entries).scalar_subquery(),
+            select(func.count()).select_from(moved_schedules).scalar_subquery(),
         )
         result = await session.execute(stmt)
-        return result.rowcount
+        time_entries_count, schedules_count = result.one()
+        return (time_entries_count, schedules_count)
 
-    async def _transfer_schedules(
+    async def _fetch_parent_allocation_sources(
         self,
         session: AsyncSession,
-        from_task_ids: List[int],
-        to_task_id: int,
-    ) -> int:
-        """Scheduleを転送
+        parent_task_id: int,
+    ) -> Tuple[List[Row], List[Row]]:
+        """Fetch the parent's completed TimeEntry and Schedule rows in one query.
 
-        Args:
-            session: Database session
-            from_task_ids: 転送元タスクIDリスト
-            to_task_id: 転送先タスクID
+        Both tables are read with a single UNION ALL; a ``kind`` column tells
+        the rows apart and columns that only exist on one side are NULL on
+        the other.
 
         Returns:
-            転送したスケジュール数
+            Tuple of (completed time entry rows, schedule rows)
         """
-        # Scheduleのtask_idを一括更新
-        stmt = (
-            update(Schedule)
-            .where(Schedule.task_id.in_(from_task_ids))
-            .values(task_id=to_task_id)
+        time_entries = select(
+            literal(self._KIND_TIME_ENTRY).label("kind"),
+            TimeEntry.start_time,
+            TimeEntry.end_time,
+            TimeEntry.duration_minutes,
+            cast(null(), Schedule.scheduled_date.type).label("scheduled_date"),
+            cast(null(), Schedule.allocated_hours.type).label("allocated_hours"),
+            cast(null(), Schedule.is_generated_by_ai.type).label("is_generated_by_ai"),
+        ).where(
+            TimeEntry.task_id == parent_task_id,
+            TimeEntry.end_time.isnot(None),  # Ignore running timers
         )
-        result = await session.execute(stmt)
-        return result.rowcount
+        schedules = select(
+            literal(self._KIND_SCHEDULE).label("kind"),
+            Schedule.start_time,
+            Schedule.end_time,
+            cast(null(), TimeEntry.duration_minutes.type).label("duration_minutes"),
+            Schedule.scheduled_date,
+            Schedule.allocated_hours,
+            Schedule.is_generated_by_ai,
+        ).where(Schedule.task_id == parent_task_id)
+
+        result = await session.execute(union_all(time_entries, schedules))
+
+        parent_entries: List[Row] = []
+        parent_schedules: List[Row] = []
+        for row in result.all():
+            if row.kind == self._KIND_TIME_ENTRY:
+                parent_entries.append(row)
+            else:
+                parent_schedules.append(row)
+
+        return (parent_entries, parent_schedules)
 
     async def _allocate_time_entries(
         self,
         session: AsyncSession,
-        parent_task_id: int,
+        parent_entries: List[Row],
         created_subtasks: List[Task],
         proportions: List[Decimal],
     ) -> tuple[int, int]:
@@ -597,7 +754,7 @@ class TaskWorkflowService:
         TimeEntry records are allocated to all subtasks proportionally.
 
         Strategy:
-        - Fetch all completed TimeEntry records (end_time IS NOT NULL)
+        - Take the parent's completed TimeEntry rows (see _fetch_parent_allocation_sources)
         - Calculate total duration_minutes
         - For each subtask, create ONE aggregated TimeEntry with proportional duration
         - Use parent's earliest start_time and latest end_time as boundaries
@@ -605,53 +762,55 @@ class TaskWorkflowService:
         Returns:
             Tuple of (entries_created, total_minutes_allocated)
         """
-        # Fetch parent's completed time entries only
-        query = select(TimeEntry).where(
-            TimeEntry.task_id == parent_task_id,
-            TimeEntry.end_time.isnot(None),  # Ignore running timers
-        )
-        result = await session.execute(query)
-        parent_entries = result.scalars().all()
-
         if not parent_entries:
             return (0, 0)
 
-        # Calculate total duration
-        total_minutes = sum(entry.duration_minutes or 0 for entry in parent_entries)
+        # Calculate total duration and time boundaries in a single pass
+        total_minutes = 0
+        earliest_start = None
+        latest_end = None
+
+        for entry in parent_entries:
+            total_minutes += entry.duration_minutes or 0
+
+            start_time = entry.start_time
+            if earliest_start is None or start_time < earliest_start:
+                earliest_start = start_time
+
+            end_time = entry.end_time
+            if end_time and (latest_end is None or end_time > latest_end):
+                latest_end = end_time
 
         if total_minutes == 0:
             return (0, 0)
 
-        # Find time boundaries
-        earliest_start = min(entry.start_time for entry in parent_entries)
-        latest_end = max(entry.end_time for entry in parent_entries if entry.end_time)
-
         # Create proportional entries for each subtask
-        created_count = 0
+        new_rows: List[dict] = []
         total_allocated = 0
 
         for subtask, proportion in zip(created_subtasks, proportions):
             allocated_minutes = int(total_minutes * proportion)
 
             if allocated_minutes > 0:
-                new_entry = TimeEntry(
-                    task_id=subtask.id,
-                    start_time=earliest_start,
-                    end_time=latest_end,
-                    duration_minutes=allocated_minutes,
-                    note=f"Allocated from parent task breakdown ({proportion * 100:.1f}%)",
-                )
-                session.add(new_entry)
-                created_count += 1
+                new_rows.append({
+                    "task_id": subtask.id,
+                    "start_time": earliest_start,
+                    "end_time": latest_end,
+                    "duration_minutes": allocated_minutes,
+                    "note": f"Allocated from parent task breakdown ({proportion * 100:.1f}%)",
+                })
                 total_allocated += allocated_minutes
 
-        await session.flush()
-        return (created_count, total_allocated)
+        # Insert all allocated entries in one statement (no ORM identity needed)
+        if new_rows:
+            await session.execute(insert(TimeEntry), new_rows)
+
+        return (len(new_rows), total_allocated)
 
     async def _allocate_schedules(
         self,
         session: AsyncSession,
-        parent_task_id: int,
+        parent_schedules: List[Row],
         created_subtasks: List[Task],
         proportions: List[Decimal],
     ) -> tuple[int, Decimal]:
@@ -667,38 +826,39 @@ class TaskWorkflowService:
         Returns:
             Tuple of (schedules_created, total_hours_allocated)
         """
-        # Fetch all parent schedules
-        query = select(Schedule).where(Schedule.task_id == parent_task_id)
-        result = await session.execute(query)
-        parent_schedules = result.scalars().all()
-
         if not parent_schedules:
             return (0, Decimal(0))
 
-        created_count = 0
-        total_allocated = Decimal(0)
+        new_rows: List[dict] = []
+        total_allocated = 0.0
+
+        # Compute in float; convert to Decimal only for persisted values
+        float_proportions = [float(proportion) for proportion in proportions]
 
         # For each parent schedule, create proportional schedules for all subtasks
         for parent_sched in parent_schedules:
-            for subtask, proportion in zip(created_subtasks, proportions):
-                allocated_hours = parent_sched.allocated_hours * proportion
+            parent_hours = float(parent_sched.allocated_hours)
+
+            for subtask, proportion in zip(created_subtasks, float_proportions):
+                allocated_hours = parent_hours * proportion
 
                 # Skip if allocation too small (< 0.01 hours = 36 seconds)
-                if allocated_hours < Decimal("0.01"):
+                if allocated_hours < 0.01:
                     continue
 
-                new_schedule = Schedule(
-                    task_id=subtask.id,
-                    scheduled_date=parent_sched.scheduled_date,
-                    start_time=parent_sched.start_time,
-                    end_time=parent_sched.end_time,
-                    allocated_hours=allocated_hours,
-                    is_generated_by_ai=parent_sched.is_generated_by_ai,
-                    status="scheduled",  # Reset to scheduled (don't inherit completed)
-                )
-                session.add(new_schedule)
-                created_count += 1
+                new_rows.append({
+                    "task_id": subtask.id,
+                    "scheduled_date": parent_sched.scheduled_date,
+                    "start_time": parent_sched.start_time,
+                    "end_time": parent_sched.end_time,
+                    "allocated_hours": Decimal(f"{allocated_hours:.4f}"),
+                    "is_generated_by_ai": parent_sched.is_generated_by_ai,
+                    "status": "scheduled",  # Reset to scheduled (don't inherit completed)
+                })
                 total_allocated += allocated_hours
 
-        await session.flush()
-        return (created_count, total_allocated)
+        # Insert all allocated schedules in one statement (no ORM identity needed)
+        if new_rows:
+            await session.execute(insert(Schedule), new_rows)
+
+        return (len(new_rows), Decimal(f"{total_allocated:.4f}"))
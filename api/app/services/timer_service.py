@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -11,21 +13,32 @@ from app.exceptions import TimerNotRunningException, ValidationException, NotFou
 class TimerService:
     """Service for timer operations."""
 
+    # Attempts for start_timer when a concurrent start wins the race on
+    # the unique running-timer index
+    START_TIMER_ATTEMPTS = 3
+    # Unique partial index allowing at most one running timer
+    RUNNING_TIMER_INDEX = "idx_time_entries_running"
+
     async def get_running_timer(
-        self, session: AsyncSession, for_update: bool = False
+        self,
+        session: AsyncSession,
+        for_update: bool = False,
+        skip_locked: bool = False,
     ) -> Optional[TimeEntry]:
         """Get the currently running timer (end_time=NULL).
 
         Args:
             session: Database session
             for_update: If True, acquire row-level lock (SELECT FOR UPDATE)
+            skip_locked: If True (with for_update), skip a row locked by another
+                transaction instead of waiting for it
 
         Returns:
             TimeEntry if a timer is running, None otherwise
         """
         query = select(TimeEntry).where(TimeEntry.end_time.is_(None))
         if for_update:
-            query = query.with_for_update()
+            query = query.with_for_update(skip_locked=skip_locked)
         result = await session.execute(query)
         return result.scalar_one_or_none()
 
@@ -57,11 +70,49 @@ class TimerService:
         else:
             raise ValidationException("Either task_id or task_name required")
 
-        # Stop running timer if exists (with lock to prevent race condition)
+        resolved_task_id = task.id
+        for attempt in range(self.START_TIMER_ATTEMPTS):
+            try:
+                return await self._start_timer_once(session, task)
+            except IntegrityError as e:
+                await session.rollback()
+                # Only a concurrent start winning the unique running-timer
+                # index is retried (this call then stops that timer and starts
+                # its own); other integrity errors are raised as they are
+                if (
+                    not self._is_running_timer_conflict(e)
+                    or attempt == self.START_TIMER_ATTEMPTS - 1
+                ):
+                    raise
+                task = await self._get_task_by_id(session, resolved_task_id)
+
+    @classmethod
+    def _is_running_timer_conflict(cls, error: IntegrityError) -> bool:
+        """Check whether error is a unique violation on idx_time_entries_running."""
+        orig = error.orig
+        if getattr(orig, "sqlstate", None) != "23505":
+            return False
+        # asyncpg's exception (chained by the DBAPI adapter) names the index
+        driver_error = getattr(orig, "__cause__", None)
+        return getattr(driver_error, "constraint_name", None) == cls.RUNNING_TIMER_INDEX
+
+    async def _start_timer_once(
+        self, session: AsyncSession, task: Task
+    ) -> tuple[TimeEntry, Optional[TimeEntry]]:
+        """Stop the running timer (if any) and start one for task in a single commit.
+
+        A running timer locked by a concurrent start is skipped rather than
+        waited on; the unique index idx_time_entries_running then rejects
+        the second insert with IntegrityError.
+        """
+        # One timestamp: the stopped entry ends exactly when the new one starts
+        now = datetime.now()
         previous_entry = None
-        running = await self.get_running_timer(session, for_update=True)
+        running = await self.get_running_timer(
+            session, for_update=True, skip_locked=True
+        )
         if running:
-            previous_entry = await self.stop_timer(session)
+            previous_entry = self._stop_timer_inner(session, running, now)
 
         # Update task status to "doing" if not already
         if task.status != "doing":
@@ -71,7 +122,7 @@ class TimerService:
         # Create new timer
         new_entry = TimeEntry(
             task_id=task.id,
-            start_time=datetime.now(),
+            start_time=now,
         )
         session.add(new_entry)
         await session.commit()
@@ -100,10 +151,36 @@ class TimerService:
         if not timer:
             raise TimerNotRunningException()
 
-        # Stop timer
-        now = datetime.now()
+        self._stop_timer_inner(session, timer, datetime.now(), note)
+
+        await session.commit()
+        await session.refresh(timer)
+
+        return timer
+
+    def _stop_timer_inner(
+        self,
+        session: AsyncSession,
+        timer: TimeEntry,
+        now: datetime,
+        note: Optional[str] = None,
+    ) -> TimeEntry:
+        """Stop a running timer without committing.
+
+        The caller owns the transaction and must have locked the entry
+        (get_running_timer with for_update=True).
+
+        Args:
+            session: Database session
+            timer: The running TimeEntry
+            now: Stop timestamp (taken once by the caller)
+            note: Optional note to add to the time entry
+
+        Returns:
+            The stopped TimeEntry
+        """
         timer.end_time = now
-        timer.duration_minutes = int((now - timer.start_time).total_seconds() / 60)
+        timer.duration_minutes = int((now - timer.start_time).total_seconds() // 60)
         if note:
             timer.note = note
 
@@ -112,9 +189,6 @@ class TimerService:
         # Note: actual_hours is now calculated dynamically from time_entries
         # No need to update task.actual_hours (column was removed)
 
-        await session.commit()
-        await session.refresh(timer)
-
         return timer
 
     async def get_timer_status(
@@ -125,18 +199,24 @@ class TimerService:
         Returns:
             Dict with is_running, current_entry, and last_entry
         """
-        running = await self.get_running_timer(session)
+        # Load running timer with its task and project in one query
+        # (populate_existing so instances already in the session get the
+        # relationships loaded as well)
+        query = (
+            select(TimeEntry)
+            .where(TimeEntry.end_time.is_(None))
+            .options(joinedload(TimeEntry.task).joinedload(Task.project))
+            .execution_options(populate_existing=True)
+        )
+        result = await session.execute(query)
+        running = result.scalar_one_or_none()
 
         if running:
-            # Load task relationship
-            await session.refresh(running, ["task"])
-            elapsed = int((datetime.now() - running.start_time).total_seconds() / 60)
+            now = datetime.now()
+            elapsed = int((now - running.start_time).total_seconds() // 60)
 
-            # Load project if available
-            project_name = None
-            if running.task.project_id:
-                await session.refresh(running.task, ["project"])
-                project_name = running.task.project.name if running.task.project else None
+            project = running.task.project
+            project_name = project.name if project else None
 
             return {
                 "is_running": True,
@@ -157,13 +237,12 @@ class TimerService:
             .where(TimeEntry.end_time.isnot(None))
             .order_by(TimeEntry.end_time.desc())
             .limit(1)
+            .options(joinedload(TimeEntry.task))
+            .execution_options(populate_existing=True)
         )
         result = await session.execute(query)
         last = result.scalar_one_or_none()
 
-        if last:
-            await session.refresh(last, ["task"])
-
         return {
             "is_running": False,
             "current_entry": None,
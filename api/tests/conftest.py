@@ -3,27 +3,73 @@ Pytest configuration and fixtures for integration tests.
 
 This module provides:
 - Database connection to existing PostgreSQL container (from docker-compose)
-- Database migration application via Alembic
-- Test session management with transaction rollback
+- Database migration via Alembic into a template database, copied per test worker
+- Test session management with per-test SAVEPOINT rollback on a shared connection
+- A read-only seeded catalog on a second connection (seeded_db / seeded_session)
 - FastAPI test client with dependency overrides
 - Factory fixtures for creating test data
 """
 
 import asyncio
+import functools
+import hashlib
 import os
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import MappingProxyType
+from typing import AsyncGenerator, Callable, Iterable, List, Optional
 
 import pytest
+import pytest_asyncio
 from alembic import command
 from alembic.config import Config
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy import create_engine, func, insert, make_url, select, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import aliased
 from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 
 from app.database import get_session
 from app.main import app
 from app.models import Genre, Project, Schedule, Setting, Task, TaskDependency, TimeEntry
+from tests.utils import ASGIClient
+
+# Run the test event loop on uvloop when available (not on Windows).
+# The policy must be installed before pytest-asyncio creates the session loop.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+# Advisory lock key used while creating/migrating the template database
+TEMPLATE_LOCK_KEY = 7263541
+
+# Row count from which factory create_bulk switches from INSERT to COPY
+BULK_COPY_THRESHOLD = 100
+
+# Rows per model in the read-only seeded catalog (see seeded_db)
+SEED_SIZE = 50
+
+# Seeded tasks cycle through these statuses (dashboard/kanban coverage)
+SEED_TASK_STATUSES = ("todo", "doing", "waiting", "done", "archive")
+
+# asyncpg options for test connections: a larger prepared statement cache
+# (factories and services issue many distinct statements), no JIT, whose
+# compile time outweighs any gain on the small test queries, and no waiting
+# for WAL flush on commit (test data is thrown away)
+TEST_CONNECT_ARGS = {
+    "statement_cache_size": 1024,
+    "server_settings": {"jit": "off", "synchronous_commit": "off"},
+}
 
 
 # =============================================================================
@@ -58,54 +104,262 @@ def test_database_url() -> str:
     return db_url
 
 
+def _migrations_hash(api_dir: str) -> str:
+    """Hash alembic/env.py and every revision file (name and content)."""
+    alembic_dir = os.path.join(api_dir, "alembic")
+    versions_dir = os.path.join(alembic_dir, "versions")
+    paths = [os.path.join(alembic_dir, "env.py")] + [
+        os.path.join(versions_dir, name)
+        for name in sorted(os.listdir(versions_dir))
+        if name.endswith(".py")
+    ]
+
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
 @pytest.fixture(scope="session")
-def test_engine(test_database_url: str) -> AsyncEngine:
+def apply_migrations(test_database_url: str) -> str:
     """
-    Create an async SQLAlchemy engine connected to the test database.
+    Migrate a template database once and return its name.
+
+    Alembic runs against "<database>_template" instead of the docker-compose
+    database itself. The template is kept between test sessions and tagged
+    (database comment) with a hash of the migration files; while the hash
+    matches, Alembic is not run at all. When a migration is added or edited
+    the template is rebuilt from scratch.
+    Test databases are then created as copies of it (see worker_database_url).
+    """
+    url = make_url(test_database_url)
+    template_name = f"{url.database}_template"
+
+    # Get the path to the api directory (one level up from tests/)
+    api_dir = os.path.dirname(os.path.dirname(__file__))
+    migrations_hash = _migrations_hash(api_dir)
 
-    Uses NullPool to avoid connection pooling issues in tests.
+    admin_engine = create_engine(
+        url.set(drivername="postgresql", database="postgres"),
+        isolation_level="AUTOCOMMIT",
+        poolclass=NullPool,
+    )
+    with admin_engine.connect() as conn:
+        quoted = conn.dialect.identifier_preparer.quote(template_name)
+
+        # Serialize template creation across pytest-xdist workers
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": TEMPLATE_LOCK_KEY})
+        try:
+            template = conn.execute(
+                text(
+                    "SELECT shobj_description(oid, 'pg_database') "
+                    "FROM pg_database WHERE datname = :name"
+                ),
+                {"name": template_name},
+            ).first()
+
+            if template is None or template[0] != migrations_hash:
+                if template is not None:
+                    conn.execute(text(f"ALTER DATABASE {quoted} WITH IS_TEMPLATE false"))
+                    conn.execute(text(f"DROP DATABASE {quoted}"))
+                conn.execute(text(f"CREATE DATABASE {quoted}"))
+
+                alembic_cfg = Config(os.path.join(api_dir, "alembic.ini"))
+                alembic_cfg.attributes["database_url"] = url.set(
+                    database=template_name
+                ).render_as_string(hide_password=False)
+                command.upgrade(alembic_cfg, "head")
+
+                # Allow concurrent copies of the template
+                conn.execute(text(f"ALTER DATABASE {quoted} WITH IS_TEMPLATE true"))
+                # The hash is hex, so it is safe to inline
+                conn.execute(text(f"COMMENT ON DATABASE {quoted} IS '{migrations_hash}'"))
+        finally:
+            conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": TEMPLATE_LOCK_KEY}
+            )
+    admin_engine.dispose()
+
+    return template_name
+
+
+@pytest.fixture(scope="session")
+def worker_database_url(test_database_url: str, apply_migrations: str):
+    """
+    Create a database for this test worker from the migrated template.
+
+    CREATE DATABASE ... TEMPLATE copies the schema at file level, which is much
+    faster than replaying the migrations. Each pytest-xdist worker gets its own
+    database ("<database>_test_<worker>"); it is dropped after the session.
+    """
+    url = make_url(test_database_url)
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    database_name = f"{url.database}_test_{worker}"
+
+    admin_engine = create_engine(
+        url.set(drivername="postgresql", database="postgres"),
+        isolation_level="AUTOCOMMIT",
+        poolclass=NullPool,
+    )
+    with admin_engine.connect() as conn:
+        quote = conn.dialect.identifier_preparer.quote
+        # Copy under the template lock so another worker cannot be rebuilding
+        # the template at the same time
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": TEMPLATE_LOCK_KEY})
+        try:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {quote(database_name)}"))
+            conn.execute(
+                text(
+                    f"CREATE DATABASE {quote(database_name)} "
+                    f"TEMPLATE {quote(apply_migrations)}"
+                )
+            )
+        finally:
+            conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": TEMPLATE_LOCK_KEY}
+            )
+
+    yield url.set(database=database_name).render_as_string(hide_password=False)
+
+    with admin_engine.connect() as conn:
+        quote = conn.dialect.identifier_preparer.quote
+        conn.execute(text(f"DROP DATABASE IF EXISTS {quote(database_name)}"))
+    admin_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+async def test_engine(worker_database_url: str) -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Create an async SQLAlchemy engine connected to this worker's test database.
+
+    Tests share one connection (see test_connection), so connecting and
+    authenticating happens once per session instead of once per test. The
+    pool is limited to that single connection: anything that would check
+    out a second one (and not see the test transaction) fails fast instead.
+    The pool is disposed at the end.
     """
     engine = create_async_engine(
-        test_database_url,
+        worker_database_url,
         echo=False,  # Set to True for SQL query debugging
-        poolclass=NullPool,  # No connection pooling for tests
-        future=True,
+        connect_args=TEST_CONNECT_ARGS,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=5,
     )
 
-    return engine
+    yield engine
+
+    await engine.dispose()
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test in the session-wide event loop.
+
+    Async fixtures already default to it (asyncio_default_fixture_loop_scope
+    in pytest.ini). The shared database connection is bound to that loop,
+    so the tests must run in it as well.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 @pytest.fixture(scope="session")
-def apply_migrations(test_database_url: str):
+async def test_connection(
+    test_engine: AsyncEngine,
+) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Provide a single database connection shared by all tests.
+
+    An outer transaction is started once and rolled back at the end of the
+    session; each test works inside its own SAVEPOINT (see test_session).
     """
-    Apply Alembic migrations to the test database once per session.
+    connection = await test_engine.connect()
+    transaction = await connection.begin()
+
+    try:
+        yield connection
+    finally:
+        await transaction.rollback()
+        await connection.close()
 
-    This runs before any tests execute.
-    Uses the synchronous (psycopg2) URL since Alembic migrations are synchronous.
 
-    Note: Migrations are applied to the existing docker-compose database.
-    The database should already exist and be running.
+@pytest.fixture(scope="session")
+async def _seeded_connection(
+    worker_database_url: str,
+) -> AsyncGenerator[tuple[AsyncConnection, dict], None]:
     """
-    # Get sync URL for Alembic (remove +asyncpg)
-    sync_db_url = test_database_url.replace("+asyncpg", "")
+    Provide a second connection holding a fixed catalog of seeded rows.
 
-    # Get the path to alembic.ini (one level up from tests/)
-    alembic_ini_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)), "alembic.ini"
+    SEED_SIZE genres, projects and tasks (statuses cycling through
+    SEED_TASK_STATUSES) are inserted once in an outer transaction that is
+    never committed. Tests on this connection (via
+    seeded_session) see them without creating data; tests on test_connection
+    do not see them at all, so their row counts are unaffected.
+    """
+    engine = create_async_engine(
+        worker_database_url,
+        echo=False,
+        connect_args=TEST_CONNECT_ARGS,
+        pool_size=1,
+        max_overflow=0,
     )
+    connection = await engine.connect()
+    transaction = await connection.begin()
+
+    session = AsyncSession(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    genres = await _insert_rows(session, Genre, [
+        {**GENRE_DEFAULTS, "name": f"シードジャンル{i}"} for i in range(SEED_SIZE)
+    ])
+    projects = await _insert_rows(session, Project, [
+        {**PROJECT_DEFAULTS, "name": f"シードプロジェクト{i}"} for i in range(SEED_SIZE)
+    ])
+    tasks = await _insert_rows(session, Task, [
+        {
+            **TASK_DEFAULTS,
+            "name": f"シードタスク{i}",
+            "status": SEED_TASK_STATUSES[i % len(SEED_TASK_STATUSES)],
+            "project_id": projects[i].id,
+            "genre_id": genres[i].id,
+        }
+        for i in range(SEED_SIZE)
+    ])
+    # Releases the session's savepoint; the rows stay in the outer transaction
+    await session.commit()
+    await session.close()
+
+    catalog = {"genres": genres, "projects": projects, "tasks": tasks}
+    try:
+        yield connection, catalog
+    finally:
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
 
-    # Create Alembic config
-    alembic_cfg = Config(alembic_ini_path)
-    alembic_cfg.set_main_option("sqlalchemy.url", sync_db_url)
 
-    # Just ensure we're at head (don't try to downgrade first)
-    # The downgrade has broken migrations with unnamed constraints
-    command.upgrade(alembic_cfg, "head")
+@pytest.fixture(scope="session")
+def seeded_db(_seeded_connection: tuple[AsyncConnection, dict]) -> dict:
+    """
+    Return the seeded catalog for read-only tests.
 
-    yield
+    Usage (with seeded_session / seeded_client instead of factories):
+        async def test_list(seeded_client, seeded_db):
+            response = await seeded_client.get("/api/v1/projects")
+            assert len(response.json()) >= len(seeded_db["projects"])
 
-    # Optional: Downgrade after all tests for cleanup
-    # command.downgrade(alembic_cfg, "base")
+    Returns:
+        Dict with "genres", "projects" and "tasks" lists (detached objects)
+    """
+    _, catalog = _seeded_connection
+    return catalog
 
 
 # =============================================================================
@@ -113,53 +367,89 @@ def apply_migrations(test_database_url: str):
 # =============================================================================
 
 
-@pytest.fixture
-async def test_session(
-    test_engine: AsyncEngine, apply_migrations
+@asynccontextmanager
+async def _savepoint_session(
+    connection: AsyncConnection,
 ) -> AsyncGenerator[AsyncSession, None]:
-    """
-    Provide a database session for a single test with transaction rollback.
-
-    Each test runs in its own transaction which is rolled back after the test completes.
-    This ensures perfect isolation between tests without needing to truncate tables.
-
-    Flow:
-    1. Create a connection from the engine
-    2. Start a transaction
-    3. Create a session bound to this transaction
-    4. Yield session to the test
-    5. Rollback the transaction (undoes all changes)
-    6. Close the connection
-    """
-    # Create a connection
-    connection = await test_engine.connect()
-
-    # Start a transaction
-    transaction = await connection.begin()
+    """Open a session inside a SAVEPOINT on connection and roll it back on exit."""
+    savepoint = await connection.begin_nested()
 
-    # Create a session bound to this transaction
     session = AsyncSession(
         bind=connection,
         expire_on_commit=False,  # Don't expire objects after commit
         autoflush=True,
         autocommit=False,
+        join_transaction_mode="create_savepoint",
     )
 
     try:
         yield session
     finally:
-        # Rollback the transaction (undoes all changes made in this test)
-        await transaction.rollback()
-
-        # Close the session and connection
+        # Close the session (rolls back any savepoint it still holds)
         await session.close()
-        await connection.close()
+
+        # Roll back the test's SAVEPOINT (undoes all changes made in this test)
+        if savepoint.is_active:
+            await savepoint.rollback()
 
 
 @pytest.fixture
-async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def test_session(
+    test_connection: AsyncConnection,
+) -> AsyncGenerator[AsyncSession, None]:
     """
-    Provide an async HTTP client for testing FastAPI endpoints.
+    Provide a database session for a single test with SAVEPOINT rollback.
+
+    Each test runs inside a SAVEPOINT on the shared connection which is rolled
+    back after the test completes. This keeps tests isolated without opening
+    a new connection per test.
+
+    Flow:
+    1. Start a SAVEPOINT on the shared connection
+    2. Create a session bound to it (join_transaction_mode="create_savepoint",
+       so session commit/rollback only release/roll back nested savepoints)
+    3. Yield session to the test
+    4. Close the session and roll back the test's SAVEPOINT
+    """
+    async with _savepoint_session(test_connection) as session:
+        yield session
+
+
+@pytest.fixture
+async def seeded_session(
+    _seeded_connection: tuple[AsyncConnection, dict],
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a session that sees the seeded catalog (see seeded_db).
+
+    Works like test_session, but on the seeded connection: changes made by
+    the test are rolled back, the seeded rows stay for the next test.
+    """
+    connection, _ = _seeded_connection
+    async with _savepoint_session(connection) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def _shared_client() -> ASGIClient:
+    """
+    Provide one in-process test client for the whole test session.
+
+    ASGIClient calls the app directly (see tests.utils.asgi_request), with
+    the get/post/put/patch/delete signatures the tests use from
+    httpx.AsyncClient. The per-test database session is injected through
+    dependency overrides in the client fixture, so the client itself holds
+    no per-test state.
+    """
+    return ASGIClient(app)
+
+
+@pytest.fixture
+async def client(
+    _shared_client: ASGIClient, test_session: AsyncSession
+) -> AsyncGenerator[ASGIClient, None]:
+    """
+    Provide an in-process client for testing FastAPI endpoints.
 
     This client has the database session dependency overridden to use the test session,
     ensuring all API calls use the same transaction as direct database operations in tests.
@@ -171,13 +461,28 @@ async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None
 
     app.dependency_overrides[get_session] = override_get_session
 
-    # Create async client with ASGITransport (required for httpx 0.27+)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+    yield _shared_client
+
+    # Remove only our override (other overrides are left in place)
+    app.dependency_overrides.pop(get_session, None)
+
+
+@pytest.fixture
+async def seeded_client(
+    _shared_client: ASGIClient, seeded_session: AsyncSession
+) -> AsyncGenerator[ASGIClient, None]:
+    """
+    Provide the test client with get_session overridden to seeded_session.
+    """
+
+    async def override_get_session():
+        yield seeded_session
+
+    app.dependency_overrides[get_session] = override_get_session
 
-    # Clear dependency overrides after test
-    app.dependency_overrides.clear()
+    yield _shared_client
+
+    app.dependency_overrides.pop(get_session, None)
 
 
 # =============================================================================
@@ -185,6 +490,185 @@ async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None
 # =============================================================================
 
 
+# Default column values used by the factories (read-only; override per call
+# with keyword arguments). Time-dependent defaults are computed per row.
+GENRE_DEFAULTS = MappingProxyType({
+    "name": "テストジャンル",
+    "color": "#000000",
+})
+
+PROJECT_DEFAULTS = MappingProxyType({
+    "name": "テストプロジェクト",
+    "description": "テスト用のプロジェクトです",
+    "is_active": True,
+})
+
+TASK_DEFAULTS = MappingProxyType({
+    "name": "テストタスク",
+    "status": "todo",
+    "priority": "中",
+    "want_level": "中",
+    "recurrence": "なし",
+})
+
+# scheduled_date defaults to datetime.now() at build time
+SCHEDULE_DEFAULTS = MappingProxyType({
+    "allocated_hours": Decimal("2.0"),
+    "is_generated_by_ai": False,
+})
+
+SETTING_DEFAULTS = MappingProxyType({
+    "key": "test_setting",
+    "value": "{}",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _insert_returning(model: type[SQLModel]):
+    """
+    Build the INSERT ... RETURNING statement for a model once and reuse it.
+
+    SQLAlchemy's compiled cache and asyncpg's prepared statement cache are
+    keyed on the statement, so reusing one construct per model skips
+    rebuilding it on every factory call.
+    """
+    return insert(model).returning(model, sort_by_parameter_order=True)
+
+
+async def _insert_rows(
+    session: AsyncSession, model: type[SQLModel], params_list: List[dict]
+) -> List[SQLModel]:
+    """
+    Insert rows with INSERT ... RETURNING and return them as ORM objects.
+
+    One statement per call (several rows are batched into a VALUES list), with
+    column defaults applied by SQLAlchemy and every column, including values
+    set by BEFORE INSERT triggers (Task.decomposition_level), read back by
+    RETURNING. The objects are added to the session's identity map.
+    The test transaction is rolled back afterwards, so nothing is committed.
+    """
+    if not params_list:
+        # An empty parameter list would insert a single row of defaults
+        return []
+
+    result = await session.scalars(_insert_returning(model), params_list)
+    return list(result.all())
+
+
+async def _copy_rows(session: AsyncSession, rows: List[SQLModel]) -> List[SQLModel]:
+    """
+    Insert rows of one model with PostgreSQL COPY on the session's connection.
+
+    COPY runs inside the test transaction but bypasses the ORM: ids are
+    reserved from the table's sequence up front and set on the (transient)
+    instances, which are not added to the session. Values computed by DB
+    triggers (e.g. Task.decomposition_level) are not reflected on them.
+    """
+    table = type(rows[0]).__table__
+
+    # Flush pending objects first so rows referenced by foreign keys exist
+    await session.flush()
+
+    if "id" in table.columns:
+        result = await session.execute(
+            select(func.nextval(func.pg_get_serial_sequence(table.name, "id")))
+            .select_from(func.generate_series(1, len(rows)))
+        )
+        for row, row_id in zip(rows, result.scalars()):
+            row.id = row_id
+
+    columns = [column.name for column in table.columns]
+    records = [tuple(getattr(row, name) for name in columns) for row in rows]
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name, records=records, columns=columns
+    )
+    return rows
+
+
+def _with_column_defaults(model: type[SQLModel], params: dict) -> dict:
+    """Return params with every Python-side column default filled in."""
+    values = dict(params)
+    for column in model.__table__.columns:
+        if column.key not in values and column.default is not None:
+            default = column.default
+            values[column.key] = default.arg(None) if default.is_callable else default.arg
+    return values
+
+
+async def _insert_task_with_entry(
+    session: AsyncSession, task_params: dict, entry_params: dict
+) -> tuple[Task, TimeEntry]:
+    """
+    Insert a task and one time entry for it in a single statement.
+
+    Both INSERTs run as data-modifying CTEs (the entry takes the task id
+    from the task's RETURNING) and the outer SELECT maps both rows to ORM
+    objects in the session's identity map. Column defaults are passed as
+    explicit values: SQLAlchemy cannot generate default parameters for two
+    INSERTs in one statement (both tables have created_at/updated_at).
+    """
+    new_task = (
+        insert(Task)
+        .values(**_with_column_defaults(Task, task_params))
+        .returning(*Task.__table__.columns)
+        .cte("new_task")
+    )
+    entry_values = {**entry_params, "task_id": select(new_task.c.id).scalar_subquery()}
+    new_entry = (
+        insert(TimeEntry)
+        .values(**_with_column_defaults(TimeEntry, entry_values))
+        .returning(*TimeEntry.__table__.columns)
+        .cte("new_entry")
+    )
+    task_alias = aliased(Task, new_task)
+    entry_alias = aliased(TimeEntry, new_entry)
+    result = await session.execute(
+        select(task_alias, entry_alias).join_from(
+            task_alias, entry_alias, entry_alias.task_id == task_alias.id
+        )
+    )
+    task, entry = result.one()
+    return task, entry
+
+
+async def _create_bulk(
+    session: AsyncSession,
+    model: type[SQLModel],
+    build_params: Callable[..., dict],
+    n: int,
+    base_kwargs: dict,
+) -> List[SQLModel]:
+    """
+    Create n rows built from the same kwargs.
+
+    Below BULK_COPY_THRESHOLD rows go through INSERT ... RETURNING
+    (session-attached objects); from the threshold on they are streamed
+    with COPY (see _copy_rows).
+    """
+    params_list = [build_params(**base_kwargs) for _ in range(n)]
+    if n >= BULK_COPY_THRESHOLD:
+        return await _copy_rows(session, [model(**params) for params in params_list])
+    return await _insert_rows(session, model, params_list)
+
+
+@pytest.fixture
+async def bulk_copy(test_session: AsyncSession):
+    """
+    Insert model instances with COPY inside the test transaction.
+
+    Usage:
+        tasks = await bulk_copy([Task(name=f"タスク{i}") for i in range(500)])
+    """
+
+    async def _bulk_copy(rows: List[SQLModel]) -> List[SQLModel]:
+        return await _copy_rows(test_session, rows)
+
+    return _bulk_copy
+
+
 @pytest.fixture
 async def genre_factory(test_session: AsyncSession):
     """
@@ -192,22 +676,27 @@ async def genre_factory(test_session: AsyncSession):
 
     Usage:
         genre = await genre_factory(name="リサーチ", color="#4A90D9")
+        genres = await genre_factory.create_many([{"name": "A"}, {"name": "B"}])
+        genres = await genre_factory.create_bulk(200)
     """
 
-    async def _create_genre(**kwargs) -> Genre:
-        # Set defaults if not provided
-        defaults = {
-            "name": "テストジャンル",
-            "color": "#000000",
-        }
-        defaults.update(kwargs)
+    def _genre_params(**kwargs) -> dict:
+        return {**GENRE_DEFAULTS, **kwargs}
 
-        genre = Genre(**defaults)
-        test_session.add(genre)
-        await test_session.commit()
-        await test_session.refresh(genre)
+    async def _create_genre(**kwargs) -> Genre:
+        (genre,) = await _insert_rows(test_session, Genre, [_genre_params(**kwargs)])
         return genre
 
+    async def _create_many(kwargs_list: Iterable[dict]) -> List[Genre]:
+        return await _insert_rows(
+            test_session, Genre, [_genre_params(**kw) for kw in kwargs_list]
+        )
+
+    async def _create_bulk_rows(n: int, **base_kwargs) -> List[Genre]:
+        return await _create_bulk(test_session, Genre, _genre_params, n, base_kwargs)
+
+    _create_genre.create_many = _create_many
+    _create_genre.create_bulk = _create_bulk_rows
     return _create_genre
 
 
@@ -218,22 +707,31 @@ async def project_factory(test_session: AsyncSession):
 
     Usage:
         project = await project_factory(name="研究プロジェクト", is_active=True)
+        projects = await project_factory.create_many([{"name": "A"}, {"name": "B"}])
+        projects = await project_factory.create_bulk(200, is_active=False)
     """
 
-    async def _create_project(**kwargs) -> Project:
-        defaults = {
-            "name": "テストプロジェクト",
-            "description": "テスト用のプロジェクトです",
-            "is_active": True,
-        }
-        defaults.update(kwargs)
+    def _project_params(**kwargs) -> dict:
+        return {**PROJECT_DEFAULTS, **kwargs}
 
-        project = Project(**defaults)
-        test_session.add(project)
-        await test_session.commit()
-        await test_session.refresh(project)
+    async def _create_project(**kwargs) -> Project:
+        (project,) = await _insert_rows(
+            test_session, Project, [_project_params(**kwargs)]
+        )
         return project
 
+    async def _create_many(kwargs_list: Iterable[dict]) -> List[Project]:
+        return await _insert_rows(
+            test_session, Project, [_project_params(**kw) for kw in kwargs_list]
+        )
+
+    async def _create_bulk_rows(n: int, **base_kwargs) -> List[Project]:
+        return await _create_bulk(
+            test_session, Project, _project_params, n, base_kwargs
+        )
+
+    _create_project.create_many = _create_many
+    _create_project.create_bulk = _create_bulk_rows
     return _create_project
 
 
@@ -242,26 +740,32 @@ async def task_factory(test_session: AsyncSession):
     """
     Factory fixture for creating Task instances in the test database.
 
+    decomposition_level is computed by a DB trigger and returned by the INSERT
+    (except for create_bulk batches that go through COPY).
+
     Usage:
         task = await task_factory(name="タスク1", project_id=project.id)
+        tasks = await task_factory.create_many([{"name": "A"}, {"name": "B"}])
+        tasks = await task_factory.create_bulk(500, project_id=project.id)
     """
 
-    async def _create_task(**kwargs) -> Task:
-        defaults = {
-            "name": "テストタスク",
-            "status": "todo",
-            "priority": "中",
-            "want_level": "中",
-            "recurrence": "なし",
-        }
-        defaults.update(kwargs)
+    def _task_params(**kwargs) -> dict:
+        return {**TASK_DEFAULTS, **kwargs}
 
-        task = Task(**defaults)
-        test_session.add(task)
-        await test_session.commit()
-        await test_session.refresh(task)
+    async def _create_task(**kwargs) -> Task:
+        (task,) = await _insert_rows(test_session, Task, [_task_params(**kwargs)])
         return task
 
+    async def _create_many(kwargs_list: Iterable[dict]) -> List[Task]:
+        return await _insert_rows(
+            test_session, Task, [_task_params(**kw) for kw in kwargs_list]
+        )
+
+    async def _create_bulk_rows(n: int, **base_kwargs) -> List[Task]:
+        return await _create_bulk(test_session, Task, _task_params, n, base_kwargs)
+
+    _create_task.create_many = _create_many
+    _create_task.create_bulk = _create_bulk_rows
     return _create_task
 
 
@@ -272,24 +776,30 @@ async def schedule_factory(test_session: AsyncSession):
 
     Usage:
         schedule = await schedule_factory(task_id=task.id, scheduled_date=datetime.now())
+        schedules = await schedule_factory.create_many([{"task_id": task.id}] * 3)
+        schedules = await schedule_factory.create_bulk(200, task_id=task.id)
     """
-    from datetime import datetime
-    from decimal import Decimal
+    def _schedule_params(**kwargs) -> dict:
+        return {"scheduled_date": datetime.now(), **SCHEDULE_DEFAULTS, **kwargs}
 
     async def _create_schedule(**kwargs) -> Schedule:
-        defaults = {
-            "scheduled_date": datetime.now(),
-            "allocated_hours": Decimal("2.0"),
-            "is_generated_by_ai": False,
-        }
-        defaults.update(kwargs)
-
-        schedule = Schedule(**defaults)
-        test_session.add(schedule)
-        await test_session.commit()
-        await test_session.refresh(schedule)
+        (schedule,) = await _insert_rows(
+            test_session, Schedule, [_schedule_params(**kwargs)]
+        )
         return schedule
 
+    async def _create_many(kwargs_list: Iterable[dict]) -> List[Schedule]:
+        return await _insert_rows(
+            test_session, Schedule, [_schedule_params(**kw) for kw in kwargs_list]
+        )
+
+    async def _create_bulk_rows(n: int, **base_kwargs) -> List[Schedule]:
+        return await _create_bulk(
+            test_session, Schedule, _schedule_params, n, base_kwargs
+        )
+
+    _create_schedule.create_many = _create_many
+    _create_schedule.create_bulk = _create_bulk_rows
     return _create_schedule
 
 
@@ -300,21 +810,30 @@ async def time_entry_factory(test_session: AsyncSession):
 
     Usage:
         entry = await time_entry_factory(task_id=task.id, start_time=datetime.now())
+        entries = await time_entry_factory.create_many([{"task_id": task.id}] * 3)
+        entries = await time_entry_factory.create_bulk(200, task_id=task.id)
     """
-    from datetime import datetime
+    def _time_entry_params(**kwargs) -> dict:
+        return {"start_time": datetime.now(), **kwargs}
 
     async def _create_time_entry(**kwargs) -> TimeEntry:
-        defaults = {
-            "start_time": datetime.now(),
-        }
-        defaults.update(kwargs)
-
-        time_entry = TimeEntry(**defaults)
-        test_session.add(time_entry)
-        await test_session.commit()
-        await test_session.refresh(time_entry)
+        (time_entry,) = await _insert_rows(
+            test_session, TimeEntry, [_time_entry_params(**kwargs)]
+        )
         return time_entry
 
+    async def _create_many(kwargs_list: Iterable[dict]) -> List[TimeEntry]:
+        return await _insert_rows(
+            test_session, TimeEntry, [_time_entry_params(**kw) for kw in kwargs_list]
+        )
+
+    async def _create_bulk_rows(n: int, **base_kwargs) -> List[TimeEntry]:
+        return await _create_bulk(
+            test_session, TimeEntry, _time_entry_params, n, base_kwargs
+        )
+
+    _create_time_entry.create_many = _create_many
+    _create_time_entry.create_bulk = _create_bulk_rows
     return _create_time_entry
 
 
@@ -325,21 +844,24 @@ async def setting_factory(test_session: AsyncSession):
 
     Usage:
         setting = await setting_factory(key="max_hours", value='{"hours": 8}')
+        settings = await setting_factory.create_many([{"key": "a"}, {"key": "b"}])
     """
 
-    async def _create_setting(**kwargs) -> Setting:
-        defaults = {
-            "key": "test_setting",
-            "value": "{}",
-        }
-        defaults.update(kwargs)
+    def _setting_params(**kwargs) -> dict:
+        return {**SETTING_DEFAULTS, **kwargs}
 
-        setting = Setting(**defaults)
-        test_session.add(setting)
-        await test_session.commit()
-        await test_session.refresh(setting)
+    async def _create_setting(**kwargs) -> Setting:
+        (setting,) = await _insert_rows(
+            test_session, Setting, [_setting_params(**kwargs)]
+        )
         return setting
 
+    async def _create_many(kwargs_list: Iterable[dict]) -> List[Setting]:
+        return await _insert_rows(
+            test_session, Setting, [_setting_params(**kw) for kw in kwargs_list]
+        )
+
+    _create_setting.create_many = _create_many
     return _create_setting
 
 
@@ -350,36 +872,77 @@ async def task_dependency_factory(test_session: AsyncSession):
 
     Usage:
         dep = await task_dependency_factory(task_id=task.id, depends_on_task_id=other_task.id)
+        deps = await task_dependency_factory.create_many(
+            [{"task_id": b.id, "depends_on_task_id": a.id}]
+        )
     """
 
     async def _create_dependency(task_id: int, depends_on_task_id: int) -> TaskDependency:
-        dep = TaskDependency(task_id=task_id, depends_on_task_id=depends_on_task_id)
-        test_session.add(dep)
-        await test_session.commit()
-        await test_session.refresh(dep)
+        (dep,) = await _insert_rows(
+            test_session,
+            TaskDependency,
+            [{"task_id": task_id, "depends_on_task_id": depends_on_task_id}],
+        )
         return dep
 
+    async def _create_many(kwargs_list: Iterable[dict]) -> List[TaskDependency]:
+        return await _insert_rows(test_session, TaskDependency, list(kwargs_list))
+
+    _create_dependency.create_many = _create_many
     return _create_dependency
 
 
 @pytest.fixture
-async def running_timer_factory(test_session: AsyncSession, task_factory, time_entry_factory):
+async def running_timer_factory(test_session: AsyncSession):
     """
     Factory fixture for creating a task with a running timer (end_time=None).
 
+    The task and its entry are inserted in one statement (see
+    _insert_task_with_entry).
+
     Usage:
         task, entry = await running_timer_factory(name="タスク名")
     """
-    from datetime import datetime, timedelta
-
     async def _create_running_timer(**task_kwargs) -> tuple[Task, TimeEntry]:
-        task = await task_factory(**task_kwargs)
-        entry = await time_entry_factory(
-            task_id=task.id,
-            start_time=datetime.now() - timedelta(minutes=30),
-            end_time=None,
-            duration_minutes=None,
+        return await _insert_task_with_entry(
+            test_session,
+            {**TASK_DEFAULTS, **task_kwargs},
+            {
+                "start_time": datetime.now() - timedelta(minutes=30),
+                "end_time": None,
+                "duration_minutes": None,
+            },
         )
-        return task, entry
 
     return _create_running_timer
+
+
+@pytest.fixture
+async def task_with_entry(test_session: AsyncSession):
+    """
+    Factory fixture for creating a task with one finished time entry.
+
+    The entry ends at ends_at (default: now) and lasts `minutes`.
+
+    Usage:
+        task = await task_with_entry("タスク名", minutes=120, genre_id=genre.id)
+    """
+    async def _create_task_with_entry(
+        name: str,
+        minutes: int = 60,
+        ends_at: Optional[datetime] = None,
+        **task_kwargs,
+    ) -> Task:
+        end = ends_at or datetime.now()
+        task, _ = await _insert_task_with_entry(
+            test_session,
+            {**TASK_DEFAULTS, "name": name, **task_kwargs},
+            {
+                "start_time": end - timedelta(minutes=minutes),
+                "end_time": end,
+                "duration_minutes": minutes,
+            },
+        )
+        return task
+
+    return _create_task_with_entry
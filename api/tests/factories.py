@@ -2,8 +2,8 @@
 Factory Boy factories for generating test data.
 
 These factories provide an alternative to the fixture-based factories in conftest.py.
-They're useful for creating test data without database persistence (using .build())
-or for generating realistic random data with Faker.
+They're useful for creating test data without database persistence (using .build()).
+Text fields are filled from a small built-in pool of Japanese characters.
 
 Usage examples:
     # Create instance without saving to DB
@@ -15,17 +15,69 @@ Usage examples:
     # Create with relationships
     project = ProjectFactory.build()
     task = TaskFactory.build(project_id=project.id)
+
+    # Share one timestamp across a batch
+    with frozen_now():
+        tasks = TaskFactory.build_batch(1000)
 """
 
+import random
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import Iterator, Optional
 
 import factory
-from faker import Faker
 
 from app.models import Genre, Project, Schedule, Setting, Task, TimeEntry
 
-fake = Faker(["ja_JP"])  # Japanese locale for realistic test data
+# Deterministic source for non-semantic random values (hours, offsets, text)
+_rng = random.Random(0)
+
+# Character pool for filler text; repeated so any slice of up to
+# _MAX_TEXT_LENGTH characters can start at any offset
+_JA_POOL = (
+    "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよ"
+    "らりるれろわをん研究論文実験調査資料作成確認提出準備会議発表分析設計実装"
+)
+_MAX_TEXT_LENGTH = 200
+_JA_TEXT = _JA_POOL * (_MAX_TEXT_LENGTH // len(_JA_POOL) + 2)
+
+def _fast_text(length: int) -> str:
+    """Return length characters of filler Japanese text (length <= 200)."""
+    start = _rng.randrange(len(_JA_POOL))
+    return _JA_TEXT[start:start + length]
+
+
+def _hex_color() -> str:
+    return f"#{_rng.randrange(0x1000000):06x}"
+
+# Timestamp captured by frozen_now(); None means read the clock on each call
+_frozen_now: Optional[datetime] = None
+
+
+def _now() -> datetime:
+    """Return the frozen timestamp inside frozen_now(), else datetime.now()."""
+    return _frozen_now if _frozen_now is not None else datetime.now()
+
+
+@contextmanager
+def frozen_now() -> Iterator[datetime]:
+    """
+    Read the clock once and use that timestamp for every build in the block.
+
+    Useful for build_batch() with many rows, where each LazyFunction would
+    otherwise call datetime.now() separately. Nested blocks keep the outer
+    timestamp.
+    """
+    global _frozen_now
+    previous = _frozen_now
+    if previous is None:
+        _frozen_now = datetime.now()
+    try:
+        yield _frozen_now
+    finally:
+        _frozen_now = previous
 
 
 class GenreFactory(factory.Factory):
@@ -35,9 +87,9 @@ class GenreFactory(factory.Factory):
         model = Genre
 
     name = factory.Sequence(lambda n: f"ジャンル{n}")
-    color = factory.Faker("hex_color")
-    created_at = factory.LazyFunction(datetime.now)
-    updated_at = factory.LazyFunction(datetime.now)
+    color = factory.LazyFunction(_hex_color)
+    created_at = factory.LazyFunction(_now)
+    updated_at = factory.SelfAttribute("created_at")
 
 
 class ProjectFactory(factory.Factory):
@@ -47,13 +99,13 @@ class ProjectFactory(factory.Factory):
         model = Project
 
     name = factory.Sequence(lambda n: f"プロジェクト{n}")
-    description = factory.Faker("paragraph", locale="ja_JP")
+    description = factory.LazyFunction(lambda: _fast_text(100))
     deadline = factory.LazyFunction(
-        lambda: datetime.now() + timedelta(days=fake.random_int(min=7, max=90))
+        lambda: _now() + timedelta(days=_rng.randint(7, 90))
     )
     is_active = True
-    created_at = factory.LazyFunction(datetime.now)
-    updated_at = factory.LazyFunction(datetime.now)
+    created_at = factory.LazyFunction(_now)
+    updated_at = factory.SelfAttribute("created_at")
 
 
 class TaskFactory(factory.Factory):
@@ -67,10 +119,10 @@ class TaskFactory(factory.Factory):
     genre_id = None  # Optional foreign key
     status = factory.Iterator(["todo", "doing", "waiting", "done"])
     deadline = factory.LazyFunction(
-        lambda: datetime.now() + timedelta(days=fake.random_int(min=1, max=30))
+        lambda: _now() + timedelta(days=_rng.randint(1, 30))
     )
     estimated_hours = factory.LazyFunction(
-        lambda: Decimal(str(fake.random_int(min=1, max=40) * 0.5))
+        lambda: Decimal(str(_rng.randint(1, 40) * 0.5))
     )
     actual_hours = Decimal("0")
     priority = factory.Iterator(["高", "中", "低"])
@@ -80,9 +132,9 @@ class TaskFactory(factory.Factory):
     min_work_unit = Decimal("0.5")
     parent_task_id = None  # Optional self-referential foreign key
     # decomposition_level is auto-computed by DB trigger - not set in factory
-    note = factory.Faker("text", max_nb_chars=200, locale="ja_JP")
-    created_at = factory.LazyFunction(datetime.now)
-    updated_at = factory.LazyFunction(datetime.now)
+    note = factory.LazyFunction(lambda: _fast_text(_rng.randrange(50, 201)))
+    created_at = factory.LazyFunction(_now)
+    updated_at = factory.SelfAttribute("created_at")
 
 
 class ScheduleFactory(factory.Factory):
@@ -93,20 +145,20 @@ class ScheduleFactory(factory.Factory):
 
     task_id = None  # Required foreign key (must be provided)
     scheduled_date = factory.LazyFunction(
-        lambda: datetime.now() + timedelta(days=fake.random_int(min=0, max=7))
+        lambda: _now() + timedelta(days=_rng.randint(0, 7))
     )
     start_time = factory.LazyFunction(
-        lambda: datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+        lambda: _now().replace(hour=9, minute=0, second=0, microsecond=0)
     )
     end_time = factory.LazyFunction(
-        lambda: datetime.now().replace(hour=11, minute=0, second=0, microsecond=0)
+        lambda: _now().replace(hour=11, minute=0, second=0, microsecond=0)
     )
     allocated_hours = factory.LazyFunction(
-        lambda: Decimal(str(fake.random_int(min=1, max=8) * 0.5))
+        lambda: Decimal(str(_rng.randint(1, 8) * 0.5))
     )
     is_generated_by_ai = False
-    created_at = factory.LazyFunction(datetime.now)
-    updated_at = factory.LazyFunction(datetime.now)
+    created_at = factory.LazyFunction(_now)
+    updated_at = factory.SelfAttribute("created_at")
 
 
 class TimeEntryFactory(factory.Factory):
@@ -117,13 +169,13 @@ class TimeEntryFactory(factory.Factory):
 
     task_id = None  # Required foreign key (must be provided)
     start_time = factory.LazyFunction(
-        lambda: datetime.now() - timedelta(hours=2)
+        lambda: _now() - timedelta(hours=2)
     )
-    end_time = factory.LazyFunction(lambda: datetime.now())
-    duration_minutes = factory.LazyFunction(lambda: fake.random_int(min=15, max=240))
-    note = factory.Faker("sentence", locale="ja_JP")
-    created_at = factory.LazyFunction(datetime.now)
-    updated_at = factory.LazyFunction(datetime.now)
+    end_time = factory.LazyFunction(_now)
+    duration_minutes = factory.LazyFunction(lambda: _rng.randint(15, 240))
+    note = factory.LazyFunction(lambda: _fast_text(30))
+    created_at = factory.LazyFunction(_now)
+    updated_at = factory.SelfAttribute("created_at")
 
 
 class SettingFactory(factory.Factory):
@@ -136,9 +188,9 @@ class SettingFactory(factory.Factory):
     value = factory.LazyFunction(
         lambda: '{"enabled": true, "max_value": 100}'
     )
-    description = factory.Faker("sentence", locale="ja_JP")
-    created_at = factory.LazyFunction(datetime.now)
-    updated_at = factory.LazyFunction(datetime.now)
+    description = factory.LazyFunction(lambda: _fast_text(30))
+    created_at = factory.LazyFunction(_now)
+    updated_at = factory.SelfAttribute("created_at")
 
 
 # =============================================================================
@@ -153,9 +205,10 @@ def create_task_with_project_and_genre() -> tuple[Task, Project, Genre]:
     Returns:
         Tuple of (task, project, genre) instances (not persisted to DB).
     """
-    project = ProjectFactory.build()
-    genre = GenreFactory.build()
-    task = TaskFactory.build(project_id=project.id, genre_id=genre.id)
+    with frozen_now():
+        project = ProjectFactory.build()
+        genre = GenreFactory.build()
+        task = TaskFactory.build(project_id=project.id, genre_id=genre.id)
     return task, project, genre
 
 
@@ -169,15 +222,16 @@ def create_parent_task_with_children(num_children: int = 3) -> tuple[Task, list[
     Returns:
         Tuple of (parent_task, list of child_tasks) (not persisted to DB).
     """
-    parent = TaskFactory.build(parent_task_id=None)
-    children = [
-        TaskFactory.build(
-            parent_task_id=parent.id,
-            # decomposition_level will be auto-set by DB trigger
-            name=f"{parent.name} - サブタスク{i+1}",
-        )
-        for i in range(num_children)
-    ]
+    with frozen_now():
+        parent = TaskFactory.build(parent_task_id=None)
+        children = [
+            TaskFactory.build(
+                parent_task_id=parent.id,
+                # decomposition_level will be auto-set by DB trigger
+                name=f"{parent.name} - サブタスク{i+1}",
+            )
+            for i in range(num_children)
+        ]
     return parent, children
 
 
@@ -193,9 +247,10 @@ def create_task_with_schedule_and_time_entries(
     Returns:
         Tuple of (task, schedule, list of time_entries) (not persisted to DB).
     """
-    task = TaskFactory.build()
-    schedule = ScheduleFactory.build(task_id=task.id)
-    time_entries = [
-        TimeEntryFactory.build(task_id=task.id) for _ in range(num_entries)
-    ]
+    with frozen_now():
+        task = TaskFactory.build()
+        schedule = ScheduleFactory.build(task_id=task.id)
+        time_entries = [
+            TimeEntryFactory.build(task_id=task.id) for _ in range(num_entries)
+        ]
     return task, schedule, time_entries
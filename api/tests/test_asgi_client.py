@@ -0,0 +1,85 @@
+"""
+Tests for the in-process test client (tests.utils.ASGIClient).
+
+The client replaces httpx.AsyncClient in the client fixture, so it must
+encode requests the way httpx does:
+- Non-ASCII query values (in the path or in params=)
+- List params sent as repeated keys
+- JSON bodies
+"""
+
+from typing import List, Optional
+
+import pytest
+from fastapi import FastAPI, Query
+
+from tests.utils import ASGIClient, assert_status_code
+
+echo_app = FastAPI()
+
+
+@echo_app.get("/echo/{name}")
+async def echo(
+    name: str,
+    priority: Optional[str] = None,
+    ids: List[int] = Query(default=[]),
+    flag: bool = False,
+):
+    return {"name": name, "priority": priority, "ids": ids, "flag": flag}
+
+
+@echo_app.post("/echo", status_code=201)
+async def echo_body(body: dict):
+    return body
+
+
+@pytest.fixture
+def echo_client() -> ASGIClient:
+    return ASGIClient(echo_app)
+
+
+class TestASGIClientQuery:
+    """Test query string encoding."""
+
+    async def test_non_ascii_query_in_path(self, echo_client: ASGIClient):
+        """Test a non-ASCII value written into the path's query string."""
+        # Act
+        response = await echo_client.get("/echo/a?priority=高")
+
+        # Assert
+        assert_status_code(response, 200)
+        assert response.json()["priority"] == "高"
+
+    async def test_non_ascii_path_and_params(self, echo_client: ASGIClient):
+        """Test non-ASCII path segments and params values."""
+        # Act
+        response = await echo_client.get("/echo/タスク", params={"priority": "低"})
+
+        # Assert
+        assert_status_code(response, 200)
+        assert response.json()["name"] == "タスク"
+        assert response.json()["priority"] == "低"
+
+    async def test_list_and_bool_params(self, echo_client: ASGIClient):
+        """Test list params become repeated keys and booleans true/false."""
+        # Act
+        response = await echo_client.get("/echo/a", params={"ids": [1, 2], "flag": True})
+
+        # Assert
+        assert_status_code(response, 200)
+        data = response.json()
+        assert data["ids"] == [1, 2]
+        assert data["flag"] is True
+
+
+class TestASGIClientBody:
+    """Test JSON request bodies."""
+
+    async def test_json_body(self, echo_client: ASGIClient):
+        """Test a JSON body with non-ASCII text round-trips."""
+        # Act
+        response = await echo_client.post("/echo", json={"name": "ジャンル", "n": 1})
+
+        # Assert
+        assert_status_code(response, 201)
+        assert response.json() == {"name": "ジャンル", "n": 1}
@@ -2,6 +2,7 @@
 Tests for Dashboard API endpoints.
 
 This test file covers:
+- Response structure of every endpoint
 - Dashboard summary (header data)
 - Today's schedule view
 - Kanban board data
@@ -18,35 +19,128 @@ Endpoints tested:
 - GET /api/v1/dashboard/stats - Statistics
 """
 
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from decimal import Decimal
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from tests.utils import assert_status_code
-
-
-class TestDashboardSummary:
-    """Test GET /api/v1/dashboard/summary"""
-
-    async def test_summary_empty_data(self, client: AsyncClient):
-        """Test summary with no data."""
+from tests.utils import (
+    ASGIClient,
+    assert_keys_in_bytes,
+    assert_query_count_le,
+    assert_status_code,
+)
+
+# Hour values used in arrange steps (built once instead of per call)
+HOURS_1 = Decimal("1.0")
+HOURS_1_5 = Decimal("1.5")
+HOURS_2 = Decimal("2.0")
+HOURS_3 = Decimal("3.0")
+HOURS_4 = Decimal("4.0")
+
+# Endpoint URLs (query parameters are passed with params=)
+SUMMARY = "/api/v1/dashboard/summary"
+TODAY = "/api/v1/dashboard/today"
+KANBAN = "/api/v1/dashboard/kanban"
+TIMELINE = "/api/v1/dashboard/timeline"
+WEEKLY = "/api/v1/dashboard/weekly"
+STATS = "/api/v1/dashboard/stats"
+
+
+@pytest.fixture
+async def running_timer(running_timer_factory):
+    """Create a task named "実行中タスク" with a running timer; returns (task, entry)."""
+    return await running_timer_factory(name="実行中タスク")
+
+
+def _today() -> str:
+    return str(date.today())
+
+
+def _dig(data: dict, path: str):
+    """Follow a dotted key path ("timer.is_running") into a JSON object."""
+    for key in path.split("."):
+        assert key in data, f"missing key {path!r}"
+        data = data[key]
+    return data
+
+
+class TestDashboardStructure:
+    """Response structure of every dashboard endpoint with no data."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "required_keys", "expected"),
+        [
+            pytest.param(
+                SUMMARY,
+                ("today", "this_week", "urgent", "timer"),
+                {"timer.is_running": False},
+                id="summary",
+            ),
+            pytest.param(
+                TODAY,
+                ("date", "timer", "schedules", "summary"),
+                {"date": _today, "schedules": [], "timer.is_running": False},
+                id="today",
+            ),
+            pytest.param(
+                KANBAN,
+                tuple(
+                    f"{section}.{status}"
+                    for section in ("columns", "counts")
+                    for status in ("todo", "doing", "waiting", "done")
+                ),
+                {},
+                id="kanban",
+            ),
+            pytest.param(
+                TIMELINE,
+                ("date", "planned", "actual"),
+                {"date": _today, "planned": [], "actual": []},
+                id="timeline",
+            ),
+            pytest.param(
+                WEEKLY,
+                ("week_start", "week_end", "daily", "totals"),
+                {},
+                id="weekly",
+            ),
+            pytest.param(
+                STATS,
+                (
+                    "period",
+                    "estimation_accuracy",
+                    "time_distribution",
+                    "completion_rate",
+                    "context_switches",
+                ),
+                {"period": "week"},
+                id="stats",
+            ),
+        ],
+    )
+    async def test_dashboard_sections_structure(
+        self, client: ASGIClient, endpoint: str, required_keys: tuple, expected: dict
+    ):
+        """Test each endpoint returns its sections; date-dependent values are callables."""
         # Act
-        response = await client.get("/api/v1/dashboard/summary")
+        response = await client.get(endpoint)
 
         # Assert
         assert_status_code(response, 200)
-        data = response.json()
-        assert "today" in data
-        assert "this_week" in data
-        assert "urgent" in data
-        assert "timer" in data
-        assert data["timer"]["is_running"] is False
+        assert_keys_in_bytes(response, {path.rsplit(".", 1)[-1] for path in required_keys})
+        if expected:
+            data = response.json()
+            for path, value in expected.items():
+                assert _dig(data, path) == (value() if callable(value) else value)
+
+
+class TestDashboardSummary:
+    """Test GET /api/v1/dashboard/summary"""
 
     async def test_summary_with_today_schedule(
-        self, client: AsyncClient, task_factory, schedule_factory
+        self, client: ASGIClient, task_factory, schedule_factory
     ):
         """Test summary with today's schedules."""
         # Arrange
@@ -54,11 +148,11 @@ class TestDashboardSummary:
         await schedule_factory(
             task_id=task.id,
             scheduled_date=date.today(),
-            allocated_hours=Decimal("2.0"),
+            allocated_hours=HOURS_2,
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/summary")
+        response = await client.get(SUMMARY)
 
         # Assert
         assert_status_code(response, 200)
@@ -67,20 +161,14 @@ class TestDashboardSummary:
         assert data["today"]["tasks_scheduled"] >= 1
 
     async def test_summary_with_today_time_entries(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_with_entry
     ):
         """Test summary with today's time entries."""
         # Arrange
-        task = await task_factory(name="作業タスク")
-        await time_entry_factory(
-            task_id=task.id,
-            start_time=datetime.now() - timedelta(hours=1),
-            end_time=datetime.now(),
-            duration_minutes=60,
-        )
+        await task_with_entry("作業タスク", minutes=60)
 
         # Act
-        response = await client.get("/api/v1/dashboard/summary")
+        response = await client.get(SUMMARY)
 
         # Assert
         assert_status_code(response, 200)
@@ -88,7 +176,7 @@ class TestDashboardSummary:
         assert float(data["today"]["actual_hours"]) >= 1.0
 
     async def test_summary_urgent_overdue_tasks(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test summary counts overdue tasks."""
         # Arrange
@@ -99,7 +187,7 @@ class TestDashboardSummary:
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/summary")
+        response = await client.get(SUMMARY)
 
         # Assert
         assert_status_code(response, 200)
@@ -107,7 +195,7 @@ class TestDashboardSummary:
         assert data["urgent"]["overdue_tasks"] >= 1
 
     async def test_summary_urgent_due_this_week(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test summary counts tasks due this week."""
         # Arrange
@@ -118,22 +206,17 @@ class TestDashboardSummary:
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/summary")
+        response = await client.get(SUMMARY)
 
         # Assert
         assert_status_code(response, 200)
         data = response.json()
         assert data["urgent"]["due_this_week"] >= 1
 
-    async def test_summary_timer_running(
-        self, client: AsyncClient, running_timer_factory
-    ):
+    async def test_summary_timer_running(self, client: ASGIClient, running_timer):
         """Test summary shows running timer."""
-        # Arrange
-        task, entry = await running_timer_factory(name="実行中タスク")
-
         # Act
-        response = await client.get("/api/v1/dashboard/summary")
+        response = await client.get(SUMMARY)
 
         # Assert
         assert_status_code(response, 200)
@@ -146,20 +229,8 @@ class TestDashboardSummary:
 class TestDashboardToday:
     """Test GET /api/v1/dashboard/today"""
 
-    async def test_today_empty(self, client: AsyncClient):
-        """Test today with no data."""
-        # Act
-        response = await client.get("/api/v1/dashboard/today")
-
-        # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        assert data["date"] == str(date.today())
-        assert data["schedules"] == []
-        assert data["timer"]["is_running"] is False
-
     async def test_today_with_schedules(
-        self, client: AsyncClient, task_factory, schedule_factory
+        self, client: ASGIClient, task_factory, schedule_factory
     ):
         """Test today with schedules."""
         # Arrange
@@ -168,13 +239,13 @@ class TestDashboardToday:
         await schedule_factory(
             task_id=task.id,
             scheduled_date=today,
-            allocated_hours=Decimal("1.5"),
+            allocated_hours=HOURS_1_5,
             start_time=today.replace(hour=9, minute=0),
             end_time=today.replace(hour=10, minute=30),
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/today")
+        response = await client.get(TODAY)
 
         # Assert
         assert_status_code(response, 200)
@@ -185,7 +256,13 @@ class TestDashboardToday:
         assert float(schedule["allocated_hours"]) == 1.5
 
     async def test_today_schedule_includes_project_genre(
-        self, client: AsyncClient, project_factory, genre_factory, task_factory, schedule_factory
+        self,
+        client: ASGIClient,
+        test_session: AsyncSession,
+        project_factory,
+        genre_factory,
+        task_factory,
+        schedule_factory,
     ):
         """Test today schedule includes project and genre info."""
         # Arrange
@@ -195,11 +272,12 @@ class TestDashboardToday:
         await schedule_factory(
             task_id=task.id,
             scheduled_date=date.today(),
-            allocated_hours=Decimal("1.0"),
+            allocated_hours=HOURS_1,
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/today")
+        with assert_query_count_le(test_session, 4):
+            response = await client.get(TODAY)
 
         # Assert
         assert_status_code(response, 200)
@@ -209,25 +287,19 @@ class TestDashboardToday:
         assert schedule["genre_color"] == "#FF5733"
 
     async def test_today_summary_calculations(
-        self, client: AsyncClient, task_factory, schedule_factory, time_entry_factory
+        self, client: ASGIClient, task_with_entry, schedule_factory
     ):
         """Test today summary calculations."""
         # Arrange
-        task = await task_factory(name="タスク")
+        task = await task_with_entry("タスク", minutes=60)
         await schedule_factory(
             task_id=task.id,
             scheduled_date=date.today(),
-            allocated_hours=Decimal("3.0"),
-        )
-        await time_entry_factory(
-            task_id=task.id,
-            start_time=datetime.now() - timedelta(hours=1),
-            end_time=datetime.now(),
-            duration_minutes=60,
+            allocated_hours=HOURS_3,
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/today")
+        response = await client.get(TODAY)
 
         # Assert
         assert_status_code(response, 200)
@@ -237,15 +309,10 @@ class TestDashboardToday:
         # remaining = planned - actual
         assert float(data["summary"]["remaining_hours"]) <= 2.0
 
-    async def test_today_timer_status(
-        self, client: AsyncClient, running_timer_factory
-    ):
+    async def test_today_timer_status(self, client: ASGIClient, running_timer):
         """Test today shows timer status."""
-        # Arrange
-        await running_timer_factory(name="実行中タスク")
-
         # Act
-        response = await client.get("/api/v1/dashboard/today")
+        response = await client.get(TODAY)
 
         # Assert
         assert_status_code(response, 200)
@@ -256,103 +323,72 @@ class TestDashboardToday:
 class TestDashboardKanban:
     """Test GET /api/v1/dashboard/kanban"""
 
-    async def test_kanban_structure(self, client: AsyncClient):
-        """Test kanban response structure."""
-        # Act
-        response = await client.get("/api/v1/dashboard/kanban")
-
-        # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        assert "columns" in data
-        assert "counts" in data
-        # Verify all status columns exist
-        assert "todo" in data["columns"]
-        assert "doing" in data["columns"]
-        assert "waiting" in data["columns"]
-        assert "done" in data["columns"]
-        # Verify counts structure
-        assert "todo" in data["counts"]
-        assert "doing" in data["counts"]
-        assert "waiting" in data["counts"]
-        assert "done" in data["counts"]
-
-    async def test_kanban_groups_by_status(self, client: AsyncClient, task_factory):
-        """Test kanban groups tasks by status."""
-        # Arrange
-        await task_factory(name="TODOタスク", status="todo")
-        await task_factory(name="DOINGタスク", status="doing")
-        await task_factory(name="WAITINGタスク", status="waiting")
-        await task_factory(name="DONEタスク", status="done")
-
-        # Act
-        response = await client.get("/api/v1/dashboard/kanban")
-
-        # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        assert len(data["columns"]["todo"]) >= 1
-        assert len(data["columns"]["doing"]) >= 1
-        assert len(data["columns"]["waiting"]) >= 1
-        assert len(data["columns"]["done"]) >= 1
-
-    async def test_kanban_excludes_archive(self, client: AsyncClient, task_factory):
-        """Test kanban excludes archived tasks."""
-        # Arrange
-        await task_factory(name="アーカイブタスク", status="archive")
-        await task_factory(name="通常タスク", status="todo")
+    @pytest.mark.parametrize("status", ["todo", "doing", "waiting", "done", "archive"])
+    async def test_kanban_status_groups(
+        self, seeded_client: ASGIClient, seeded_db, status: str
+    ):
+        """Test kanban groups and counts tasks by status and leaves out archived ones."""
+        # Arrange: seeded tasks cover every status
+        expected_ids = sorted(t.id for t in seeded_db["tasks"] if t.status == status)
+        assert expected_ids
 
         # Act
-        response = await client.get("/api/v1/dashboard/kanban")
+        response = await seeded_client.get(KANBAN)
 
         # Assert
         assert_status_code(response, 200)
         data = response.json()
-        all_tasks = (
-            data["columns"]["todo"]
-            + data["columns"]["doing"]
-            + data["columns"]["waiting"]
-            + data["columns"]["done"]
-        )
-        task_names = [t["name"] for t in all_tasks]
-        assert "アーカイブタスク" not in task_names
-        assert "通常タスク" in task_names
+        if status == "archive":
+            assert status not in data["columns"]
+            shown_ids = {t["id"] for column in data["columns"].values() for t in column}
+            assert shown_ids.isdisjoint(expected_ids)
+        else:
+            assert sorted(t["id"] for t in data["columns"][status]) == expected_ids
+            assert data["counts"][status] == len(expected_ids)
 
     async def test_kanban_includes_blocked_by(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self,
+        client: ASGIClient,
+        test_session: AsyncSession,
+        task_factory,
+        task_dependency_factory,
     ):
         """Test kanban includes blocked_by information."""
         # Arrange
-        blocking_task = await task_factory(name="ブロック元タスク", status="todo")
-        blocked_task = await task_factory(name="ブロックタスク", status="todo")
+        blocking_task, blocked_task = await task_factory.create_many([
+            {"name": "ブロック元タスク", "status": "todo"},
+            {"name": "ブロックタスク", "status": "todo"},
+        ])
         await task_dependency_factory(
             task_id=blocked_task.id, depends_on_task_id=blocking_task.id
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/kanban")
+        with assert_query_count_le(test_session, 4):
+            response = await client.get(KANBAN)
 
         # Assert
         assert_status_code(response, 200)
         data = response.json()
-        # Find blocked task
-        for task in data["columns"]["todo"]:
-            if task["name"] == "ブロックタスク":
-                assert "ブロック元タスク" in task["blocked_by"]
-                break
+        blocked = next(t for t in data["columns"]["todo"] if t["name"] == "ブロックタスク")
+        assert blocked["blocked_by"] == ["ブロック元タスク"]
 
     async def test_kanban_filter_by_project(
-        self, client: AsyncClient, project_factory, task_factory
+        self, client: ASGIClient, project_factory, task_factory
     ):
         """Test kanban filtering by project_id."""
         # Arrange
-        project = await project_factory(name="対象プロジェクト")
-        other_project = await project_factory(name="他のプロジェクト")
-        await task_factory(name="対象タスク", project_id=project.id, status="todo")
-        await task_factory(name="他タスク", project_id=other_project.id, status="todo")
+        project, other_project = await project_factory.create_many([
+            {"name": "対象プロジェクト"},
+            {"name": "他のプロジェクト"},
+        ])
+        await task_factory.create_many([
+            {"name": "対象タスク", "project_id": project.id, "status": "todo"},
+            {"name": "他タスク", "project_id": other_project.id, "status": "todo"},
+        ])
 
         # Act
-        response = await client.get(f"/api/v1/dashboard/kanban?project_id={project.id}")
+        response = await client.get(KANBAN, params={"project_id": project.id})
 
         # Assert
         assert_status_code(response, 200)
@@ -362,24 +398,13 @@ class TestDashboardKanban:
         assert "対象タスク" in task_names
         assert "他タスク" not in task_names
 
-    async def test_kanban_counts_correct(self, client: AsyncClient, task_factory):
-        """Test kanban counts are correct."""
-        # Arrange
-        await task_factory(name="TODO1", status="todo")
-        await task_factory(name="TODO2", status="todo")
-        await task_factory(name="DOING1", status="doing")
-
-        # Act
-        response = await client.get("/api/v1/dashboard/kanban")
-
-        # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        assert data["counts"]["todo"] >= 2
-        assert data["counts"]["doing"] >= 1
-
     async def test_kanban_task_includes_details(
-        self, client: AsyncClient, project_factory, genre_factory, task_factory
+        self,
+        client: ASGIClient,
+        test_session: AsyncSession,
+        project_factory,
+        genre_factory,
+        task_factory,
     ):
         """Test kanban task includes all required details."""
         # Arrange
@@ -390,12 +415,13 @@ class TestDashboardKanban:
             project_id=project.id,
             genre_id=genre.id,
             priority="高",
-            estimated_hours=Decimal("3.0"),
+            estimated_hours=HOURS_3,
             status="todo",
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/kanban")
+        with assert_query_count_le(test_session, 4):
+            response = await client.get(KANBAN)
 
         # Assert
         assert_status_code(response, 200)
@@ -414,22 +440,8 @@ class TestDashboardKanban:
 class TestDashboardTimeline:
     """Test GET /api/v1/dashboard/timeline"""
 
-    async def test_timeline_structure(self, client: AsyncClient):
-        """Test timeline response structure."""
-        # Act
-        response = await client.get("/api/v1/dashboard/timeline")
-
-        # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        assert data["date"] == str(date.today())
-        assert "planned" in data
-        assert "actual" in data
-        assert isinstance(data["planned"], list)
-        assert isinstance(data["actual"], list)
-
     async def test_timeline_planned_blocks(
-        self, client: AsyncClient, task_factory, schedule_factory
+        self, client: ASGIClient, task_factory, schedule_factory
     ):
         """Test timeline shows planned blocks from schedules."""
         # Arrange
@@ -440,11 +452,11 @@ class TestDashboardTimeline:
             scheduled_date=today,
             start_time=today.replace(hour=9, minute=0),
             end_time=today.replace(hour=11, minute=0),
-            allocated_hours=Decimal("2.0"),
+            allocated_hours=HOURS_2,
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/timeline")
+        response = await client.get(TIMELINE)
 
         # Assert
         assert_status_code(response, 200)
@@ -456,7 +468,7 @@ class TestDashboardTimeline:
         assert block["end"] == "11:00"
 
     async def test_timeline_actual_blocks(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test timeline shows actual blocks from time entries."""
         # Arrange
@@ -472,7 +484,7 @@ class TestDashboardTimeline:
         )
 
         # Act
-        response = await client.get("/api/v1/dashboard/timeline")
+        response = await client.get(TIMELINE)
 
         # Assert
         assert_status_code(response, 200)
@@ -482,7 +494,7 @@ class TestDashboardTimeline:
         assert block["task_name"] == "作業タスク"
 
     async def test_timeline_specific_date(
-        self, client: AsyncClient, task_factory, schedule_factory
+        self, client: ASGIClient, task_factory, schedule_factory
     ):
         """Test timeline for a specific date."""
         # Arrange
@@ -494,11 +506,11 @@ class TestDashboardTimeline:
             scheduled_date=target_dt,
             start_time=target_dt.replace(hour=10, minute=0),
             end_time=target_dt.replace(hour=12, minute=0),
-            allocated_hours=Decimal("2.0"),
+            allocated_hours=HOURS_2,
         )
 
         # Act
-        response = await client.get(f"/api/v1/dashboard/timeline?target_date={target_date}")
+        response = await client.get(TIMELINE, params={"target_date": str(target_date)})
 
         # Assert
         assert_status_code(response, 200)
@@ -510,108 +522,79 @@ class TestDashboardTimeline:
 class TestDashboardWeekly:
     """Test GET /api/v1/dashboard/weekly"""
 
-    async def test_weekly_empty(self, client: AsyncClient):
-        """Test weekly with no data."""
+    async def test_weekly_has_seven_days(self, client: ASGIClient):
+        """Test weekly always returns seven days, even with no data."""
         # Act
-        response = await client.get("/api/v1/dashboard/weekly")
+        response = await client.get(WEEKLY)
 
         # Assert
         assert_status_code(response, 200)
-        data = response.json()
-        assert "week_start" in data
-        assert "week_end" in data
-        assert "daily" in data
-        assert "totals" in data
-        assert len(data["daily"]) == 7  # Always 7 days
-
-    async def test_weekly_daily_data(
-        self, client: AsyncClient, task_factory, schedule_factory, time_entry_factory
+        assert len(response.json()["daily"]) == 7
+
+    @pytest.fixture
+    async def weekly_seed(
+        self,
+        client: ASGIClient,
+        project_factory,
+        genre_factory,
+        task_with_entry,
+        schedule_factory,
     ):
-        """Test weekly shows daily data."""
-        # Arrange
-        task = await task_factory(name="タスク")
-        today = date.today()
-        await schedule_factory(
-            task_id=task.id,
-            scheduled_date=today,
-            allocated_hours=Decimal("4.0"),
+        """Create one project/genre task with a schedule and time entry; return /weekly JSON."""
+        project = await project_factory(name="プロジェクトA")
+        genre = await genre_factory(name="リサーチ")
+        # Entry 10:00-12:00 today, so it starts today (and this week) at any run time
+        noon = datetime.combine(date.today(), time(12, 0))
+        task = await task_with_entry(
+            "タスク",
+            minutes=120,
+            ends_at=noon,
+            project_id=project.id,
+            genre_id=genre.id,
         )
-        await time_entry_factory(
+        await schedule_factory(
             task_id=task.id,
-            start_time=datetime.now() - timedelta(hours=2),
-            end_time=datetime.now(),
-            duration_minutes=120,
+            scheduled_date=date.today(),
+            allocated_hours=HOURS_4,
         )
 
-        # Act
-        response = await client.get("/api/v1/dashboard/weekly")
+        response = await client.get(WEEKLY)
+        assert_status_code(response, 200)
+        return response.json()
 
+    async def test_weekly_daily_data(self, weekly_seed):
+        """Test weekly shows daily data."""
         # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        # Find today in daily
-        today_data = next((d for d in data["daily"] if d["date"] == str(today)), None)
-        if today_data:
-            assert float(today_data["planned_hours"]) >= 4.0
-            assert float(today_data["actual_hours"]) >= 2.0
-
-    async def test_weekly_by_project(
-        self, client: AsyncClient, project_factory, task_factory, time_entry_factory
-    ):
-        """Test weekly totals by project."""
-        # Arrange
-        project = await project_factory(name="プロジェクトA")
-        task = await task_factory(name="タスク", project_id=project.id)
-        await time_entry_factory(
-            task_id=task.id,
-            start_time=datetime.now() - timedelta(hours=1),
-            end_time=datetime.now(),
-            duration_minutes=60,
+        today_data = next(
+            (d for d in weekly_seed["daily"] if d["date"] == str(date.today())), None
         )
+        assert today_data is not None
+        assert float(today_data["planned_hours"]) >= 4.0
+        assert float(today_data["actual_hours"]) >= 2.0
 
-        # Act
-        response = await client.get("/api/v1/dashboard/weekly")
-
+    async def test_weekly_by_project(self, weekly_seed):
+        """Test weekly totals by project."""
         # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        by_project = data["totals"]["by_project"]
+        by_project = weekly_seed["totals"]["by_project"]
         project_entry = next((p for p in by_project if p["name"] == "プロジェクトA"), None)
-        if project_entry:
-            assert float(project_entry["hours"]) >= 1.0
+        assert project_entry is not None
+        assert float(project_entry["hours"]) >= 1.0
 
-    async def test_weekly_by_genre(
-        self, client: AsyncClient, genre_factory, task_factory, time_entry_factory
-    ):
+    async def test_weekly_by_genre(self, weekly_seed):
         """Test weekly totals by genre."""
-        # Arrange
-        genre = await genre_factory(name="リサーチ")
-        task = await task_factory(name="タスク", genre_id=genre.id)
-        await time_entry_factory(
-            task_id=task.id,
-            start_time=datetime.now() - timedelta(hours=1),
-            end_time=datetime.now(),
-            duration_minutes=60,
-        )
-
-        # Act
-        response = await client.get("/api/v1/dashboard/weekly")
-
         # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        by_genre = data["totals"]["by_genre"]
+        by_genre = weekly_seed["totals"]["by_genre"]
         genre_entry = next((g for g in by_genre if g["name"] == "リサーチ"), None)
-        if genre_entry:
-            assert float(genre_entry["hours"]) >= 1.0
+        assert genre_entry is not None
+        assert float(genre_entry["hours"]) >= 1.0
 
-    async def test_weekly_custom_start_date(self, client: AsyncClient):
+    async def test_weekly_custom_start_date(self, client: ASGIClient):
         """Test weekly with custom week_start."""
         # Arrange
         last_monday = date.today() - timedelta(days=date.today().weekday() + 7)
 
         # Act
-        response = await client.get(f"/api/v1/dashboard/weekly?week_start={last_monday}")
+        response = await client.get(WEEKLY, params={"week_start": str(last_monday)})
 
         # Assert
         assert_status_code(response, 200)
@@ -622,58 +605,33 @@ class TestDashboardWeekly:
 class TestDashboardStats:
     """Test GET /api/v1/dashboard/stats"""
 
-    async def test_stats_empty(self, client: AsyncClient):
-        """Test stats with no data."""
+    @pytest.mark.parametrize(
+        ("period", "expected_period"),
+        [(None, "week"), ("week", "week"), ("month", "month"), ("quarter", "quarter")],
+    )
+    async def test_stats_periods(
+        self, client: ASGIClient, period: str | None, expected_period: str
+    ):
+        """Test stats with no data for each period (default: week)."""
         # Act
-        response = await client.get("/api/v1/dashboard/stats")
+        params = {"period": period} if period else {}
+        response = await client.get(STATS, params=params)
 
         # Assert
         assert_status_code(response, 200)
         data = response.json()
-        assert data["period"] == "week"
+        assert data["period"] == expected_period
         assert "estimation_accuracy" in data
         assert "time_distribution" in data
         assert "completion_rate" in data
         assert "context_switches" in data
 
-    async def test_stats_week_period(self, client: AsyncClient):
-        """Test stats with week period."""
-        # Act
-        response = await client.get("/api/v1/dashboard/stats?period=week")
-
-        # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        assert data["period"] == "week"
-
-    async def test_stats_month_period(self, client: AsyncClient):
-        """Test stats with month period."""
-        # Act
-        response = await client.get("/api/v1/dashboard/stats?period=month")
-
-        # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        assert data["period"] == "month"
-
-    async def test_stats_quarter_period(self, client: AsyncClient):
-        """Test stats with quarter period."""
-        # Act
-        response = await client.get("/api/v1/dashboard/stats?period=quarter")
-
-        # Assert
-        assert_status_code(response, 200)
-        data = response.json()
-        assert data["period"] == "quarter"
-
-    async def test_stats_completion_rate(self, client: AsyncClient, task_factory):
+    async def test_stats_completion_rate(self, seeded_client: ASGIClient, seeded_db):
         """Test stats completion rate calculation."""
-        # Arrange
-        await task_factory(name="完了タスク", status="done")
-        await task_factory(name="未完了タスク", status="todo")
+        # Arrange: seeded tasks include done and unfinished ones
 
         # Act
-        response = await client.get("/api/v1/dashboard/stats?period=week")
+        response = await seeded_client.get(STATS, params={"period": "week"})
 
         # Assert
         assert_status_code(response, 200)
@@ -684,21 +642,15 @@ class TestDashboardStats:
         assert 0 <= cr["percentage"] <= 100
 
     async def test_stats_time_distribution(
-        self, client: AsyncClient, genre_factory, task_factory, time_entry_factory
+        self, client: ASGIClient, genre_factory, task_with_entry
     ):
         """Test stats time distribution."""
         # Arrange
         genre = await genre_factory(name="リサーチ")
-        task = await task_factory(name="タスク", genre_id=genre.id)
-        await time_entry_factory(
-            task_id=task.id,
-            start_time=datetime.now() - timedelta(hours=2),
-            end_time=datetime.now(),
-            duration_minutes=120,
-        )
+        await task_with_entry("タスク", minutes=120, genre_id=genre.id)
 
         # Act
-        response = await client.get("/api/v1/dashboard/stats?period=week")
+        response = await client.get(STATS, params={"period": "week"})
 
         # Assert
         assert_status_code(response, 200)
@@ -708,36 +660,29 @@ class TestDashboardStats:
         assert "by_project" in dist
 
     async def test_stats_context_switches(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test stats context switches calculation."""
         # Arrange - Create multiple time entries to simulate context switches
-        task1 = await task_factory(name="タスク1")
-        task2 = await task_factory(name="タスク2")
+        task1, task2 = await task_factory.create_many([
+            {"name": "タスク1"},
+            {"name": "タスク2"},
+        ])
 
         now = datetime.now()
-        # Switch between tasks
-        await time_entry_factory(
-            task_id=task1.id,
-            start_time=now - timedelta(hours=4),
-            end_time=now - timedelta(hours=3),
-            duration_minutes=60,
-        )
-        await time_entry_factory(
-            task_id=task2.id,
-            start_time=now - timedelta(hours=3),
-            end_time=now - timedelta(hours=2),
-            duration_minutes=60,
-        )
-        await time_entry_factory(
-            task_id=task1.id,
-            start_time=now - timedelta(hours=2),
-            end_time=now - timedelta(hours=1),
-            duration_minutes=60,
-        )
-
-        # Act
-        response = await client.get("/api/v1/dashboard/stats?period=week")
+        # Switch between tasks (task1 -> task2 -> task1, one hour each)
+        await time_entry_factory.create_many([
+            {
+                "task_id": task_id,
+                "start_time": now - timedelta(hours=hours_ago),
+                "end_time": now - timedelta(hours=hours_ago - 1),
+                "duration_minutes": 60,
+            }
+            for task_id, hours_ago in ((task1.id, 4), (task2.id, 3), (task1.id, 2))
+        ])
+
+        # Act
+        response = await client.get(STATS, params={"period": "week"})
 
         # Assert
         assert_status_code(response, 200)
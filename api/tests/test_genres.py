@@ -13,11 +13,11 @@ Endpoints tested:
 """
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Genre
 from tests.utils import (
+    ASGIClient,
     assert_pagination_structure,
     assert_status_code,
     assert_validation_error,
@@ -28,7 +28,7 @@ from tests.utils import (
 class TestGenreCRUD:
     """Test standard CRUD operations for genres."""
 
-    async def test_create_genre_success(self, client: AsyncClient):
+    async def test_create_genre_success(self, client: ASGIClient):
         """Test creating a new genre."""
         # Arrange
         genre_data = {"name": "リサーチ", "color": "#4A90D9"}
@@ -44,7 +44,7 @@ class TestGenreCRUD:
         assert "id" in data
         assert "created_at" in data
 
-    async def test_create_genre_without_color(self, client: AsyncClient):
+    async def test_create_genre_without_color(self, client: ASGIClient):
         """Test creating genre without color field fails (color is required)."""
         # Arrange
         genre_data = {"name": "コーディング"}
@@ -55,7 +55,7 @@ class TestGenreCRUD:
         # Assert - color is required, so this should fail with 422
         assert_validation_error(response)
 
-    async def test_create_genre_missing_name(self, client: AsyncClient):
+    async def test_create_genre_missing_name(self, client: ASGIClient):
         """Test that creating genre without required name fails."""
         # Arrange
         genre_data = {"color": "#FF0000"}
@@ -66,7 +66,7 @@ class TestGenreCRUD:
         # Assert
         assert_validation_error(response)
 
-    async def test_list_genres_empty(self, client: AsyncClient):
+    async def test_list_genres_empty(self, client: ASGIClient):
         """Test listing genres when database is empty."""
         # Act
         response = await client.get("/api/v1/genres")
@@ -74,7 +74,7 @@ class TestGenreCRUD:
         # Assert
         assert_pagination_structure(response, expected_total=0)
 
-    async def test_list_genres_with_data(self, client: AsyncClient, genre_factory):
+    async def test_list_genres_with_data(self, client: ASGIClient, genre_factory):
         """Test listing multiple genres."""
         # Arrange
         await genre_factory(name="リサーチ", color="#4A90D9")
@@ -90,7 +90,7 @@ class TestGenreCRUD:
         assert len(data["items"]) == 3
 
     async def test_list_genres_with_pagination(
-        self, client: AsyncClient, genre_factory
+        self, client: ASGIClient, genre_factory
     ):
         """Test genre pagination."""
         # Arrange: Create 8 genres (default genres from design doc)
@@ -116,7 +116,7 @@ class TestGenreCRUD:
         assert len(data["items"]) == 5
         assert data["total"] == 8
 
-    async def test_get_genre_by_id(self, client: AsyncClient, genre_factory):
+    async def test_get_genre_by_id(self, client: ASGIClient, genre_factory):
         """Test getting a single genre by ID."""
         # Arrange
         genre = await genre_factory(name="リサーチ", color="#4A90D9")
@@ -131,7 +131,7 @@ class TestGenreCRUD:
         assert data["name"] == "リサーチ"
         assert data["color"] == "#4A90D9"
 
-    async def test_get_genre_not_found(self, client: AsyncClient):
+    async def test_get_genre_not_found(self, client: ASGIClient):
         """Test getting non-existent genre returns 404."""
         # Act
         response = await client.get("/api/v1/genres/99999")
@@ -139,7 +139,7 @@ class TestGenreCRUD:
         # Assert
         assert_status_code(response, 404)
 
-    async def test_update_genre_name(self, client: AsyncClient, genre_factory):
+    async def test_update_genre_name(self, client: ASGIClient, genre_factory):
         """Test updating genre name."""
         # Arrange
         genre = await genre_factory(name="OldName", color="#000000")
@@ -156,7 +156,7 @@ class TestGenreCRUD:
         assert data["name"] == "NewName"
         assert data["color"] == "#000000"  # Unchanged
 
-    async def test_update_genre_color(self, client: AsyncClient, genre_factory):
+    async def test_update_genre_color(self, client: ASGIClient, genre_factory):
         """Test updating genre color."""
         # Arrange
         genre = await genre_factory(name="Test", color="#000000")
@@ -173,7 +173,7 @@ class TestGenreCRUD:
         assert data["color"] == "#FF0000"
         assert data["name"] == "Test"  # Unchanged
 
-    async def test_update_genre_not_found(self, client: AsyncClient):
+    async def test_update_genre_not_found(self, client: ASGIClient):
         """Test updating non-existent genre returns 404."""
         # Act
         update_data = {"name": "NewName"}
@@ -183,7 +183,7 @@ class TestGenreCRUD:
         assert_status_code(response, 404)
 
     async def test_delete_genre(
-        self, client: AsyncClient, genre_factory, test_session: AsyncSession
+        self, client: ASGIClient, genre_factory, test_session: AsyncSession
     ):
         """Test deleting a genre."""
         # Arrange
@@ -200,7 +200,7 @@ class TestGenreCRUD:
         exists = await record_exists(test_session, Genre, genre_id)
         assert not exists
 
-    async def test_delete_genre_not_found(self, client: AsyncClient):
+    async def test_delete_genre_not_found(self, client: ASGIClient):
         """Test deleting non-existent genre returns 404."""
         # Act
         response = await client.delete("/api/v1/genres/99999")
@@ -213,7 +213,7 @@ class TestGenreSorting:
     """Test sorting functionality for genres."""
 
     async def test_sort_by_name_ascending(
-        self, client: AsyncClient, genre_factory
+        self, client: ASGIClient, genre_factory
     ):
         """Test sorting genres by name."""
         # Arrange
@@ -236,7 +236,7 @@ class TestGenreSorting:
 class TestGenreValidation:
     """Test validation rules for genres."""
 
-    async def test_create_with_invalid_color_format(self, client: AsyncClient):
+    async def test_create_with_invalid_color_format(self, client: ASGIClient):
         """Test creating genre with invalid hex color."""
         # Arrange
         genre_data = {"name": "Test", "color": "invalid-color"}
@@ -250,7 +250,7 @@ class TestGenreValidation:
         # If there's Pydantic validation, it will fail
         assert response.status_code in [201, 422]
 
-    async def test_create_with_very_long_name(self, client: AsyncClient):
+    async def test_create_with_very_long_name(self, client: ASGIClient):
         """Test creating genre with maximum length name (100 chars)."""
         # Arrange
         long_name = "あ" * 100  # Japanese characters
@@ -9,15 +9,14 @@ This is the simplest test file to verify the test infrastructure is working corr
 """
 
 import pytest
-from httpx import AsyncClient
 
-from tests.utils import assert_status_code
+from tests.utils import ASGIClient, assert_status_code
 
 
 class TestHealthCheck:
     """Test health check endpoint."""
 
-    async def test_health_check_returns_200(self, client: AsyncClient):
+    async def test_health_check_returns_200(self, client: ASGIClient):
         """Test that health check endpoint returns 200 status."""
         # Act
         response = await client.get("/health")
@@ -25,7 +24,7 @@ class TestHealthCheck:
         # Assert
         assert_status_code(response, 200)
 
-    async def test_health_check_returns_healthy_status(self, client: AsyncClient):
+    async def test_health_check_returns_healthy_status(self, client: ASGIClient):
         """Test that health check returns healthy status with database connection."""
         # Act
         response = await client.get("/health")
@@ -42,7 +41,7 @@ class TestHealthCheck:
         assert data["status"] == "healthy", "Expected healthy status"
         assert data["database"] == "connected", "Expected database to be connected"
 
-    async def test_health_check_no_error_field(self, client: AsyncClient):
+    async def test_health_check_no_error_field(self, client: ASGIClient):
         """Test that healthy response does not contain error field."""
         # Act
         response = await client.get("/health")
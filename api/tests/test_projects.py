@@ -15,11 +15,11 @@ Endpoints tested:
 from datetime import datetime, timedelta
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Project
 from tests.utils import (
+    ASGIClient,
     assert_pagination_structure,
     assert_partial_match,
     assert_sorted_by,
@@ -33,7 +33,7 @@ from tests.utils import (
 class TestProjectCRUD:
     """Test standard CRUD operations for projects."""
 
-    async def test_create_project_success(self, client: AsyncClient):
+    async def test_create_project_success(self, client: ASGIClient):
         """Test creating a new project with all required fields."""
         # Arrange
         project_data = {
@@ -57,7 +57,7 @@ class TestProjectCRUD:
         assert "updated_at" in data
 
     async def test_create_project_with_deadline(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test creating a project with optional deadline field."""
         # Arrange - use factory which properly handles datetime
@@ -77,7 +77,7 @@ class TestProjectCRUD:
         assert "deadline" in data
         assert data["deadline"] is not None
 
-    async def test_create_project_missing_name(self, client: AsyncClient):
+    async def test_create_project_missing_name(self, client: ASGIClient):
         """Test that creating a project without required name field fails."""
         # Arrange
         project_data = {"description": "No name provided"}
@@ -88,7 +88,7 @@ class TestProjectCRUD:
         # Assert
         assert_validation_error(response)
 
-    async def test_list_projects_empty(self, client: AsyncClient):
+    async def test_list_projects_empty(self, client: ASGIClient):
         """Test listing projects when database is empty."""
         # Act
         response = await client.get("/api/v1/projects")
@@ -99,7 +99,7 @@ class TestProjectCRUD:
         assert data["items"] == []
 
     async def test_list_projects_with_single_project(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test listing projects with one project in database."""
         # Arrange
@@ -116,7 +116,7 @@ class TestProjectCRUD:
         assert data["items"][0]["name"] == "Single Project"
 
     async def test_list_projects_with_pagination(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test pagination with skip and limit parameters."""
         # Arrange: Create 15 projects
@@ -145,7 +145,7 @@ class TestProjectCRUD:
         assert data["skip"] == 10
 
     async def test_list_projects_pagination_beyond_total(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test pagination when skip exceeds total records."""
         # Arrange
@@ -159,7 +159,7 @@ class TestProjectCRUD:
         data = response.json()
         assert len(data["items"]) == 0
 
-    async def test_get_project_by_id(self, client: AsyncClient, project_factory):
+    async def test_get_project_by_id(self, client: ASGIClient, project_factory):
         """Test getting a single project by ID."""
         # Arrange
         project = await project_factory(
@@ -176,7 +176,7 @@ class TestProjectCRUD:
         assert data["name"] == "Test Project"
         assert data["description"] == "Test Description"
 
-    async def test_get_project_not_found(self, client: AsyncClient):
+    async def test_get_project_not_found(self, client: ASGIClient):
         """Test getting non-existent project returns 404."""
         # Act
         response = await client.get("/api/v1/projects/99999")
@@ -185,7 +185,7 @@ class TestProjectCRUD:
         assert_status_code(response, 404)
 
     async def test_update_project_partial(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test partial update of project fields."""
         # Arrange
@@ -209,7 +209,7 @@ class TestProjectCRUD:
         assert data["is_active"] is True  # Unchanged
 
     async def test_update_project_multiple_fields(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test updating multiple fields at once."""
         # Arrange
@@ -232,7 +232,7 @@ class TestProjectCRUD:
         data = response.json()
         assert_partial_match(update_data, data)
 
-    async def test_update_project_not_found(self, client: AsyncClient):
+    async def test_update_project_not_found(self, client: ASGIClient):
         """Test updating non-existent project returns 404."""
         # Act
         update_data = {"name": "New Name"}
@@ -242,7 +242,7 @@ class TestProjectCRUD:
         assert_status_code(response, 404)
 
     async def test_delete_project(
-        self, client: AsyncClient, project_factory, test_session: AsyncSession
+        self, client: ASGIClient, project_factory, test_session: AsyncSession
     ):
         """Test deleting a project."""
         # Arrange
@@ -263,7 +263,7 @@ class TestProjectCRUD:
         get_response = await client.get(f"/api/v1/projects/{project_id}")
         assert_status_code(get_response, 404)
 
-    async def test_delete_project_not_found(self, client: AsyncClient):
+    async def test_delete_project_not_found(self, client: ASGIClient):
         """Test deleting non-existent project returns 404."""
         # Act
         response = await client.delete("/api/v1/projects/99999")
@@ -276,7 +276,7 @@ class TestProjectSorting:
     """Test sorting functionality for project listings."""
 
     async def test_sort_by_name_ascending(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test sorting projects by name in ascending order."""
         # Arrange
@@ -293,7 +293,7 @@ class TestProjectSorting:
         assert_sorted_by(data["items"], "name", descending=False)
 
     async def test_sort_by_name_descending(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test sorting projects by name in descending order."""
         # Arrange
@@ -310,7 +310,7 @@ class TestProjectSorting:
         assert_sorted_by(data["items"], "name", descending=True)
 
     async def test_sort_by_created_at_descending(
-        self, client: AsyncClient, project_factory
+        self, client: ASGIClient, project_factory
     ):
         """Test sorting projects by created_at (most recent first)."""
         # Arrange
@@ -333,7 +333,7 @@ class TestProjectSorting:
 class TestProjectValidation:
     """Test validation error handling."""
 
-    async def test_create_with_invalid_field_type(self, client: AsyncClient):
+    async def test_create_with_invalid_field_type(self, client: ASGIClient):
         """Test creating project with wrong field type."""
         # Arrange
         project_data = {
@@ -347,7 +347,7 @@ class TestProjectValidation:
         # Assert
         assert_validation_error(response)
 
-    async def test_create_with_extra_unknown_field(self, client: AsyncClient):
+    async def test_create_with_extra_unknown_field(self, client: ASGIClient):
         """Test that extra unknown fields are ignored or rejected."""
         # Arrange
         project_data = {
@@ -368,7 +368,7 @@ class TestProjectValidation:
 class TestProjectEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    async def test_create_project_with_very_long_name(self, client: AsyncClient):
+    async def test_create_project_with_very_long_name(self, client: ASGIClient):
         """Test creating project with maximum length name."""
         # Arrange: Max length is 200 characters
         long_name = "A" * 200
@@ -383,7 +383,7 @@ class TestProjectEdgeCases:
         assert data["name"] == long_name
 
     async def test_create_project_with_empty_description(
-        self, client: AsyncClient
+        self, client: ASGIClient
     ):
         """Test creating project with empty description."""
         # Arrange
@@ -398,7 +398,7 @@ class TestProjectEdgeCases:
         assert data["description"] == ""
 
     async def test_create_project_with_null_description(
-        self, client: AsyncClient
+        self, client: ASGIClient
     ):
         """Test creating project with null description."""
         # Arrange
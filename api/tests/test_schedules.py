@@ -16,11 +16,11 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Schedule
 from tests.utils import (
+    ASGIClient,
     assert_pagination_structure,
     assert_status_code,
     assert_validation_error,
@@ -33,7 +33,7 @@ class TestScheduleCRUD:
     """Test standard CRUD operations for schedules."""
 
     async def test_create_schedule_success(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test creating a new schedule."""
         # Arrange
@@ -55,7 +55,7 @@ class TestScheduleCRUD:
         assert "created_at" in data
 
     async def test_create_schedule_with_time_slots(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test creating schedule with start and end times."""
         # Arrange
@@ -77,7 +77,7 @@ class TestScheduleCRUD:
         # Assert
         assert_status_code(response, 201)
 
-    async def test_create_schedule_missing_task_id(self, client: AsyncClient):
+    async def test_create_schedule_missing_task_id(self, client: ASGIClient):
         """Test that creating schedule without task_id fails."""
         # Arrange
         schedule_data = {
@@ -91,7 +91,7 @@ class TestScheduleCRUD:
         # Assert
         assert_validation_error(response)
 
-    async def test_list_schedules_empty(self, client: AsyncClient):
+    async def test_list_schedules_empty(self, client: ASGIClient):
         """Test listing schedules when database is empty."""
         # Act
         response = await client.get("/api/v1/schedules")
@@ -100,7 +100,7 @@ class TestScheduleCRUD:
         assert_pagination_structure(response, expected_total=0)
 
     async def test_list_schedules_with_data(
-        self, client: AsyncClient, task_factory, schedule_factory
+        self, client: ASGIClient, task_factory, schedule_factory
     ):
         """Test listing multiple schedules."""
         # Arrange
@@ -116,7 +116,7 @@ class TestScheduleCRUD:
         assert_pagination_structure(response, expected_total=3)
 
     async def test_get_schedule_by_id(
-        self, client: AsyncClient, task_factory, schedule_factory
+        self, client: ASGIClient, task_factory, schedule_factory
     ):
         """Test getting a single schedule by ID."""
         # Arrange
@@ -132,7 +132,7 @@ class TestScheduleCRUD:
         assert data["id"] == schedule.id
         assert data["task_id"] == task.id
 
-    async def test_get_schedule_not_found(self, client: AsyncClient):
+    async def test_get_schedule_not_found(self, client: ASGIClient):
         """Test getting non-existent schedule returns 404."""
         # Act
         response = await client.get("/api/v1/schedules/99999")
@@ -141,7 +141,7 @@ class TestScheduleCRUD:
         assert_status_code(response, 404)
 
     async def test_update_schedule_allocated_hours(
-        self, client: AsyncClient, task_factory, schedule_factory
+        self, client: ASGIClient, task_factory, schedule_factory
     ):
         """Test updating schedule allocated_hours."""
         # Arrange
@@ -162,7 +162,7 @@ class TestScheduleCRUD:
         assert float(data["allocated_hours"]) == 4.0
 
     async def test_delete_schedule(
-        self, client: AsyncClient, task_factory, schedule_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, schedule_factory, test_session: AsyncSession
     ):
         """Test deleting a schedule."""
         # Arrange
@@ -185,7 +185,7 @@ class TestScheduleFiltering:
     """Test filtering schedules by task."""
 
     async def test_filter_by_task_id(
-        self, client: AsyncClient, task_factory, schedule_factory
+        self, client: ASGIClient, task_factory, schedule_factory
     ):
         """Test filtering schedules by task_id."""
         # Arrange
@@ -212,7 +212,7 @@ class TestScheduleFiltering:
 class TestScheduleForeignKeys:
     """Test foreign key constraint behaviors."""
 
-    async def test_create_schedule_with_invalid_task_id(self, client: AsyncClient):
+    async def test_create_schedule_with_invalid_task_id(self, client: ASGIClient):
         """Test creating schedule with non-existent task_id."""
         # Arrange
         schedule_data = {
@@ -229,7 +229,7 @@ class TestScheduleForeignKeys:
         assert response.status_code in [400, 422, 500]
 
     async def test_delete_task_with_schedules_fails(
-        self, client: AsyncClient, task_factory, schedule_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, schedule_factory, test_session: AsyncSession
     ):
         """Test that deleting task with schedules fails due to FK constraint.
 
@@ -13,12 +13,12 @@ Endpoints tested:
 """
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Setting
 from tests.utils import (
+    ASGIClient,
     assert_pagination_structure,
     assert_status_code,
     get_records_by_field,
@@ -28,7 +28,7 @@ from tests.utils import (
 class TestSettingsKeyBased:
     """Test key-based access pattern for settings."""
 
-    async def test_list_settings_empty(self, client: AsyncClient):
+    async def test_list_settings_empty(self, client: ASGIClient):
         """Test listing settings when database is empty."""
         # Act
         response = await client.get("/api/v1/settings")
@@ -37,7 +37,7 @@ class TestSettingsKeyBased:
         assert_pagination_structure(response, expected_total=0)
 
     async def test_list_settings_with_data(
-        self, client: AsyncClient, setting_factory
+        self, client: ASGIClient, setting_factory
     ):
         """Test listing multiple settings."""
         # Arrange
@@ -52,7 +52,7 @@ class TestSettingsKeyBased:
         assert_pagination_structure(response, expected_total=3)
 
     async def test_get_setting_by_key(
-        self, client: AsyncClient, setting_factory
+        self, client: ASGIClient, setting_factory
     ):
         """Test getting a setting by key."""
         # Arrange
@@ -67,7 +67,7 @@ class TestSettingsKeyBased:
         assert data["key"] == "max_hours"
         assert data["value"] == '{"hours": 8}'
 
-    async def test_get_setting_key_not_found(self, client: AsyncClient):
+    async def test_get_setting_key_not_found(self, client: ASGIClient):
         """Test getting non-existent setting returns 404."""
         # Act
         response = await client.get("/api/v1/settings/nonexistent_key")
@@ -76,7 +76,7 @@ class TestSettingsKeyBased:
         assert_status_code(response, 404)
 
     async def test_upsert_setting_create_new(
-        self, client: AsyncClient, test_session: AsyncSession
+        self, client: ASGIClient, test_session: AsyncSession
     ):
         """Test PUT to create a new setting (upsert behavior)."""
         # Arrange
@@ -104,7 +104,7 @@ class TestSettingsKeyBased:
         assert len(settings) == 1
 
     async def test_upsert_setting_update_existing(
-        self, client: AsyncClient, setting_factory
+        self, client: ASGIClient, setting_factory
     ):
         """Test PUT to update an existing setting (upsert behavior)."""
         # Arrange
@@ -126,7 +126,7 @@ class TestSettingsKeyBased:
         assert data["value"] == '{"new": "value"}'
 
     async def test_patch_setting_by_key(
-        self, client: AsyncClient, setting_factory
+        self, client: ASGIClient, setting_factory
     ):
         """Test PATCH to partially update setting."""
         # Arrange
@@ -144,7 +144,7 @@ class TestSettingsKeyBased:
         assert data["value"] == '{"mode": "dark"}'
         assert data["description"] == "テーマ設定"  # Unchanged
 
-    async def test_patch_setting_not_found(self, client: AsyncClient):
+    async def test_patch_setting_not_found(self, client: ASGIClient):
         """Test PATCH on non-existent setting returns 404."""
         # Act
         update_data = {"value": '{"test": true}'}
@@ -156,7 +156,7 @@ class TestSettingsKeyBased:
         assert_status_code(response, 404)
 
     async def test_delete_setting_by_key(
-        self, client: AsyncClient, setting_factory, test_session: AsyncSession
+        self, client: ASGIClient, setting_factory, test_session: AsyncSession
     ):
         """Test deleting a setting by key."""
         # Arrange
@@ -174,7 +174,7 @@ class TestSettingsKeyBased:
         )
         assert len(settings) == 0
 
-    async def test_delete_setting_not_found(self, client: AsyncClient):
+    async def test_delete_setting_not_found(self, client: ASGIClient):
         """Test deleting non-existent setting returns 404."""
         # Act
         response = await client.delete("/api/v1/settings/nonexistent")
@@ -186,7 +186,7 @@ class TestSettingsKeyBased:
 class TestSettingsValidation:
     """Test validation rules for settings."""
 
-    async def test_create_setting_missing_value(self, client: AsyncClient):
+    async def test_create_setting_missing_value(self, client: ASGIClient):
         """Test creating setting without value field."""
         # Arrange
         setting_data = {
@@ -203,7 +203,7 @@ class TestSettingsValidation:
         assert response.status_code in [200, 422]
 
     async def test_create_setting_with_json_value(
-        self, client: AsyncClient
+        self, client: ASGIClient
     ):
         """Test creating setting with valid JSON value."""
         # Arrange
@@ -223,7 +223,7 @@ class TestSettingsValidation:
         assert data["value"] == '{"nested": {"key": "value"}, "array": [1, 2, 3]}'
 
     async def test_create_setting_with_empty_value(
-        self, client: AsyncClient
+        self, client: ASGIClient
     ):
         """Test creating setting with empty string value."""
         # Arrange
@@ -245,7 +245,7 @@ class TestSettingsEdgeCases:
     """Test edge cases for settings."""
 
     async def test_upsert_same_setting_multiple_times(
-        self, client: AsyncClient, test_session: AsyncSession
+        self, client: ASGIClient, test_session: AsyncSession
     ):
         """Test upserting the same setting multiple times."""
         # Arrange
@@ -273,7 +273,7 @@ class TestSettingsEdgeCases:
         assert settings[0].value == '{"count": 3}'
 
     async def test_create_setting_with_very_long_key(
-        self, client: AsyncClient
+        self, client: ASGIClient
     ):
         """Test creating setting with maximum length key (100 chars)."""
         # Arrange
@@ -13,16 +13,15 @@ Endpoints tested:
 """
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from tests.utils import assert_status_code
+from tests.utils import ASGIClient, assert_status_code
 
 
 class TestGetDependencies:
     """Test GET /api/v1/tasks/{id}/dependencies"""
 
-    async def test_get_dependencies_empty(self, client: AsyncClient, task_factory):
+    async def test_get_dependencies_empty(self, client: ASGIClient, task_factory):
         """Test getting dependencies for task with no dependencies."""
         # Arrange
         task = await task_factory(name="独立タスク")
@@ -37,7 +36,7 @@ class TestGetDependencies:
         assert data["blocking"] == []
 
     async def test_get_dependencies_with_depends_on(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test getting tasks that this task depends on."""
         # Arrange
@@ -58,7 +57,7 @@ class TestGetDependencies:
         assert data["blocking"] == []
 
     async def test_get_dependencies_with_blocking(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test getting tasks that are blocked by this task."""
         # Arrange
@@ -79,7 +78,7 @@ class TestGetDependencies:
         assert data["blocking"][0]["name"] == "タスクB"
 
     async def test_get_dependencies_both_directions(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test task with both depends_on and blocking relationships."""
         # Arrange
@@ -101,7 +100,7 @@ class TestGetDependencies:
         assert len(data["blocking"]) == 1
         assert data["blocking"][0]["id"] == task_c.id
 
-    async def test_get_dependencies_task_not_found(self, client: AsyncClient):
+    async def test_get_dependencies_task_not_found(self, client: ASGIClient):
         """Test getting dependencies for non-existent task."""
         # Act
         response = await client.get("/api/v1/tasks/99999/dependencies")
@@ -110,7 +109,7 @@ class TestGetDependencies:
         assert_status_code(response, 404)
 
     async def test_get_dependencies_multiple_deps(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test task depending on multiple tasks."""
         # Arrange
@@ -136,7 +135,7 @@ class TestGetDependencies:
 class TestAddDependency:
     """Test POST /api/v1/tasks/{id}/dependencies"""
 
-    async def test_add_dependency_success(self, client: AsyncClient, task_factory):
+    async def test_add_dependency_success(self, client: ASGIClient, task_factory):
         """Test successfully adding a dependency."""
         # Arrange
         task_a = await task_factory(name="タスクA")
@@ -154,7 +153,7 @@ class TestAddDependency:
         assert data["message"] == "Dependency added successfully"
 
     async def test_add_dependency_creates_record(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test that adding dependency creates the relationship."""
         # Arrange
@@ -175,7 +174,7 @@ class TestAddDependency:
         assert len(data["depends_on"]) == 1
         assert data["depends_on"][0]["id"] == task_a.id
 
-    async def test_add_dependency_self_reference(self, client: AsyncClient, task_factory):
+    async def test_add_dependency_self_reference(self, client: ASGIClient, task_factory):
         """Test that self-reference is rejected."""
         # Arrange
         task = await task_factory(name="タスク")
@@ -190,7 +189,7 @@ class TestAddDependency:
         assert_status_code(response, 422)
         assert "cannot depend on itself" in response.json()["detail"].lower()
 
-    async def test_add_dependency_task_not_found(self, client: AsyncClient, task_factory):
+    async def test_add_dependency_task_not_found(self, client: ASGIClient, task_factory):
         """Test adding dependency when task doesn't exist."""
         # Arrange
         task_a = await task_factory(name="タスクA")
@@ -205,7 +204,7 @@ class TestAddDependency:
         assert_status_code(response, 404)
 
     async def test_add_dependency_depends_on_not_found(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test adding dependency when depends_on task doesn't exist."""
         # Arrange
@@ -221,7 +220,7 @@ class TestAddDependency:
         assert_status_code(response, 404)
 
     async def test_add_dependency_cycle_direct(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test that direct cycle (A -> B -> A) is rejected."""
         # Arrange
@@ -241,7 +240,7 @@ class TestAddDependency:
         assert "cycle" in response.json()["detail"].lower()
 
     async def test_add_dependency_cycle_indirect(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test that indirect cycle (A -> B -> C -> A) is rejected."""
         # Arrange
@@ -263,7 +262,7 @@ class TestAddDependency:
         assert "cycle" in response.json()["detail"].lower()
 
     async def test_add_dependency_no_false_cycle_detection(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test that valid dependencies are not rejected as cycles."""
         # Arrange: A -> B, A -> C (fan-out pattern, no cycle)
@@ -286,7 +285,7 @@ class TestRemoveDependency:
     """Test DELETE /api/v1/tasks/{id}/dependencies/{dep_id}"""
 
     async def test_remove_dependency_success(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test successfully removing a dependency."""
         # Arrange
@@ -303,7 +302,7 @@ class TestRemoveDependency:
         assert_status_code(response, 204)
 
     async def test_remove_dependency_actually_removes(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test that removing dependency actually removes the relationship."""
         # Arrange
@@ -322,7 +321,7 @@ class TestRemoveDependency:
         assert data["depends_on"] == []
 
     async def test_remove_dependency_not_found(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test removing non-existent dependency."""
         # Arrange
@@ -338,7 +337,7 @@ class TestRemoveDependency:
         # Assert
         assert_status_code(response, 404)
 
-    async def test_remove_dependency_task_not_found(self, client: AsyncClient):
+    async def test_remove_dependency_task_not_found(self, client: ASGIClient):
         """Test removing dependency from non-existent task."""
         # Act
         response = await client.delete("/api/v1/tasks/99999/dependencies/1")
@@ -351,7 +350,7 @@ class TestDependencyChainScenarios:
     """Test complex dependency chain scenarios."""
 
     async def test_deep_dependency_chain(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test deep dependency chain (A -> B -> C -> D -> E)."""
         # Arrange
@@ -377,7 +376,7 @@ class TestDependencyChainScenarios:
         assert "cycle" in response.json()["detail"].lower()
 
     async def test_diamond_dependency_pattern(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test diamond pattern (A -> B, A -> C, B -> D, C -> D) - no cycle."""
         # Arrange
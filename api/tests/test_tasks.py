@@ -20,12 +20,12 @@ Endpoints tested:
 from decimal import Decimal
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Project, Task
 from tests.utils import (
+    ASGIClient,
     assert_pagination_structure,
     assert_status_code,
     assert_validation_error,
@@ -37,7 +37,7 @@ from tests.utils import (
 class TestTaskCRUD:
     """Test standard CRUD operations for tasks."""
 
-    async def test_create_task_minimal(self, client: AsyncClient):
+    async def test_create_task_minimal(self, client: ASGIClient):
         """Test creating task with only required fields."""
         # Arrange
         task_data = {"name": "研究タスク"}
@@ -54,7 +54,7 @@ class TestTaskCRUD:
         assert "id" in data
 
     async def test_create_task_with_project_and_genre(
-        self, client: AsyncClient, project_factory, genre_factory
+        self, client: ASGIClient, project_factory, genre_factory
     ):
         """Test creating task with project and genre references."""
         # Arrange
@@ -75,7 +75,7 @@ class TestTaskCRUD:
         assert data["project_id"] == project.id
         assert data["genre_id"] == genre.id
 
-    async def test_create_task_with_all_fields(self, client: AsyncClient):
+    async def test_create_task_with_all_fields(self, client: ASGIClient):
         """Test creating task with all optional fields."""
         # Arrange
         task_data = {
@@ -101,7 +101,7 @@ class TestTaskCRUD:
         assert data["want_level"] == "高"
         assert data["note"] == "テストメモ"
 
-    async def test_create_task_missing_name(self, client: AsyncClient):
+    async def test_create_task_missing_name(self, client: ASGIClient):
         """Test that creating task without name fails."""
         # Arrange
         task_data = {"status": "todo"}
@@ -112,7 +112,7 @@ class TestTaskCRUD:
         # Assert
         assert_validation_error(response)
 
-    async def test_list_tasks_empty(self, client: AsyncClient):
+    async def test_list_tasks_empty(self, client: ASGIClient):
         """Test listing tasks when database is empty."""
         # Act
         response = await client.get("/api/v1/tasks")
@@ -120,7 +120,7 @@ class TestTaskCRUD:
         # Assert
         assert_pagination_structure(response, expected_total=0)
 
-    async def test_list_tasks_with_data(self, client: AsyncClient, task_factory):
+    async def test_list_tasks_with_data(self, client: ASGIClient, task_factory):
         """Test listing multiple tasks."""
         # Arrange
         await task_factory(name="タスク1")
@@ -133,7 +133,7 @@ class TestTaskCRUD:
         # Assert
         assert_pagination_structure(response, expected_total=3)
 
-    async def test_get_task_by_id(self, client: AsyncClient, task_factory):
+    async def test_get_task_by_id(self, client: ASGIClient, task_factory):
         """Test getting a single task by ID."""
         # Arrange
         task = await task_factory(name="テストタスク", priority="高")
@@ -148,7 +148,7 @@ class TestTaskCRUD:
         assert data["name"] == "テストタスク"
         assert data["priority"] == "高"
 
-    async def test_get_task_not_found(self, client: AsyncClient):
+    async def test_get_task_not_found(self, client: ASGIClient):
         """Test getting non-existent task returns 404."""
         # Act
         response = await client.get("/api/v1/tasks/99999")
@@ -156,7 +156,7 @@ class TestTaskCRUD:
         # Assert
         assert_status_code(response, 404)
 
-    async def test_update_task_status(self, client: AsyncClient, task_factory):
+    async def test_update_task_status(self, client: ASGIClient, task_factory):
         """Test updating task status."""
         # Arrange
         task = await task_factory(name="タスク", status="todo")
@@ -171,7 +171,7 @@ class TestTaskCRUD:
         assert data["status"] == "doing"
 
     async def test_update_task_multiple_fields(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test updating multiple task fields at once."""
         # Arrange
@@ -189,7 +189,7 @@ class TestTaskCRUD:
         assert data["want_level"] == "高"
 
     async def test_delete_task(
-        self, client: AsyncClient, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, test_session: AsyncSession
     ):
         """Test deleting a task."""
         # Arrange
@@ -211,7 +211,7 @@ class TestTaskFiltering:
     """Test advanced filtering capabilities for task listings."""
 
     async def test_filter_by_project_id(
-        self, client: AsyncClient, task_factory, project_factory
+        self, client: ASGIClient, task_factory, project_factory
     ):
         """Test filtering tasks by project_id."""
         # Arrange
@@ -235,7 +235,7 @@ class TestTaskFiltering:
         assert task3.id not in task_ids
 
     async def test_filter_by_genre_id(
-        self, client: AsyncClient, task_factory, genre_factory
+        self, client: ASGIClient, task_factory, genre_factory
     ):
         """Test filtering tasks by genre_id."""
         # Arrange
@@ -254,7 +254,7 @@ class TestTaskFiltering:
         assert data["total"] == 1
         assert data["items"][0]["id"] == task1.id
 
-    async def test_filter_by_status(self, client: AsyncClient, task_factory):
+    async def test_filter_by_status(self, client: ASGIClient, task_factory):
         """Test filtering tasks by status."""
         # Arrange
         await task_factory(name="Todo1", status="todo")
@@ -271,7 +271,7 @@ class TestTaskFiltering:
         assert data["total"] == 2
         assert all(item["status"] == "todo" for item in data["items"])
 
-    async def test_filter_by_priority(self, client: AsyncClient, task_factory):
+    async def test_filter_by_priority(self, client: ASGIClient, task_factory):
         """Test filtering tasks by priority."""
         # Arrange
         await task_factory(name="高優先度1", priority="高")
@@ -289,7 +289,7 @@ class TestTaskFiltering:
         assert all(item["priority"] == "高" for item in data["items"])
 
     async def test_filter_by_has_parent_true(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test filtering tasks that have parent (subtasks)."""
         # Arrange
@@ -312,7 +312,7 @@ class TestTaskFiltering:
         assert standalone.id not in task_ids
 
     async def test_filter_by_has_parent_false(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test filtering tasks without parent (top-level tasks)."""
         # Arrange
@@ -333,7 +333,7 @@ class TestTaskFiltering:
         assert child.id not in task_ids
 
     async def test_filter_by_parent_task_id(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test filtering tasks by specific parent_task_id."""
         # Arrange
@@ -356,7 +356,7 @@ class TestTaskFiltering:
         assert child2.id not in task_ids
 
     async def test_filter_combined_filters(
-        self, client: AsyncClient, task_factory, project_factory
+        self, client: ASGIClient, task_factory, project_factory
     ):
         """Test combining multiple filters."""
         # Arrange
@@ -387,7 +387,7 @@ class TestTaskHierarchy:
     """Test hierarchical task relationships (parent/child)."""
 
     async def test_create_subtask(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test creating a subtask with parent_task_id."""
         # Arrange
@@ -409,7 +409,7 @@ class TestTaskHierarchy:
         assert data["decomposition_level"] == 1
 
     async def test_get_task_children(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test specialized endpoint GET /tasks/{id}/children."""
         # Arrange
@@ -436,7 +436,7 @@ class TestTaskHierarchy:
         assert other_child.id not in child_ids
 
     async def test_get_children_of_task_without_children(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test getting children of task that has no children."""
         # Arrange
@@ -451,7 +451,7 @@ class TestTaskHierarchy:
         assert data == []
 
     async def test_delete_parent_task_with_children_fails(
-        self, client: AsyncClient, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, test_session: AsyncSession
     ):
         """Test that deleting a parent task with children fails due to FK constraint.
 
@@ -475,7 +475,7 @@ class TestTaskHierarchy:
 class TestTaskForeignKeys:
     """Test foreign key constraint behaviors."""
 
-    async def test_create_task_with_invalid_project_id(self, client: AsyncClient):
+    async def test_create_task_with_invalid_project_id(self, client: ASGIClient):
         """Test creating task with non-existent project_id."""
         # Arrange
         task_data = {
@@ -490,7 +490,7 @@ class TestTaskForeignKeys:
         # Foreign key constraint violation should return error
         assert response.status_code in [400, 422, 500]
 
-    async def test_create_task_with_invalid_genre_id(self, client: AsyncClient):
+    async def test_create_task_with_invalid_genre_id(self, client: ASGIClient):
         """Test creating task with non-existent genre_id."""
         # Arrange
         task_data = {
@@ -505,7 +505,7 @@ class TestTaskForeignKeys:
         assert response.status_code in [400, 422, 500]
 
     async def test_delete_project_sets_task_project_id_to_null(
-        self, client: AsyncClient, project_factory, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, project_factory, task_factory, test_session: AsyncSession
     ):
         """Test ON DELETE SET NULL when project is deleted."""
         # Arrange
@@ -523,7 +523,7 @@ class TestTaskForeignKeys:
         assert task.project_id is None
 
     async def test_delete_genre_sets_task_genre_id_to_null(
-        self, client: AsyncClient, genre_factory, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, genre_factory, task_factory, test_session: AsyncSession
     ):
         """Test ON DELETE SET NULL when genre is deleted."""
         # Arrange
@@ -544,7 +544,7 @@ class TestTaskForeignKeys:
 class TestTaskValidation:
     """Test validation rules for task fields."""
 
-    async def test_create_task_with_invalid_status(self, client: AsyncClient):
+    async def test_create_task_with_invalid_status(self, client: ASGIClient):
         """Test creating task with invalid status value.
 
         Note: Current implementation accepts any status string.
@@ -563,7 +563,7 @@ class TestTaskValidation:
         # Current implementation accepts any status (no enum validation)
         assert response.status_code in [201, 422, 500]
 
-    async def test_create_task_with_invalid_priority(self, client: AsyncClient):
+    async def test_create_task_with_invalid_priority(self, client: ASGIClient):
         """Test creating task with invalid priority value.
 
         Note: Current implementation accepts any priority string.
@@ -592,7 +592,7 @@ class TestDecompositionLevelComputed:
     """Test that decomposition_level is automatically computed by DB trigger."""
 
     async def test_root_task_has_level_zero(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Root task (no parent) should have decomposition_level = 0."""
         # Arrange & Act
@@ -606,7 +606,7 @@ class TestDecompositionLevelComputed:
         assert data["parent_task_id"] is None
 
     async def test_child_task_has_level_one(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Direct child should have decomposition_level = 1."""
         # Arrange
@@ -623,7 +623,7 @@ class TestDecompositionLevelComputed:
         assert data["parent_task_id"] == parent.id
 
     async def test_grandchild_task_has_level_two(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Grandchild should have decomposition_level = 2."""
         # Arrange
@@ -640,7 +640,7 @@ class TestDecompositionLevelComputed:
         assert data["decomposition_level"] == 2
 
     async def test_moving_task_updates_level(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Moving task to different parent updates decomposition_level."""
         # Arrange
@@ -663,7 +663,7 @@ class TestDecompositionLevelComputed:
         assert response.json()["decomposition_level"] == 1
 
     async def test_orphaning_task_resets_level(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test orphaning a task (removing parent) resets decomposition_level."""
         # Arrange
@@ -687,7 +687,7 @@ class TestDecompositionLevelComputed:
         assert data["parent_task_id"] is None
 
     async def test_deep_hierarchy(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test deep hierarchy (5 levels)."""
         # Arrange: Create 5-level hierarchy
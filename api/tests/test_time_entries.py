@@ -15,11 +15,11 @@ Endpoints tested:
 from datetime import datetime, timedelta
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import TimeEntry
 from tests.utils import (
+    ASGIClient,
     assert_pagination_structure,
     assert_status_code,
     assert_validation_error,
@@ -32,7 +32,7 @@ class TestTimeEntryCRUD:
     """Test standard CRUD operations for time entries."""
 
     async def test_create_time_entry_success(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test creating a new time entry."""
         # Arrange
@@ -53,7 +53,7 @@ class TestTimeEntryCRUD:
         assert "id" in data
 
     async def test_create_time_entry_with_end_time(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test creating completed time entry with start and end times."""
         # Arrange
@@ -75,7 +75,7 @@ class TestTimeEntryCRUD:
         assert "end_time" in data
 
     async def test_create_time_entry_with_note(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test creating time entry with optional note."""
         # Arrange
@@ -94,7 +94,7 @@ class TestTimeEntryCRUD:
         data = response.json()
         assert data["note"] == "作業メモ"
 
-    async def test_create_time_entry_missing_task_id(self, client: AsyncClient):
+    async def test_create_time_entry_missing_task_id(self, client: ASGIClient):
         """Test that creating time entry without task_id fails."""
         # Arrange
         time_entry_data = {
@@ -107,7 +107,7 @@ class TestTimeEntryCRUD:
         # Assert
         assert_validation_error(response)
 
-    async def test_list_time_entries_empty(self, client: AsyncClient):
+    async def test_list_time_entries_empty(self, client: ASGIClient):
         """Test listing time entries when database is empty."""
         # Act
         response = await client.get("/api/v1/time-entries")
@@ -116,7 +116,7 @@ class TestTimeEntryCRUD:
         assert_pagination_structure(response, expected_total=0)
 
     async def test_list_time_entries_with_data(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test listing multiple time entries."""
         # Arrange
@@ -132,7 +132,7 @@ class TestTimeEntryCRUD:
         assert_pagination_structure(response, expected_total=3)
 
     async def test_get_time_entry_by_id(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test getting a single time entry by ID."""
         # Arrange
@@ -148,7 +148,7 @@ class TestTimeEntryCRUD:
         assert data["id"] == entry.id
         assert data["task_id"] == task.id
 
-    async def test_get_time_entry_not_found(self, client: AsyncClient):
+    async def test_get_time_entry_not_found(self, client: ASGIClient):
         """Test getting non-existent time entry returns 404."""
         # Act
         response = await client.get("/api/v1/time-entries/99999")
@@ -157,7 +157,7 @@ class TestTimeEntryCRUD:
         assert_status_code(response, 404)
 
     async def test_update_time_entry_end_time(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test updating time entry to set end_time (stop timer)."""
         # Arrange
@@ -178,7 +178,7 @@ class TestTimeEntryCRUD:
         assert data["end_time"] is not None
 
     async def test_update_time_entry_note(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test updating time entry note."""
         # Arrange
@@ -197,7 +197,7 @@ class TestTimeEntryCRUD:
         assert data["note"] == "Updated note"
 
     async def test_delete_time_entry(
-        self, client: AsyncClient, task_factory, time_entry_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, time_entry_factory, test_session: AsyncSession
     ):
         """Test deleting a time entry."""
         # Arrange
@@ -220,7 +220,7 @@ class TestTimeEntryFiltering:
     """Test filtering time entries."""
 
     async def test_filter_by_task_id(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test filtering time entries by task_id."""
         # Arrange
@@ -248,7 +248,7 @@ class TestTimeEntryForeignKeys:
     """Test foreign key constraint behaviors."""
 
     async def test_create_time_entry_with_invalid_task_id(
-        self, client: AsyncClient
+        self, client: ASGIClient
     ):
         """Test creating time entry with non-existent task_id."""
         # Arrange
@@ -265,7 +265,7 @@ class TestTimeEntryForeignKeys:
         assert response.status_code in [400, 422, 500]
 
     async def test_delete_task_with_time_entries_fails(
-        self, client: AsyncClient, task_factory, time_entry_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, time_entry_factory, test_session: AsyncSession
     ):
         """Test that deleting task with time entries fails due to FK constraint.
 
@@ -291,7 +291,7 @@ class TestTimeEntryValidation:
     """Test validation rules for time entries."""
 
     async def test_create_with_end_before_start(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test creating time entry with end_time before start_time.
 
@@ -317,7 +317,7 @@ class TestTimeEntryValidation:
         assert response.status_code in [201, 422, 500]
 
     async def test_create_running_timer_without_end_time(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test creating a running timer (end_time is NULL)."""
         # Arrange
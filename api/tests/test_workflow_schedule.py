@@ -5,9 +5,8 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch
 
-from httpx import AsyncClient
-
 from app.models import Task, Schedule
+from tests.utils import ASGIClient
 
 
 class TestGenerateWeeklySchedule:
@@ -48,7 +47,7 @@ class TestGenerateWeeklySchedule:
         return [task1, task2, task3]
 
     @pytest.mark.asyncio
-    async def test_generate_schedule_no_tasks(self, client: AsyncClient):
+    async def test_generate_schedule_no_tasks(self, client: ASGIClient):
         """Test schedule generation with no schedulable tasks."""
         from unittest.mock import patch, AsyncMock
 
@@ -74,7 +73,7 @@ class TestGenerateWeeklySchedule:
 
     @pytest.mark.asyncio
     async def test_generate_schedule_no_api_key(
-        self, client: AsyncClient, sample_tasks
+        self, client: ASGIClient, sample_tasks
     ):
         """Test schedule generation fails gracefully without API key."""
         from app.clients.claude_client import ClaudeAPIException
@@ -101,7 +100,7 @@ class TestGenerateWeeklySchedule:
 
     @pytest.mark.asyncio
     async def test_generate_schedule_success(
-        self, client: AsyncClient, sample_tasks, test_session
+        self, client: ASGIClient, sample_tasks, test_session
     ):
         """Test successful schedule generation with mocked Claude API."""
         week_start = datetime.now() + timedelta(days=7)
@@ -156,7 +155,7 @@ class TestGenerateWeeklySchedule:
 
     @pytest.mark.asyncio
     async def test_generate_schedule_with_dependencies(
-        self, client: AsyncClient, task_factory, task_dependency_factory
+        self, client: ASGIClient, task_factory, task_dependency_factory
     ):
         """Test schedule generation respects task dependencies."""
         task1 = await task_factory(
@@ -206,7 +205,7 @@ class TestGenerateWeeklySchedule:
 
     @pytest.mark.asyncio
     async def test_generate_schedule_clears_existing(
-        self, client: AsyncClient, sample_tasks, schedule_factory, test_session
+        self, client: ASGIClient, sample_tasks, schedule_factory, test_session
     ):
         """Test that existing AI-generated schedules are cleared."""
         week_start = datetime.now() + timedelta(days=7)
@@ -249,7 +248,7 @@ class TestGenerateWeeklySchedule:
 
     @pytest.mark.asyncio
     async def test_generate_schedule_with_fixed_events(
-        self, client: AsyncClient, sample_tasks
+        self, client: ASGIClient, sample_tasks
     ):
         """Test schedule generation with fixed events."""
         week_start = datetime.now() + timedelta(days=7)
@@ -290,7 +289,7 @@ class TestGenerateWeeklySchedule:
 
     @pytest.mark.asyncio
     async def test_generate_schedule_invalid_json_response(
-        self, client: AsyncClient, sample_tasks
+        self, client: ASGIClient, sample_tasks
     ):
         """Test handling of invalid JSON response from Claude."""
         week_start = datetime.now() + timedelta(days=7)
@@ -16,18 +16,18 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 
 import pytest
-from httpx import AsyncClient
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Task, TimeEntry, Schedule, TaskDependency
-from tests.utils import assert_status_code
+from app.services.task_workflow_service import COPY_THRESHOLD
+from tests.utils import ASGIClient, assert_status_code
 
 
 class TestTaskBreakdown:
     """Test POST /api/v1/workflow/tasks/breakdown"""
 
-    async def test_breakdown_basic(self, client: AsyncClient, task_factory):
+    async def test_breakdown_basic(self, client: ASGIClient, task_factory):
         """Test basic task breakdown."""
         # Arrange
         task = await task_factory(name="親タスク")
@@ -53,7 +53,7 @@ class TestTaskBreakdown:
         assert data["created_tasks"][1]["name"] == "サブタスク2"
 
     async def test_breakdown_creates_subtasks_with_parent_id(
-        self, client: AsyncClient, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, test_session: AsyncSession
     ):
         """Test that subtasks have parent_task_id set."""
         # Arrange
@@ -81,7 +81,7 @@ class TestTaskBreakdown:
         assert subtask.parent_task_id == task.id
 
     async def test_breakdown_archives_original_when_flag_true(
-        self, client: AsyncClient, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, test_session: AsyncSession
     ):
         """Test that original task is archived when archive_original=true."""
         # Arrange
@@ -102,8 +102,14 @@ class TestTaskBreakdown:
         data = response.json()
         assert data["original_task"]["status"] == "archive"
 
+        # Response matches the stored state
+        result = await test_session.execute(
+            select(Task.status).where(Task.id == task.id)
+        )
+        assert result.scalar_one() == "archive"
+
     async def test_breakdown_keeps_original_when_flag_false(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test that original task is kept when archive_original=false."""
         # Arrange
@@ -125,7 +131,7 @@ class TestTaskBreakdown:
         assert data["original_task"]["status"] == "todo"
 
     async def test_breakdown_inherits_project_id(
-        self, client: AsyncClient, project_factory, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, project_factory, task_factory, test_session: AsyncSession
     ):
         """Test that subtasks inherit project_id from parent."""
         # Arrange
@@ -153,7 +159,7 @@ class TestTaskBreakdown:
         assert subtask.project_id == project.id
 
     async def test_breakdown_inherits_genre_id(
-        self, client: AsyncClient, genre_factory, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, genre_factory, task_factory, test_session: AsyncSession
     ):
         """Test that subtasks inherit genre_id from parent when not specified."""
         # Arrange
@@ -181,7 +187,7 @@ class TestTaskBreakdown:
         assert subtask.genre_id == genre.id
 
     async def test_breakdown_with_depends_on_indices(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test breakdown with inter-subtask dependencies."""
         # Arrange
@@ -206,7 +212,7 @@ class TestTaskBreakdown:
         assert data["dependencies_transferred"] >= 1
 
     async def test_breakdown_allocates_time_entries_proportionally(
-        self, client: AsyncClient, task_factory, time_entry_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, time_entry_factory, test_session: AsyncSession
     ):
         """Test that TimeEntries are allocated proportionally."""
         # Arrange
@@ -238,7 +244,7 @@ class TestTaskBreakdown:
         assert data["allocation_summary"]["total_time_minutes_allocated"] == 60
 
     async def test_breakdown_allocates_schedules_proportionally(
-        self, client: AsyncClient, task_factory, schedule_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, schedule_factory, test_session: AsyncSession
     ):
         """Test that Schedules are allocated proportionally."""
         # Arrange
@@ -269,7 +275,7 @@ class TestTaskBreakdown:
         assert float(data["allocation_summary"]["total_schedule_hours_allocated"]) == 2.0
 
     async def test_breakdown_with_manual_allocated_hours(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test breakdown with manual allocated_hours override."""
         # Arrange
@@ -299,7 +305,7 @@ class TestTaskBreakdown:
         assert data["allocation_summary"]["time_entries_allocated"] == 2
 
     async def test_breakdown_allocation_summary_in_response(
-        self, client: AsyncClient, task_factory, time_entry_factory, schedule_factory
+        self, client: ASGIClient, task_factory, time_entry_factory, schedule_factory
     ):
         """Test that allocation_summary is included in response."""
         # Arrange
@@ -334,7 +340,7 @@ class TestTaskBreakdown:
         assert "total_time_minutes_allocated" in summary
         assert "total_schedule_hours_allocated" in summary
 
-    async def test_breakdown_task_not_found(self, client: AsyncClient):
+    async def test_breakdown_task_not_found(self, client: ASGIClient):
         """Test breakdown with non-existent task."""
         # Act
         response = await client.post(
@@ -349,7 +355,7 @@ class TestTaskBreakdown:
         assert_status_code(response, 404)
 
     async def test_breakdown_archived_task_fails(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test that archived task cannot be broken down."""
         # Arrange
@@ -369,7 +375,7 @@ class TestTaskBreakdown:
         assert "archived" in response.json()["detail"].lower()
 
     async def test_breakdown_task_with_children_fails(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test that task with existing children cannot be broken down."""
         # Arrange
@@ -390,7 +396,7 @@ class TestTaskBreakdown:
         assert "child" in response.json()["detail"].lower()
 
     async def test_breakdown_empty_subtasks_fails(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test that breakdown with empty subtasks fails."""
         # Arrange
@@ -409,7 +415,7 @@ class TestTaskBreakdown:
         assert_status_code(response, 422)
 
     async def test_breakdown_invalid_depends_on_index(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test that invalid depends_on_indices is rejected."""
         # Arrange
@@ -435,7 +441,7 @@ class TestTaskBreakdown:
 class TestTaskMerge:
     """Test POST /api/v1/workflow/tasks/merge"""
 
-    async def test_merge_basic(self, client: AsyncClient, task_factory):
+    async def test_merge_basic(self, client: ASGIClient, task_factory):
         """Test basic task merge."""
         # Arrange
         task1 = await task_factory(name="タスク1")
@@ -459,7 +465,7 @@ class TestTaskMerge:
         assert task2.id in data["archived_tasks"]
 
     async def test_merge_archives_source_tasks(
-        self, client: AsyncClient, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, test_session: AsyncSession
     ):
         """Test that source tasks are archived after merge."""
         # Arrange
@@ -487,7 +493,7 @@ class TestTaskMerge:
         assert task2.status == "archive"
 
     async def test_merge_transfers_time_entries(
-        self, client: AsyncClient, task_factory, time_entry_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, time_entry_factory, test_session: AsyncSession
     ):
         """Test that TimeEntries are transferred to merged task."""
         # Arrange
@@ -511,7 +517,7 @@ class TestTaskMerge:
         assert data["time_entries_transferred"] == 2
 
     async def test_merge_transfers_schedules(
-        self, client: AsyncClient, task_factory, schedule_factory, test_session: AsyncSession
+        self, client: ASGIClient, task_factory, schedule_factory, test_session: AsyncSession
     ):
         """Test that Schedules are transferred to merged task."""
         # Arrange
@@ -541,7 +547,7 @@ class TestTaskMerge:
         schedules = result.scalars().all()
         assert len(schedules) == 2
 
-    async def test_merge_single_task_fails(self, client: AsyncClient, task_factory):
+    async def test_merge_single_task_fails(self, client: ASGIClient, task_factory):
         """Test that merging single task fails."""
         # Arrange
         task = await task_factory(name="タスク")
@@ -559,7 +565,28 @@ class TestTaskMerge:
         assert_status_code(response, 422)
         assert "at least 2" in response.json()["detail"].lower()
 
-    async def test_merge_task_not_found(self, client: AsyncClient, task_factory):
+    async def test_merge_duplicate_task_ids_fails(
+        self, client: ASGIClient, task_factory
+    ):
+        """Test that merging with duplicate task IDs fails."""
+        # Arrange
+        task1 = await task_factory(name="タスク1")
+        task2 = await task_factory(name="タスク2")
+
+        # Act
+        response = await client.post(
+            "/api/v1/workflow/tasks/merge",
+            json={
+                "task_ids": [task1.id, task2.id, task1.id],
+                "merged_task": {"name": "統合タスク"},
+            },
+        )
+
+        # Assert
+        assert_status_code(response, 422)
+        assert "duplicate" in response.json()["detail"].lower()
+
+    async def test_merge_task_not_found(self, client: ASGIClient, task_factory):
         """Test merge with non-existent task."""
         # Arrange
         task = await task_factory(name="タスク")
@@ -577,7 +604,7 @@ class TestTaskMerge:
         assert_status_code(response, 404)
 
     async def test_merge_different_projects_fails(
-        self, client: AsyncClient, project_factory, task_factory
+        self, client: ASGIClient, project_factory, task_factory
     ):
         """Test that merging tasks from different projects fails."""
         # Arrange
@@ -600,7 +627,7 @@ class TestTaskMerge:
         assert "same project" in response.json()["detail"].lower()
 
     async def test_merge_inherits_project_from_sources(
-        self, client: AsyncClient, project_factory, task_factory, test_session: AsyncSession
+        self, client: ASGIClient, project_factory, task_factory, test_session: AsyncSession
     ):
         """Test that merged task inherits project from source tasks."""
         # Arrange
@@ -632,7 +659,7 @@ class TestTaskMerge:
 class TestBulkCreate:
     """Test POST /api/v1/workflow/tasks/bulk-create"""
 
-    async def test_bulk_create_basic(self, client: AsyncClient):
+    async def test_bulk_create_basic(self, client: ASGIClient):
         """Test basic bulk task creation."""
         # Act
         response = await client.post(
@@ -654,8 +681,50 @@ class TestBulkCreate:
         assert data["created_tasks"][1]["name"] == "タスク2"
         assert data["created_tasks"][2]["name"] == "タスク3"
 
+    async def test_bulk_create_large_payload_uses_copy(
+        self, client: ASGIClient, test_session: AsyncSession
+    ):
+        """Test bulk create above COPY_THRESHOLD (COPY path) with a dependency chain."""
+        # Arrange
+        count = COPY_THRESHOLD + 5
+        tasks = [{"name": "タスク0"}] + [
+            {"name": f"タスク{i}", "depends_on_indices": [i - 1]}
+            for i in range(1, count)
+        ]
+
+        # Act
+        response = await client.post(
+            "/api/v1/workflow/tasks/bulk-create",
+            json={"tasks": tasks},
+        )
+
+        # Assert
+        assert_status_code(response, 201)
+        data = response.json()
+        assert len(data["created_tasks"]) == count
+        assert data["dependencies_created"] == count - 1
+        assert [t["name"] for t in data["created_tasks"]] == [
+            t["name"] for t in tasks
+        ]
+
+        # Verify rows (including model defaults) and dependency wiring
+        created_ids = [t["id"] for t in data["created_tasks"]]
+        result = await test_session.execute(
+            select(Task).where(Task.id.in_(created_ids))
+        )
+        by_id = {task.id: task for task in result.scalars().all()}
+        assert len(by_id) == count
+        assert by_id[created_ids[1]].name == "タスク1"
+        assert by_id[created_ids[1]].recurrence == "なし"
+
+        result = await test_session.execute(
+            select(TaskDependency).where(TaskDependency.task_id == created_ids[1])
+        )
+        dependency = result.scalar_one()
+        assert dependency.depends_on_task_id == created_ids[0]
+
     async def test_bulk_create_with_project_id(
-        self, client: AsyncClient, project_factory, test_session: AsyncSession
+        self, client: ASGIClient, project_factory, test_session: AsyncSession
     ):
         """Test bulk create with project_id."""
         # Arrange
@@ -685,7 +754,7 @@ class TestBulkCreate:
             task = result.scalar_one()
             assert task.project_id == project.id
 
-    async def test_bulk_create_with_dependencies(self, client: AsyncClient):
+    async def test_bulk_create_with_dependencies(self, client: ASGIClient):
         """Test bulk create with inter-task dependencies."""
         # Act - Task2 depends on Task1
         response = await client.post(
@@ -704,7 +773,7 @@ class TestBulkCreate:
         assert data["dependencies_created"] == 1
 
     async def test_bulk_create_chain_dependencies(
-        self, client: AsyncClient, test_session: AsyncSession
+        self, client: ASGIClient, test_session: AsyncSession
     ):
         """Test bulk create with chain dependencies (A -> B -> C)."""
         # Act
@@ -747,7 +816,7 @@ class TestBulkCreate:
         )
         assert result.scalar_one_or_none() is not None
 
-    async def test_bulk_create_empty_tasks_fails(self, client: AsyncClient):
+    async def test_bulk_create_empty_tasks_fails(self, client: ASGIClient):
         """Test that bulk create with empty tasks fails."""
         # Act
         response = await client.post(
@@ -758,7 +827,7 @@ class TestBulkCreate:
         # Assert
         assert_status_code(response, 422)
 
-    async def test_bulk_create_self_dependency_fails(self, client: AsyncClient):
+    async def test_bulk_create_self_dependency_fails(self, client: ASGIClient):
         """Test that self-dependency is rejected."""
         # Act - Task depends on itself
         response = await client.post(
@@ -774,7 +843,7 @@ class TestBulkCreate:
         assert_status_code(response, 422)
         assert "itself" in response.json()["detail"].lower()
 
-    async def test_bulk_create_cycle_fails(self, client: AsyncClient):
+    async def test_bulk_create_cycle_fails(self, client: ASGIClient):
         """Test that cycle in dependencies is rejected."""
         # Act - A -> B -> A (cycle)
         response = await client.post(
@@ -791,7 +860,7 @@ class TestBulkCreate:
         assert_status_code(response, 422)
         assert "cycle" in response.json()["detail"].lower()
 
-    async def test_bulk_create_invalid_index_fails(self, client: AsyncClient):
+    async def test_bulk_create_invalid_index_fails(self, client: ASGIClient):
         """Test that invalid index is rejected."""
         # Act - Index 5 is out of range
         response = await client.post(
@@ -809,7 +878,7 @@ class TestBulkCreate:
         assert "out of range" in response.json()["detail"].lower()
 
     async def test_bulk_create_with_all_fields(
-        self, client: AsyncClient, genre_factory, test_session: AsyncSession
+        self, client: ASGIClient, genre_factory, test_session: AsyncSession
     ):
         """Test bulk create with all optional fields."""
         # Arrange
@@ -848,7 +917,7 @@ class TestWorkflowIntegration:
     """Test workflow integration scenarios."""
 
     async def test_breakdown_then_merge(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test breaking down a task then merging subtasks back."""
         # Arrange - Create and breakdown
@@ -884,7 +953,7 @@ class TestWorkflowIntegration:
         assert len(data["archived_tasks"]) == 2
 
     async def test_bulk_create_then_breakdown(
-        self, client: AsyncClient
+        self, client: ASGIClient
     ):
         """Test bulk creating tasks then breaking one down."""
         # Arrange - Bulk create
@@ -17,16 +17,18 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 
 import pytest
-from httpx import AsyncClient
+from sqlalchemy.exc import IntegrityError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from tests.utils import assert_status_code
+from app.services.timer_service import TimerService
+
+from tests.utils import ASGIClient, assert_status_code
 
 
 class TestTimerStart:
     """Test POST /api/v1/workflow/timer/start"""
 
-    async def test_start_timer_with_task_id(self, client: AsyncClient, task_factory):
+    async def test_start_timer_with_task_id(self, client: ASGIClient, task_factory):
         """Test starting timer with task_id."""
         # Arrange
         task = await task_factory(name="テストタスク")
@@ -46,7 +48,7 @@ class TestTimerStart:
         assert "start_time" in data
         assert data["previous_entry"] is None
 
-    async def test_start_timer_with_task_name(self, client: AsyncClient, task_factory):
+    async def test_start_timer_with_task_name(self, client: ASGIClient, task_factory):
         """Test starting timer with task_name."""
         # Arrange
         task = await task_factory(name="特定のタスク")
@@ -64,7 +66,7 @@ class TestTimerStart:
         assert data["task_name"] == "特定のタスク"
 
     async def test_start_timer_with_partial_task_name(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test starting timer with partial task name match."""
         # Arrange
@@ -82,7 +84,7 @@ class TestTimerStart:
         assert data["task_id"] == task.id
 
     async def test_start_timer_auto_stops_previous(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test that starting new timer auto-stops the previous one."""
         # Arrange
@@ -111,7 +113,7 @@ class TestTimerStart:
         assert "stopped_at" in data["previous_entry"]
 
     async def test_start_timer_returns_project_name(
-        self, client: AsyncClient, project_factory, task_factory
+        self, client: ASGIClient, project_factory, task_factory
     ):
         """Test that response includes project_name when task has project."""
         # Arrange
@@ -129,7 +131,7 @@ class TestTimerStart:
         data = response.json()
         assert data["project_name"] == "研究プロジェクト"
 
-    async def test_start_timer_no_project(self, client: AsyncClient, task_factory):
+    async def test_start_timer_no_project(self, client: ASGIClient, task_factory):
         """Test that project_name is null when task has no project."""
         # Arrange
         task = await task_factory(name="独立タスク")
@@ -145,7 +147,7 @@ class TestTimerStart:
         data = response.json()
         assert data["project_name"] is None
 
-    async def test_start_timer_task_not_found_by_id(self, client: AsyncClient):
+    async def test_start_timer_task_not_found_by_id(self, client: ASGIClient):
         """Test starting timer with non-existent task_id."""
         # Act
         response = await client.post(
@@ -156,7 +158,7 @@ class TestTimerStart:
         # Assert
         assert_status_code(response, 404)
 
-    async def test_start_timer_task_not_found_by_name(self, client: AsyncClient):
+    async def test_start_timer_task_not_found_by_name(self, client: ASGIClient):
         """Test starting timer with non-existent task name."""
         # Act
         response = await client.post(
@@ -167,7 +169,7 @@ class TestTimerStart:
         # Assert
         assert_status_code(response, 404)
 
-    async def test_start_timer_missing_both_id_and_name(self, client: AsyncClient):
+    async def test_start_timer_missing_both_id_and_name(self, client: ASGIClient):
         """Test starting timer without task_id or task_name."""
         # Act
         response = await client.post(
@@ -179,10 +181,37 @@ class TestTimerStart:
         assert_status_code(response, 422)
 
 
+class TestTimerStartConflict:
+    """Test which insert failures start_timer retries."""
+
+    async def test_second_running_timer_is_retryable_conflict(
+        self, running_timer_factory, time_entry_factory
+    ):
+        """A second running entry violates idx_time_entries_running and is retried."""
+        # Arrange
+        task, _ = await running_timer_factory(name="実行中タスク")
+
+        # Act
+        with pytest.raises(IntegrityError) as exc_info:
+            await time_entry_factory(task_id=task.id, end_time=None)
+
+        # Assert
+        assert TimerService._is_running_timer_conflict(exc_info.value) is True
+
+    async def test_foreign_key_violation_is_not_retried(self, time_entry_factory):
+        """Other integrity errors (here a missing task) are not treated as conflicts."""
+        # Act
+        with pytest.raises(IntegrityError) as exc_info:
+            await time_entry_factory(task_id=999999, end_time=None)
+
+        # Assert
+        assert TimerService._is_running_timer_conflict(exc_info.value) is False
+
+
 class TestTimerStop:
     """Test POST /api/v1/workflow/timer/stop"""
 
-    async def test_stop_timer_success(self, client: AsyncClient, task_factory):
+    async def test_stop_timer_success(self, client: ASGIClient, task_factory):
         """Test successfully stopping a timer."""
         # Arrange
         task = await task_factory(name="タスク")
@@ -207,7 +236,7 @@ class TestTimerStop:
         assert "end_time" in data
         assert "duration_minutes" in data
 
-    async def test_stop_timer_with_note(self, client: AsyncClient, task_factory):
+    async def test_stop_timer_with_note(self, client: ASGIClient, task_factory):
         """Test stopping timer with a note."""
         # Arrange
         task = await task_factory(name="タスク")
@@ -226,7 +255,7 @@ class TestTimerStop:
         assert_status_code(response, 200)
 
     async def test_stop_timer_calculates_duration(
-        self, client: AsyncClient, running_timer_factory
+        self, client: ASGIClient, running_timer_factory
     ):
         """Test that duration_minutes is calculated correctly."""
         # Arrange - Use running_timer_factory which creates timer 30 mins ago
@@ -246,7 +275,7 @@ class TestTimerStop:
         assert data["duration_minutes"] <= 31
 
     async def test_stop_timer_returns_actual_hours_total(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test that task_actual_hours_total is calculated correctly."""
         # Arrange - Create task with existing time entry
@@ -276,7 +305,7 @@ class TestTimerStop:
         # Should include 60 minutes from previous entry + current timer
         assert float(data["task_actual_hours_total"]) >= 1.0
 
-    async def test_stop_timer_no_running_timer(self, client: AsyncClient):
+    async def test_stop_timer_no_running_timer(self, client: ASGIClient):
         """Test stopping when no timer is running."""
         # Act
         response = await client.post(
@@ -293,7 +322,7 @@ class TestTimerStatus:
     """Test GET /api/v1/workflow/timer/status"""
 
     async def test_status_when_running(
-        self, client: AsyncClient, running_timer_factory
+        self, client: ASGIClient, running_timer_factory
     ):
         """Test timer status when a timer is running."""
         # Arrange
@@ -312,7 +341,7 @@ class TestTimerStatus:
         assert "elapsed_minutes" in data["current_entry"]
         assert data["last_entry"] is None
 
-    async def test_status_when_not_running(self, client: AsyncClient):
+    async def test_status_when_not_running(self, client: ASGIClient):
         """Test timer status when no timer is running."""
         # Act
         response = await client.get("/api/v1/workflow/timer/status")
@@ -324,7 +353,7 @@ class TestTimerStatus:
         assert data["current_entry"] is None
 
     async def test_status_shows_last_entry(
-        self, client: AsyncClient, task_factory, time_entry_factory
+        self, client: ASGIClient, task_factory, time_entry_factory
     ):
         """Test that status shows last completed entry."""
         # Arrange
@@ -348,7 +377,7 @@ class TestTimerStatus:
         assert data["last_entry"]["duration_minutes"] == 30
 
     async def test_status_elapsed_minutes_calculation(
-        self, client: AsyncClient, running_timer_factory
+        self, client: ASGIClient, running_timer_factory
     ):
         """Test that elapsed_minutes is calculated correctly."""
         # Arrange - Timer started 30 mins ago
@@ -366,7 +395,7 @@ class TestTimerStatus:
         assert data["current_entry"]["elapsed_minutes"] <= 31
 
     async def test_status_includes_project_name(
-        self, client: AsyncClient, project_factory, task_factory
+        self, client: ASGIClient, project_factory, task_factory
     ):
         """Test that status includes project_name when running."""
         # Arrange
@@ -392,7 +421,7 @@ class TestTimerWorkflow:
     """Test complete timer workflows."""
 
     async def test_full_timer_workflow(
-        self, client: AsyncClient, project_factory, task_factory
+        self, client: ASGIClient, project_factory, task_factory
     ):
         """Test complete workflow: start -> check status -> stop."""
         # Arrange
@@ -430,7 +459,7 @@ class TestTimerWorkflow:
         assert final_status_data["is_running"] is False
 
     async def test_multiple_timer_switches(
-        self, client: AsyncClient, task_factory
+        self, client: ASGIClient, task_factory
     ):
         """Test switching between multiple tasks."""
         # Arrange
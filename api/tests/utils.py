@@ -3,14 +3,19 @@ Test utility functions and assertions.
 
 This module provides helper functions for common testing patterns:
 - Response assertions (status codes, error messages, pagination)
+- Direct in-process ASGI requests and test client (no httpx)
 - Database query helpers (counting, existence checks)
 - Data comparison utilities
 """
 
-from typing import Any, Optional, Type
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Type
+from urllib.parse import quote, unquote, urlencode
 
 from httpx import Response
-from sqlalchemy import func, select
+from sqlalchemy import event, func, select
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -20,7 +25,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 # =============================================================================
 
 
-def assert_status_code(response: Response, expected: int):
+def assert_status_code(response: "Response | ASGIResponse", expected: int):
     """
     Assert that the response has the expected status code.
 
@@ -37,7 +42,7 @@ def assert_status_code(response: Response, expected: int):
     )
 
 
-def assert_error_code(response: Response, code: str):
+def assert_error_code(response: "Response | ASGIResponse", code: str):
     """
     Assert that the response contains a specific error code.
 
@@ -56,7 +61,7 @@ def assert_error_code(response: Response, code: str):
 
 
 def assert_pagination_structure(
-    response: Response, expected_total: Optional[int] = None
+    response: "Response | ASGIResponse", expected_total: Optional[int] = None
 ):
     """
     Assert that the response has proper pagination structure.
@@ -90,7 +95,7 @@ def assert_pagination_structure(
         )
 
 
-def assert_validation_error(response: Response):
+def assert_validation_error(response: "Response | ASGIResponse"):
     """
     Assert that the response is a 422 validation error.
 
@@ -110,6 +115,201 @@ def assert_validation_error(response: Response):
     )
 
 
+def assert_keys_in_bytes(response: "Response | ASGIResponse", keys: Iterable[str]):
+    """
+    Assert that each key appears as a JSON object key in the raw response body.
+
+    Skips JSON parsing for pure structure checks. The match is on the quoted
+    key followed by a colon anywhere in the body, so nesting is not checked.
+    Responses are serialized compactly (no space before the colon).
+
+    Args:
+        response: The HTTP response
+        keys: Key names expected in the body
+
+    Raises:
+        AssertionError: If a key is missing
+    """
+    body = response.content
+    for key in keys:
+        assert b'"' + key.encode() + b'":' in body, (
+            f"Response missing key {key!r}. Response body: {response.text}"
+        )
+
+
+# =============================================================================
+# Direct ASGI requests
+# =============================================================================
+
+
+@dataclass
+class ASGIResponse:
+    """Minimal response returned by asgi_request (status, headers and body)."""
+
+    status_code: int
+    headers: list[tuple[bytes, bytes]] = field(default_factory=list)
+    content: bytes = b""
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+def _query_value(value: Any) -> Any:
+    """Format a query parameter value like httpx (booleans as true/false, None as empty)."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if value is None:
+        return ""
+    return value
+
+
+def _encode_query(query: str, params: Optional[dict]) -> bytes:
+    """
+    Build the ASGI query_string from the path's query and params.
+
+    The query from the path is percent-encoded (existing %XX escapes are
+    kept), so non-ASCII values arrive intact: servers decode query_string
+    as latin-1. List values are sent as repeated keys (ids=1&ids=2).
+    """
+    query = quote(query, safe="=&%+,:/")
+    if params:
+        encoded = urlencode(
+            {
+                key: [_query_value(item) for item in value]
+                if isinstance(value, (list, tuple))
+                else _query_value(value)
+                for key, value in params.items()
+            },
+            doseq=True,
+        )
+        query = f"{query}&{encoded}" if query else encoded
+    return query.encode("ascii")
+
+
+async def asgi_request(
+    app,
+    method: str,
+    path: str,
+    params: Optional[dict] = None,
+    json_body: Any = None,
+) -> ASGIResponse:
+    """
+    Send a request straight to an ASGI app, without an HTTP client.
+
+    Builds a minimal HTTP scope and collects the response messages; there
+    is no cookie handling, redirect following or response decoding.
+    Dependency overrides installed on the app apply as usual, and
+    exceptions raised by the app propagate (as with httpx.ASGITransport).
+
+    Args:
+        app: ASGI application
+        method: HTTP method
+        path: Request path, optionally with a query string
+        params: Optional query parameters (appended to the path's query)
+        json_body: Optional JSON-serializable request body
+
+    Returns:
+        ASGIResponse exposing status_code, headers, content, text and json()
+    """
+    path, _, query = path.partition("?")
+    headers = [(b"host", b"test")]
+    body = b""
+    if json_body is not None:
+        body = json.dumps(json_body).encode()
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": unquote(path),
+        "raw_path": quote(path, safe="/%").encode("ascii"),
+        "root_path": "",
+        "query_string": _encode_query(query, params),
+        "headers": headers,
+        "client": ("testclient", 50000),
+        "server": ("test", 80),
+    }
+    request_sent = False
+
+    async def receive() -> dict:
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    response = ASGIResponse(status_code=0)
+    chunks: list[bytes] = []
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            response.status_code = message["status"]
+            response.headers = list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    response.content = b"".join(chunks)
+    return response
+
+
+class ASGIClient:
+    """
+    Test client calling an ASGI app in-process through asgi_request.
+
+    Exposes the subset of httpx.AsyncClient used by the tests
+    (get/post/put/patch/delete with params= and json=) without httpx's
+    request/response model and transport layers.
+
+    Usage:
+        client = ASGIClient(app)
+        response = await client.post("/api/v1/genres", json={"name": "A"})
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json: Any = None,
+    ) -> ASGIResponse:
+        return await asgi_request(self.app, method, path, params, json)
+
+    async def get(self, path: str, params: Optional[dict] = None) -> ASGIResponse:
+        return await self.request("GET", path, params)
+
+    async def delete(self, path: str, params: Optional[dict] = None) -> ASGIResponse:
+        return await self.request("DELETE", path, params)
+
+    async def post(
+        self, path: str, json: Any = None, params: Optional[dict] = None
+    ) -> ASGIResponse:
+        return await self.request("POST", path, params, json)
+
+    async def put(
+        self, path: str, json: Any = None, params: Optional[dict] = None
+    ) -> ASGIResponse:
+        return await self.request("PUT", path, params, json)
+
+    async def patch(
+        self, path: str, json: Any = None, params: Optional[dict] = None
+    ) -> ASGIResponse:
+        return await self.request("PATCH", path, params, json)
+
+
 # =============================================================================
 # Database query helpers
 # =============================================================================
@@ -192,6 +392,40 @@ async def get_records_by_field(
     return list(result.scalars().all())
 
 
+@contextmanager
+def assert_query_count_le(session: AsyncSession, n: int):
+    """
+    Assert that at most n SQL statements are executed inside the block.
+
+    Counts cursor executions on the session's engine, so N+1 patterns
+    (one query per row) fail as soon as the fixture holds more rows than
+    the handler's fixed number of queries.
+
+    Args:
+        session: Database session (the one the app under test uses)
+        n: Maximum number of statements allowed
+
+    Raises:
+        AssertionError: If more than n statements were executed
+    """
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(statements) <= n, (
+        f"Expected at most {n} queries, got {len(statements)}:\n"
+        + "\n".join(statements)
+    )
+
+
 # =============================================================================
 # Data comparison utilities
 # =============================================================================